@@ -0,0 +1,111 @@
+"""Benchmark link discovery and text extraction over saved HTML pages."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Callable, List, Sequence, Tuple
+
+from bs4 import BeautifulSoup
+
+from taxonomy.web_mining.content import ContentProcessor, extract_links
+from taxonomy.web_mining.utils import canonicalize_url
+
+
+def _parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare legacy two-parse link discovery with the single-pass extractor.",
+    )
+    parser.add_argument("corpus_dir", type=Path, help="Directory of saved *.html pages")
+    parser.add_argument(
+        "--base-url",
+        default="https://example.edu/",
+        help="Base URL used to resolve relative links.",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions per strategy.")
+    return parser.parse_args(argv)
+
+
+def _legacy_links(html: str, base_url: str) -> List[str]:
+    seen: set[str] = set()
+    links: List[str] = []
+    soup = BeautifulSoup(html, "html.parser")
+    for anchor in soup.find_all("a", href=True):
+        href = str(anchor["href"]).strip()
+        if not href:
+            continue
+        try:
+            normalized = canonicalize_url(href, base=base_url)
+        except Exception:
+            continue
+        if normalized not in seen:
+            seen.add(normalized)
+            links.append(normalized)
+    return links
+
+
+def _time(operation: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        operation()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _load_corpus(corpus_dir: Path) -> List[Tuple[str, str]]:
+    pages: List[Tuple[str, str]] = []
+    for path in sorted(corpus_dir.rglob("*.htm*")):
+        pages.append((path.name, path.read_text(encoding="utf-8", errors="ignore")))
+    return pages
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _parse_args(argv)
+    pages = _load_corpus(args.corpus_dir)
+    if not pages:
+        raise SystemExit(f"No HTML files found under {args.corpus_dir}")
+
+    processor = ContentProcessor(min_text_length=0)
+    base_url = args.base_url
+
+    def legacy() -> None:
+        for _, html in pages:
+            processor._extract_text_from_html(html, base_url=base_url)
+            _legacy_links(html, base_url)
+
+    def single_pass() -> None:
+        for _, html in pages:
+            processor._extract_text_from_html(html, base_url=base_url)
+
+    def links_only_legacy() -> None:
+        for _, html in pages:
+            _legacy_links(html, base_url)
+
+    def links_only_tokenizer() -> None:
+        for _, html in pages:
+            extract_links(html, base_url)
+
+    mismatches = [
+        name
+        for name, html in pages
+        if _legacy_links(html, base_url) != processor._extract_text_from_html(html, base_url=base_url)[4]
+    ]
+
+    report = {
+        "pages": len(pages),
+        "bytes": sum(len(html) for _, html in pages),
+        "legacy_text_plus_links_seconds": round(_time(legacy, args.repeat), 4),
+        "single_pass_seconds": round(_time(single_pass, args.repeat), 4),
+        "legacy_links_only_seconds": round(_time(links_only_legacy, args.repeat), 4),
+        "tokenizer_links_only_seconds": round(_time(links_only_tokenizer, args.repeat), 4),
+        "link_mismatches": mismatches,
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - manual entry point
+    raise SystemExit(main())
@@ -9,7 +9,7 @@ import typer
 from rich.table import Table
 
 from taxonomy.prompt_optimization.one_time_optimizer import OneTimeGEPAOptimizer
-from taxonomy.web_mining import CrawlConfig, build_web_miner
+from taxonomy.web_mining import BatchCrawler, CrawlConfig, build_web_miner, load_crawl_manifest
 
 from .common import CLIError, console, get_state, resolve_path, run_subcommand
 
@@ -99,6 +99,76 @@ def _mine_resources_command(
     console.print(table)
 
 
+def _mine_batch_command(
+    ctx: typer.Context,
+    *,
+    manifest: Path = typer.Option(
+        ..., "--manifest", "-m", help="YAML/JSON manifest listing institution crawl configs."
+    ),
+    output_dir: Optional[Path] = typer.Option(
+        None,
+        "--output-dir",
+        help="Directory for snapshots, frontiers, and summaries (defaults to <output>/web_mining).",
+    ),
+    max_workers: int = typer.Option(2, "--max-workers", min=1, help="Institutions crawled concurrently."),
+    max_total_pages: Optional[int] = typer.Option(
+        None, "--max-total-pages", min=1, help="Global page budget shared by all institutions."
+    ),
+    max_total_mb: Optional[int] = typer.Option(
+        None, "--max-total-mb", min=1, help="Global download budget in megabytes."
+    ),
+    checkpoint_interval: int = typer.Option(
+        25, "--checkpoint-interval", min=1, help="Pages between frontier checkpoints."
+    ),
+    resume: bool = typer.Option(
+        True, "--resume/--restart", help="Resume from saved frontiers or start every institution fresh."
+    ),
+) -> None:
+    state = get_state(ctx)
+    state.settings.paths.ensure_exists()
+    manifest_path = resolve_path(manifest)
+    try:
+        configs = load_crawl_manifest(manifest_path)
+    except ValueError as exc:
+        raise CLIError(f"Invalid crawl manifest: {exc}") from exc
+    if not configs:
+        raise CLIError("Crawl manifest does not list any institutions")
+
+    policies = state.settings.policies
+    cache_root = Path(state.settings.paths.cache_dir)
+    paths_root = cache_root.parent if cache_root.parent else cache_root
+    miner = build_web_miner(policies, paths_root)
+    target_dir = resolve_path(output_dir, must_exist=False) if output_dir else Path(state.settings.paths.output_dir) / "web_mining"
+
+    crawler = BatchCrawler(
+        miner,
+        target_dir,
+        max_workers=max_workers,
+        max_total_pages=max_total_pages,
+        max_total_bytes=max_total_mb * 1024 * 1024 if max_total_mb else None,
+        checkpoint_interval=checkpoint_interval,
+    )
+    with console.status(f"Mining resources for {len(configs)} institutions..."):
+        report = crawler.run(configs, resume=resume)
+
+    table = Table(title="Batch Crawl Result", box=None)
+    table.add_column("Institution")
+    table.add_column("Status")
+    table.add_column("Snapshots", justify="right")
+    table.add_column("Errors", justify="right")
+    for summary in report["institutions"]:
+        status = summary.get("status", "?")
+        if summary.get("skipped"):
+            status = f"{status} (skipped)"
+        table.add_row(
+            str(summary.get("institution_id")),
+            status,
+            str(summary.get("snapshots", 0)),
+            str(summary.get("errors", 0)),
+        )
+    console.print(table)
+
+
 def _optimize_prompt_command(
     ctx: typer.Context,
     *,
@@ -163,6 +233,7 @@ def _optimize_prompt_command(
 
 
 app.command("mine-resources")(_mine_resources_command)
+app.command("mine-batch")(_mine_batch_command)
 app.command("optimize-prompt")(_optimize_prompt_command)
 
 
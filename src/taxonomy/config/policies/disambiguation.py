@@ -45,6 +45,11 @@ class DisambiguationPolicy(BaseModel):
         default=True,
         description="Enable LLM-backed separability checks before performing splits.",
     )
+    llm_max_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum number of LLM separability checks issued concurrently.",
+    )
     max_contexts_for_prompt: int = Field(
         default=10,
         ge=1,
@@ -31,6 +31,10 @@ class HierarchyAssemblyPolicy(BaseModel):
     )
     include_graph_stats: bool = Field(default=True)
     include_invariant_proofs: bool = Field(default=True)
+    include_ancestry_index: bool = Field(
+        default=True,
+        description="Persist the ancestor/descendant interval index in the hierarchy manifest.",
+    )
 
     @field_validator("allow_multi_parent_exceptions", mode="before")
     def _normalize_exceptions(value: List[str]) -> List[str]:
@@ -132,6 +132,8 @@ class WebValidationSettings(BaseModel):
     snippet_max_length: int = Field(default=200, ge=40, le=2000)
     min_snippet_matches: int = Field(default=1, ge=0)
     evidence_timeout_seconds: float = Field(default=10.0, ge=0.1)
+    batch_scan_enabled: bool = Field(default=True)
+    batch_scan_min_concepts: int = Field(default=64, ge=1)
 
     @field_validator("authoritative_domains", mode="before")
     def _normalize_domains(value: List[str]) -> List[str]:
@@ -144,6 +146,7 @@ class LLMValidationSettings(BaseModel):
     entailment_enabled: bool = Field(default=True)
     max_evidence_tokens: int = Field(default=1000, ge=128)
     confidence_threshold: float = Field(default=0.7, ge=0.0, le=1.0)
+    max_concurrency: int = Field(default=4, ge=1)
 
 
 class ValidationAggregationSettings(BaseModel):
@@ -163,6 +166,7 @@ class EvidenceStorageSettings(BaseModel):
     max_snippets_per_concept: int = Field(default=3, ge=0)
     store_evidence_urls: bool = Field(default=True)
     evidence_sampling_rate: float = Field(default=1.0, ge=0.0, le=1.0)
+    index_cache_directory: str | None = Field(default=None)
 
 
 class ValidationPolicy(BaseModel):
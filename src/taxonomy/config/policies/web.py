@@ -38,6 +38,8 @@ class ContentProcessingSettings(BaseModel):
     min_text_length: int = Field(default=120, ge=0)
     pdf_extraction_enabled: bool = Field(default=True)
     pdf_size_limit_mb: int = Field(default=5, ge=0)
+    extraction_workers: int = Field(default=0, ge=0)
+    extraction_queue_size: int = Field(default=0, ge=0)
 
     @field_validator("language_allowlist", mode="before")
     def _normalize_allowlist(value: List[str]) -> List[str]:
@@ -79,6 +81,7 @@ class WebDomainRules(BaseModel):
     firecrawl: FirecrawlPolicy = Field(default_factory=FirecrawlPolicy)
     include_patterns: List[str] = Field(default_factory=list)
     robots_cache_ttl_hours: int = Field(default=12, ge=1)
+    robots_decision_log_limit: int = Field(default=100, ge=0)
     sitemap_discovery: bool = Field(default=True)
     respect_crawl_delay: bool = Field(default=True)
     budgets: CrawlBudgets = Field(default_factory=CrawlBudgets)
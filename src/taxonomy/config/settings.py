@@ -161,6 +161,68 @@ class AuditModeConfig(BaseModel):
     )
 
 
+class PhaseResourceBudget(BaseModel):
+    """Resource limits checked when a phase completes; unset limits are ignored.
+
+    ``max_peak_rss_mb`` is also checked while the phase runs, so a breach is
+    reported as soon as it is sampled.
+    """
+
+    max_peak_rss_mb: float | None = Field(default=None, gt=0, description="Peak resident set size in MiB.")
+    max_python_peak_mb: float | None = Field(
+        default=None,
+        gt=0,
+        description="Peak traced Python heap in MiB; requires trace_allocations.",
+    )
+    max_cpu_seconds: float | None = Field(default=None, gt=0, description="User plus system CPU seconds.")
+    max_gc_pause_seconds: float | None = Field(default=None, gt=0, description="Total garbage collection pause time.")
+    max_io_bytes: int | None = Field(default=None, gt=0, description="Bytes read plus bytes written.")
+    on_exceed: Literal["warn", "abort"] = Field(
+        default="warn",
+        description="Log a warning, or fail the phase before it is checkpointed.",
+    )
+
+
+class OrchestrationConfig(BaseModel):
+    """Controls for how the orchestrator schedules pipeline phases."""
+
+    max_workers: int = Field(
+        default=1,
+        ge=1,
+        description="Number of phases the scheduler may run concurrently once their inputs are ready.",
+    )
+    pipelined_levels: bool = Field(
+        default=False,
+        description="Run S1, S2 and S3 of each level as concurrent stages joined by bounded queues.",
+    )
+    pipeline_queue_size: int = Field(
+        default=64,
+        ge=1,
+        description="Maximum items buffered between pipelined level stages.",
+    )
+    artifact_min_rows: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Phase output lists with at least this many rows are written to JSONL artifacts "
+            "and kept in the phase context as handles; 0 (the default) keeps every output in memory."
+        ),
+    )
+    resource_sample_interval_s: float = Field(
+        default=0.05,
+        ge=0,
+        description="Seconds between resident set samples taken while a phase runs; 0 samples only at phase boundaries.",
+    )
+    trace_allocations: bool = Field(
+        default=False,
+        description="Record each phase's peak Python heap with tracemalloc, at some cost in speed.",
+    )
+    phase_budgets: Dict[str, PhaseResourceBudget] = Field(
+        default_factory=dict,
+        description="Resource budgets keyed by phase name; the '*' entry applies to phases without their own.",
+    )
+
+
 class Settings(BaseSettings):
     """Primary configuration object for the taxonomy application.
 
@@ -185,6 +247,7 @@ class Settings(BaseSettings):
     paths: PathsConfig = Field(default_factory=PathsConfig)
     observability: PipelineObservabilityConfig = Field(default_factory=PipelineObservabilityConfig)
     audit_mode: AuditModeConfig = Field(default_factory=AuditModeConfig)
+    orchestration: OrchestrationConfig = Field(default_factory=OrchestrationConfig)
     create_dirs: bool = Field(
         default=False,
         description="Create filesystem directories declared in `paths` during initialisation.",
@@ -301,4 +364,4 @@ def get_settings() -> Settings:
     return Settings()
 
 
-__all__ = ["Settings", "get_settings", "PathsConfig", "AuditModeConfig"]
+__all__ = ["Settings", "get_settings", "PathsConfig", "AuditModeConfig", "OrchestrationConfig"]
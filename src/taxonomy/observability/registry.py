@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from collections import Counter, defaultdict
 from dataclasses import dataclass
-from threading import RLock
+from threading import RLock, local
 from typing import Any, Dict, Iterable, Mapping
 
 from .determinism import stable_sorted
@@ -69,7 +69,9 @@ class CounterRegistry:
         for phase, labelled in _LABELLED_COUNTERS.items():
             for counter in labelled:
                 self._data[phase][counter] = Counter()
-        self._phase_stack: list[str] = []
+        # Each thread keeps its own stack so phases running concurrently on
+        # different workers do not interleave their push/pop pairs.
+        self._phase_local = local()
 
     # ------------------------------------------------------------------
     # Phase context helpers
@@ -79,18 +81,23 @@ class CounterRegistry:
 
         if phase not in PHASE_COUNTERS:
             raise KeyError(f"Unknown observability phase '{phase}'")
-        with self._lock:
-            self._phase_stack.append(phase)
+        self._phase_stack().append(phase)
 
     def pop_phase(self, phase: str) -> None:
-        with self._lock:
-            if not self._phase_stack or self._phase_stack[-1] != phase:
-                raise RuntimeError("Phase stack out of sync during pop")
-            self._phase_stack.pop()
+        stack = self._phase_stack()
+        if not stack or stack[-1] != phase:
+            raise RuntimeError("Phase stack out of sync during pop")
+        stack.pop()
 
     def current_phase(self) -> str | None:
-        with self._lock:
-            return self._phase_stack[-1] if self._phase_stack else None
+        stack = self._phase_stack()
+        return stack[-1] if stack else None
+
+    def _phase_stack(self) -> list[str]:
+        stack = getattr(self._phase_local, "stack", None)
+        if stack is None:
+            stack = self._phase_local.stack = []
+        return stack
 
     # ------------------------------------------------------------------
     # Counter manipulation
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from .checkpoints import CheckpointManager
+from .checkpoints import ArtifactHandle, CheckpointManager
 from .main import RunResult, TaxonomyOrchestrator, run_taxonomy_pipeline
 from .manifest import RunManifest
-from .phases import PhaseManager, PhaseContext
+from .phases import ChangeSet, PhaseContext, PhaseManager, PhaseSpec
+from .post_processing import ConceptWorkingSet, build_post_processors
+from .resources import ResourceBudgetExceeded
 
 __all__ = [
     "run_taxonomy_pipeline",
@@ -13,8 +15,14 @@ __all__ = [
     "RunResult",
     "PhaseManager",
     "PhaseContext",
+    "PhaseSpec",
+    "ChangeSet",
+    "ConceptWorkingSet",
+    "build_post_processors",
     "CheckpointManager",
+    "ArtifactHandle",
     "RunManifest",
+    "ResourceBudgetExceeded",
 ]
 
 __version__ = "0.1.0"
@@ -2,22 +2,210 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import re
+import tempfile
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Iterable, Optional, Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Set
+
+from pydantic import BaseModel
 
 from taxonomy.utils.helpers import ensure_directory, serialize_json
 from taxonomy.utils.logging import get_logger
 
-import time
 _LOGGER = get_logger(module=__name__)
 
+CHECKPOINT_FORMAT = "chunked-v1"
+_VALUE_REF = "$checkpoint_chunk"
+_LIST_REF = "$checkpoint_chunks"
+_ARTIFACT_REF = "$artifact"
+_INLINE_BYTES = 1024
+_COMPRESSION_LEVEL = 3
+
+
+_ARTIFACT_NAME_RE = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+@dataclass(frozen=True)
+class ArtifactHandle(Sequence[Any]):
+    """Reference to a JSONL artifact holding one row per item of a phase output.
+
+    Handles are what phases keep in the :class:`PhaseContext` instead of bulk
+    lists. A handle is a read-only sequence: iterating streams the rows back
+    from disk, so consumers that only loop over an output never hold more than
+    one row of it, while indexing and slicing seek to individual rows using
+    line offsets read on first use. ``+`` with another sequence returns a list.
+    """
+
+    path: str
+    checksum: str
+    rows: int
+    kind: str = "phase-output"
+    _offsets: Optional[List[int]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __iter__(self) -> Iterator[Any]:
+        with open(self.path, "rb") as handle:
+            for line in handle:
+                yield json.loads(line)
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __getitem__(self, index: int | slice) -> Any:
+        offsets = self._line_offsets()
+        positions = range(self.rows)[index]
+        with open(self.path, "rb") as handle:
+            if isinstance(positions, int):
+                handle.seek(offsets[positions])
+                return json.loads(handle.readline())
+            items: List[Any] = []
+            for position in positions:
+                handle.seek(offsets[position])
+                items.append(json.loads(handle.readline()))
+            return items
+
+    def __add__(self, other: Iterable[Any]) -> List[Any]:
+        return [*self, *other]
+
+    def __radd__(self, other: Iterable[Any]) -> List[Any]:
+        return [*other, *self]
+
+    def _line_offsets(self) -> List[int]:
+        if self._offsets is None:
+            offsets: List[int] = []
+            position = 0
+            with open(self.path, "rb") as handle:
+                for line in handle:
+                    offsets.append(position)
+                    position += len(line)
+            object.__setattr__(self, "_offsets", offsets)
+        return self._offsets  # type: ignore[return-value]
+
+    def verify(self) -> bool:
+        """Return ``True`` when the file on disk still matches :attr:`checksum`."""
+
+        digest = hashlib.sha256()
+        try:
+            with open(self.path, "rb") as handle:
+                for block in iter(lambda: handle.read(1 << 20), b""):
+                    digest.update(block)
+        except OSError:
+            return False
+        return digest.hexdigest() == self.checksum
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"path": self.path, "checksum": self.checksum, "rows": self.rows, "kind": self.kind}
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> "ArtifactHandle":
+        return cls(
+            path=str(payload["path"]),
+            checksum=str(payload["checksum"]),
+            rows=int(payload["rows"]),
+            kind=str(payload.get("kind", "phase-output")),
+        )
+
+
+def _encode_default(value: object) -> object:
+    if isinstance(value, ArtifactHandle):
+        return {_ARTIFACT_REF: value.to_dict()}
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _decode_artifacts(value: object) -> object:
+    """Reverse :func:`_encode_default` for the artifact handles inside *value*."""
+
+    if isinstance(value, dict):
+        if len(value) == 1 and _ARTIFACT_REF in value:
+            return ArtifactHandle.from_dict(value[_ARTIFACT_REF])
+        return {key: _decode_artifacts(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode_artifacts(item) for item in value]
+    return value
+
+
+def _dumps(value: object) -> bytes:
+    return json.dumps(
+        value,
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=_encode_default,
+    ).encode("utf-8")
+
+
+def _atomic_write_bytes(path: Path, payload: bytes) -> None:
+    with tempfile.NamedTemporaryFile(
+        "wb", dir=path.parent, prefix=f".{path.name}-", suffix=".tmp", delete=False
+    ) as handle:
+        handle.write(payload)
+        temp_name = handle.name
+    os.replace(temp_name, path)
+
+
+def _chunk_refs(value: object) -> Iterator[tuple[str, bool]]:
+    """Yield ``(digest, may_hold_refs)`` for chunks referenced directly by *value*."""
+
+    if isinstance(value, dict):
+        if len(value) == 1 and _VALUE_REF in value:
+            yield value[_VALUE_REF], True
+        elif len(value) == 1 and _LIST_REF in value:
+            for digest in value[_LIST_REF]:
+                yield digest, False
+        else:
+            for item in value.values():
+                yield from _chunk_refs(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _chunk_refs(item)
+
+
+class CheckpointState(Mapping[str, Any]):
+    """Read-only view of a checkpoint state that decodes chunks on first access."""
+
+    def __init__(self, manager: "CheckpointManager", encoded: Mapping[str, Any]) -> None:
+        self._manager = manager
+        self._encoded = dict(encoded)
+        self._decoded: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._decoded:
+            self._decoded[key] = self._manager._resolve(self._encoded[key])
+        return self._decoded[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._encoded)
+
+    def __len__(self) -> int:
+        return len(self._encoded)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: self[key] for key in self._encoded}
+
 
 class CheckpointManager:
-    """Persists phase checkpoints and associated metadata to disk."""
+    """Persists phase checkpoints and associated metadata to disk.
 
-    def __init__(self, run_id: str, base_directory: Path | str) -> None:
+    Each ``<phase>.checkpoint.json`` is a small header holding the run id,
+    phase and timestamp. State values larger than about a kilobyte, and every
+    list of ``chunk_items`` or more entries nested inside them, are stored as
+    zlib-compressed chunks under ``chunks/`` named by the SHA-256 of their
+    content. Identical blocks, such as an unchanged concept list carried from
+    consolidation into post-processing, are therefore written once and shared
+    between phases. Chunks are written before the header, and both are
+    replaced atomically, so a header on disk always refers to complete data.
+    """
+
+    def __init__(self, run_id: str, base_directory: Path | str, *, chunk_items: int = 256) -> None:
         self.run_id = run_id
         base = Path(base_directory)
         if base.name == run_id:
@@ -25,6 +213,10 @@ class CheckpointManager:
         else:
             target = base / run_id
         self.base_directory = ensure_directory(target)
+        self.chunk_directory = self.base_directory / "chunks"
+        self.chunk_items = max(1, chunk_items)
+        self._known_chunks: Set[str] = set()
+        self._artifact_lock = threading.Lock()
         self._meta_path = self.base_directory / "artifacts.json"
         if not self._meta_path.exists():
             serialize_json({"artifacts": []}, self._meta_path)
@@ -35,24 +227,43 @@ class CheckpointManager:
     def checkpoint_path(self, phase: str) -> Path:
         return self.base_directory / f"{phase}.checkpoint.json"
 
-    def save_phase_checkpoint(self, phase: str, state: Dict[str, object]) -> Path:
+    def save_phase_checkpoint(self, phase: str, state: Mapping[str, object]) -> Path:
+        written_before = len(self._known_chunks)
+        encoded: Dict[str, object] = {}
+        for key, value in state.items():
+            value = self._externalize(value)
+            data = _dumps(value)
+            encoded[key] = value if len(data) <= _INLINE_BYTES else {_VALUE_REF: self._store_chunk(data)}
         payload = {
             "run_id": self.run_id,
             "phase": phase,
-            "state": state,
+            "format": CHECKPOINT_FORMAT,
+            "state": encoded,
             "saved_at": datetime.now(timezone.utc).isoformat(),
         }
         path = self.checkpoint_path(phase)
-        serialize_json(payload, path)
-        _LOGGER.info("Saved phase checkpoint", run_id=self.run_id, phase=phase)
+        _atomic_write_bytes(
+            path,
+            (json.dumps(payload, indent=2, sort_keys=True, ensure_ascii=False) + "\n").encode("utf-8"),
+        )
+        _LOGGER.info(
+            "Saved phase checkpoint",
+            run_id=self.run_id,
+            phase=phase,
+            new_chunks=len(self._known_chunks) - written_before,
+        )
         return path
 
-    def load_phase_checkpoint(self, phase: str) -> Optional[dict]:
+    def load_phase_checkpoint(self, phase: str, *, lazy: bool = False) -> Optional[dict]:
+        """Load a checkpoint, decoding its state eagerly or on access when *lazy*."""
+
         path = self.checkpoint_path(phase)
         if not path.exists():
             return None
         payload = json.loads(path.read_text(encoding="utf-8"))
         self.validate_checkpoint(payload)
+        state = CheckpointState(self, payload.get("state") or {})
+        payload["state"] = state if lazy else state.to_dict()
         return payload
 
     def validate_checkpoint(self, checkpoint: dict) -> None:
@@ -63,15 +274,130 @@ class CheckpointManager:
             )
 
     def determine_resume_point(self, phases: Sequence[str]) -> Optional[str]:
+        # Headers are written last, so their presence marks a complete checkpoint.
         completed = [phase for phase in phases if self.checkpoint_path(phase).exists()]
         return completed[-1] if completed else None
 
+    def completed_phases(self, phases: Sequence[str]) -> List[str]:
+        """Return the phases in *phases* that have a complete checkpoint.
+
+        Phases may finish out of order when the scheduler runs them
+        concurrently, so the result need not be a prefix of *phases*.
+        """
+
+        return [phase for phase in phases if self.checkpoint_path(phase).exists()]
+
     def recover_progress(self, phase: str) -> Optional[dict]:
         checkpoint = self.load_phase_checkpoint(phase)
         if checkpoint is None:
             return None
         return checkpoint.get("state")
 
+    # ------------------------------------------------------------------
+    # Chunk storage
+    # ------------------------------------------------------------------
+    def _chunk_path(self, digest: str) -> Path:
+        return self.chunk_directory / f"{digest}.z"
+
+    def _store_chunk(self, data: bytes) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        if digest in self._known_chunks:
+            return digest
+        path = self._chunk_path(digest)
+        if not path.exists():
+            ensure_directory(self.chunk_directory)
+            _atomic_write_bytes(path, zlib.compress(data, _COMPRESSION_LEVEL))
+        self._known_chunks.add(digest)
+        return digest
+
+    def _load_chunk(self, digest: str) -> object:
+        data = zlib.decompress(self._chunk_path(digest).read_bytes())
+        value = json.loads(data)
+        # List chunk members are not externalized, so artifact handles among
+        # them are rebuilt here; the byte check skips the walk for most chunks.
+        if _ARTIFACT_REF.encode("utf-8") in data:
+            value = _decode_artifacts(value)
+        return value
+
+    def _externalize(self, value: object) -> object:
+        if isinstance(value, ArtifactHandle):
+            return {_ARTIFACT_REF: value.to_dict()}
+        if isinstance(value, BaseModel):
+            return value.model_dump(mode="json")
+        if isinstance(value, Mapping):
+            return {key: self._externalize(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            if len(value) < self.chunk_items:
+                return [self._externalize(item) for item in value]
+            # Chunk members are stored as-is; walking every item would cost
+            # more than the extra sharing nested lists could buy.
+            return {
+                _LIST_REF: [
+                    self._store_chunk(_dumps(list(value[start : start + self.chunk_items])))
+                    for start in range(0, len(value), self.chunk_items)
+                ]
+            }
+        return value
+
+    def _resolve(self, value: object) -> object:
+        if isinstance(value, dict):
+            if len(value) == 1 and _ARTIFACT_REF in value:
+                return ArtifactHandle.from_dict(value[_ARTIFACT_REF])
+            if len(value) == 1 and _VALUE_REF in value:
+                return self._resolve(self._load_chunk(value[_VALUE_REF]))
+            if len(value) == 1 and _LIST_REF in value:
+                items: List[object] = []
+                for digest in value[_LIST_REF]:
+                    items.extend(self._load_chunk(digest))  # type: ignore[arg-type]
+                return items
+            return {key: self._resolve(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._resolve(item) for item in value]
+        return value
+
+    def _referenced_chunks(self) -> Optional[Set[str]]:
+        """Return chunk digests used by any checkpoint, or ``None`` if unknown."""
+
+        pending: List[tuple[str, bool]] = []
+        for header in self.base_directory.glob("*.checkpoint.json"):
+            try:
+                payload = json.loads(header.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                return None
+            pending.extend(_chunk_refs(payload.get("state") if isinstance(payload, dict) else None))
+        referenced: Set[str] = set()
+        while pending:
+            digest, may_hold_refs = pending.pop()
+            if digest in referenced:
+                continue
+            referenced.add(digest)
+            if not may_hold_refs:
+                continue
+            try:
+                pending.extend(_chunk_refs(self._load_chunk(digest)))
+            except (OSError, ValueError, zlib.error):
+                return None
+        return referenced
+
+    def _collect_chunks(self, grace_period_s: float) -> List[Path]:
+        referenced = self._referenced_chunks()
+        if referenced is None or not self.chunk_directory.exists():
+            return []
+        now = time.time()
+        removed: List[Path] = []
+        for chunk in self.chunk_directory.glob("*.z"):
+            if chunk.stem in referenced:
+                continue
+            try:
+                if grace_period_s > 0 and (now - chunk.stat().st_mtime) < grace_period_s:
+                    continue
+                chunk.unlink(missing_ok=True)
+            except OSError:
+                continue
+            self._known_chunks.discard(chunk.stem)
+            removed.append(chunk)
+        return removed
+
     def cleanup_checkpoints(
         self,
         keep_latest_n: int = 1,
@@ -154,6 +480,7 @@ class CheckpointManager:
                     run_id=self.run_id,
                 )
 
+        chunks_removed = [] if dry_run else self._collect_chunks(grace_period_s)
         _LOGGER.info(
             "Checkpoint cleanup finished",
             run_id=self.run_id,
@@ -162,27 +489,74 @@ class CheckpointManager:
             grace_period_s=grace_period_s,
             removed=[str(path) for path in removed],
             failures=[{"path": str(path), "error": error} for path, error in failures],
+            chunks_removed=len(chunks_removed),
         )
         return removed, failures
 
     # ------------------------------------------------------------------
     # Artifact tracking
     # ------------------------------------------------------------------
-    def record_artifact(self, path: Path | str, *, kind: str) -> None:
-        payload = json.loads(self._meta_path.read_text(encoding="utf-8"))
-        artifacts = payload.setdefault("artifacts", [])
-        artifacts.append(
-            {
-                "path": str(Path(path).resolve()),
-                "kind": kind,
-                "recorded_at": datetime.now(timezone.utc).isoformat(),
-            }
-        )
-        serialize_json(payload, self._meta_path)
+    def record_artifact(
+        self,
+        path: Path | str,
+        *,
+        kind: str,
+        checksum: str | None = None,
+        rows: int | None = None,
+    ) -> None:
+        entry: Dict[str, Any] = {
+            "path": str(Path(path).resolve()),
+            "kind": kind,
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+        }
+        if checksum is not None:
+            entry["checksum"] = checksum
+        if rows is not None:
+            entry["rows"] = rows
+        with self._artifact_lock:
+            payload = json.loads(self._meta_path.read_text(encoding="utf-8"))
+            artifacts = payload.setdefault("artifacts", [])
+            # A rewritten artifact (e.g. a re-run phase) replaces its old entry.
+            artifacts[:] = [item for item in artifacts if item.get("path") != entry["path"]]
+            artifacts.append(entry)
+            serialize_json(payload, self._meta_path)
+
+    def write_artifact(self, name: str, rows: Iterable[object], *, kind: str = "phase-output") -> ArtifactHandle:
+        """Stream *rows* to ``artifacts/<name>.jsonl`` and return a handle to them.
+
+        Rows must be JSON serialisable; a :class:`TypeError` leaves no file
+        behind. The artifact is registered through :meth:`record_artifact`.
+        """
+
+        parts = [_ARTIFACT_NAME_RE.sub("_", part).strip("_") or "artifact" for part in name.split("/")]
+        parts[-1] += ".jsonl"
+        path = self.base_directory.joinpath("artifacts", *parts)
+        ensure_directory(path.parent)
+        digest = hashlib.sha256()
+        count = 0
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=path.parent, prefix=f".{path.name}-", suffix=".tmp", delete=False
+        ) as handle:
+            temp_name = handle.name
+            try:
+                for row in rows:
+                    line = _dumps(row) + b"\n"
+                    handle.write(line)
+                    digest.update(line)
+                    count += 1
+            except BaseException:
+                handle.close()
+                os.unlink(temp_name)
+                raise
+        os.replace(temp_name, path)
+        artifact = ArtifactHandle(path=str(path.resolve()), checksum=digest.hexdigest(), rows=count, kind=kind)
+        self.record_artifact(path, kind=kind, checksum=artifact.checksum, rows=count)
+        _LOGGER.debug("Wrote artifact", run_id=self.run_id, path=artifact.path, rows=count)
+        return artifact
 
     def iter_artifacts(self) -> Iterable[dict]:
         payload = json.loads(self._meta_path.read_text(encoding="utf-8"))
         yield from payload.get("artifacts", [])
 
 
-__all__ = ["CheckpointManager"]
+__all__ = ["ArtifactHandle", "CheckpointManager", "CheckpointState"]
@@ -16,7 +16,8 @@ from taxonomy.utils.logging import get_logger, logging_context
 
 from .checkpoints import CheckpointManager
 from .manifest import RunManifest
-from .phases import PhaseManager, PhaseContext
+from .phases import PhaseContext, PhaseManager
+from .post_processing import latest_concepts
 
 _LOGGER = get_logger(module=__name__)
 
@@ -69,6 +70,7 @@ class TaxonomyOrchestrator:
         post_processors = adapters.get("post_processors", _default_post_processors())
         finalizer = adapters.get("finalizer", _build_default_finalizer(settings))
         resume_handler = adapters.get("resume_handler")
+        extra_phases = adapters.get("extra_phases", ())
 
         phase_manager = PhaseManager(
             settings=settings,
@@ -80,6 +82,7 @@ class TaxonomyOrchestrator:
             finalizer=finalizer,
             resume_handler=resume_handler,
             audit_mode=settings.audit_mode.enabled,
+            extra_phases=extra_phases,
         )
 
         return cls(
@@ -100,14 +103,16 @@ class TaxonomyOrchestrator:
 
     def run(self, *, resume_phase: Optional[str] = None) -> RunResult:
         order = self._phase_manager.phase_order()
+        completed: list[str] = []
         if resume_phase is None:
-            last_completed = self._checkpoint_manager.determine_resume_point(order)
-            if last_completed:
-                idx = order.index(last_completed)
-                resume_phase = order[idx + 1] if idx + 1 < len(order) else last_completed
+            # Concurrent runs checkpoint phases out of order, so resume from the
+            # set of completed phases rather than the last one in order.
+            completed = self._checkpoint_manager.completed_phases(order)
+            if len(completed) == len(order):
+                completed.remove(order[-1])
 
         with logging_context(run_id=self._checkpoint_manager.run_id, step="orchestration"):
-            phase_results = self._phase_manager.execute_all(resume_from=resume_phase)
+            phase_results = self._phase_manager.execute_all(resume_from=resume_phase, completed=completed)
 
         for artifact in self._checkpoint_manager.iter_artifacts():
             self._manifest.add_artifact(artifact["path"], kind=artifact.get("kind", "unknown"))
@@ -163,12 +168,18 @@ def _build_default_finalizer(settings: Settings) -> Callable[[PhaseContext], Dic
     def finalizer(context: PhaseContext) -> Dict[str, Any]:
         assembler = HierarchyAssembler(policy)
         history = context.get(PhaseManager.POST_PROCESSING_PHASE, {}).get("history", [])
+        # Each post-processor reports the full current concept set, so the most
+        # recent report supersedes the earlier ones. Concepts restored from a
+        # checkpoint arrive as dictionaries; other items are ignored.
         flattened: list[Concept] = []
-        for iteration in history:
-            for result in iteration.get("results", []):
-                for item in result.get("concepts", []):
-                    if isinstance(item, Concept):
-                        flattened.append(item)
+        for item in latest_concepts(history):
+            if isinstance(item, dict):
+                try:
+                    item = Concept.model_validate(item)
+                except ValueError:
+                    continue
+            if isinstance(item, Concept):
+                flattened.append(item)
         if not flattened:
             _LOGGER.debug(
                 "No concepts supplied from post-processing; assembling empty hierarchy",
@@ -10,6 +10,8 @@ from taxonomy.observability import stable_hash
 from taxonomy.utils.helpers import serialize_json
 from taxonomy.utils.logging import get_logger
 
+from .checkpoints import ArtifactHandle
+
 if TYPE_CHECKING:  # pragma: no cover - typing convenience
     from taxonomy.config.policies import ObservabilityPolicy
     from taxonomy.config.settings import Settings
@@ -20,6 +22,18 @@ if TYPE_CHECKING:  # pragma: no cover - typing convenience
 _LOGGER = get_logger(module=__name__)
 
 
+def _artifact_references(value: Any) -> Any:
+    """Replace artifact handles with their JSON description."""
+
+    if isinstance(value, ArtifactHandle):
+        return {"artifact": value.to_dict()}
+    if isinstance(value, Mapping):
+        return {key: _artifact_references(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_artifact_references(item) for item in value]
+    return value
+
+
 class RunManifest:
     """Collects structured metadata about a taxonomy pipeline run."""
 
@@ -314,6 +328,9 @@ class RunManifest:
     def collect_performance_data(self, phase: str, metrics: Dict[str, Any]) -> None:
         self._data["performance"][phase] = dict(metrics)
 
+    def record_schedule(self, schedule: Dict[str, Any]) -> None:
+        self._data["schedule"] = dict(schedule)
+
     def capture_reproducibility_info(self, *, seed: int, timestamps: Dict[str, str]) -> None:
         self._data["reproducibility"] = {
             "seed": seed,
@@ -324,8 +341,8 @@ class RunManifest:
 
     def summarize_hierarchy(self, *, stats: Dict[str, Any], validation: Dict[str, Any]) -> None:
         self._data["hierarchy"] = {
-            "stats": dict(stats),
-            "validation": dict(validation),
+            "stats": _artifact_references(dict(stats)),
+            "validation": _artifact_references(dict(validation)),
         }
 
     def add_artifact(self, path: Path | str, *, kind: str) -> None:
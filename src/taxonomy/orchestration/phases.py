@@ -1,18 +1,21 @@
 """Phase orchestration for the end-to-end taxonomy pipeline."""
 from __future__ import annotations
 
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from contextlib import nullcontext
 from dataclasses import dataclass, field
+import heapq
 import inspect
 from time import perf_counter
-from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
 
 from taxonomy.config.settings import Settings
 from taxonomy.observability import ObservabilityContext
 from taxonomy.utils.logging import get_logger
 
-from .checkpoints import CheckpointManager
+from .checkpoints import ArtifactHandle, CheckpointManager
 from .manifest import RunManifest
+from .resources import ResourceBudgetExceeded, ResourceMonitor, budget_violations
 
 _LOGGER = get_logger(module=__name__)
 
@@ -20,6 +23,76 @@ PhaseCallable = Callable[["PhaseContext"], Dict[str, Any]]
 LevelCallable = Callable[["PhaseContext", int], Dict[str, Any]]
 
 
+@dataclass(frozen=True, slots=True)
+class PhaseSpec:
+    """Declaration of a schedulable phase and the data it exchanges.
+
+    A phase always provides its own name; ``outputs`` lists additional keys it
+    produces. ``inputs`` names keys provided by other phases and
+    ``required_by`` names phases that must wait for this one, which lets
+    extra phases slot in ahead of built-in ones. Built-in phases leave
+    ``func`` unset; extra phases supply a :data:`PhaseCallable`.
+    """
+
+    name: str
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+    required_by: Tuple[str, ...] = ()
+    func: PhaseCallable | None = None
+    observability_phase: str | None = None
+
+
+@dataclass(slots=True)
+class ChangeSet:
+    """Concept ids a post-processor touched during one pass.
+
+    Post-processors report one as ``result["change_set"]``, either as an
+    instance or as a mapping of ``modified``/``merged``/``split`` id lists.
+    """
+
+    modified: Set[str] = field(default_factory=set)
+    merged: Set[str] = field(default_factory=set)
+    split: Set[str] = field(default_factory=set)
+
+    def __post_init__(self) -> None:
+        self.modified = set(self.modified)
+        self.merged = set(self.merged)
+        self.split = set(self.split)
+
+    @classmethod
+    def from_result(cls, result: Mapping[str, Any]) -> "ChangeSet | None":
+        """Return the change-set in *result*, or ``None`` when it is unknown."""
+
+        payload = result.get("change_set")
+        if isinstance(payload, ChangeSet):
+            return payload
+        if isinstance(payload, Mapping):
+            return cls(
+                modified=payload.get("modified", ()),
+                merged=payload.get("merged", ()),
+                split=payload.get("split", ()),
+            )
+        return None if result.get("changed") else cls()
+
+    def ids(self) -> Set[str]:
+        return self.modified | self.merged | self.split
+
+    def update(self, other: "ChangeSet") -> None:
+        self.modified |= other.modified
+        self.merged |= other.merged
+        self.split |= other.split
+
+    def __len__(self) -> int:
+        return len(self.ids())
+
+    def to_dict(self) -> Dict[str, List[str]]:
+        return {
+            "modified": sorted(self.modified),
+            "merged": sorted(self.merged),
+            "split": sorted(self.split),
+        }
+
+
 @dataclass(slots=True)
 class PhaseContext:
     """Shared context object passed to phase callables."""
@@ -29,10 +102,34 @@ class PhaseContext:
     observability: ObservabilityContext
     audit_mode: bool
     state: Dict[str, Any] = field(default_factory=dict)
+    checkpoint_manager: CheckpointManager | None = None
+    resource_monitors: Dict[str, ResourceMonitor] = field(default_factory=dict)
 
     def record(self, phase: str, payload: Dict[str, Any]) -> None:
         self.state[phase] = payload
 
+    def write_artifact(self, name: str, rows: Iterable[Any]) -> ArtifactHandle:
+        """Stream *rows* into a run artifact and return its handle.
+
+        Phases producing large outputs can return the handle in their payload
+        instead of building the list in memory first.
+        """
+
+        if self.checkpoint_manager is None:
+            raise RuntimeError("Phase context has no checkpoint manager to write artifacts")
+        return self.checkpoint_manager.write_artifact(name, rows)
+
+    def check_budget(self, phase: str) -> None:
+        """Raise :class:`ResourceBudgetExceeded` if *phase* has overrun an aborting budget.
+
+        Long-running phases call this between units of work so a budget
+        breach seen by the resource sampler stops them early.
+        """
+
+        monitor = self.resource_monitors.get(phase)
+        if monitor is not None:
+            monitor.check()
+
     def get(self, phase: str, default: Any = None) -> Any:
         return self.state.get(phase, default)
 
@@ -77,6 +174,8 @@ class PhaseManager:
         resume_handler: PhaseCallable | None = None,
         max_post_processing_iterations: int = 5,
         audit_mode: bool = False,
+        extra_phases: Sequence[PhaseSpec] = (),
+        max_workers: int | None = None,
     ) -> None:
         self._settings = settings
         self._checkpoint_manager = checkpoint_manager
@@ -97,8 +196,13 @@ class PhaseManager:
             run_id=checkpoint_manager.run_id,
             observability=self._observability,
             audit_mode=audit_mode,
+            checkpoint_manager=checkpoint_manager,
         )
         self._max_iterations = max_post_processing_iterations
+        self._extra_phases = list(extra_phases)
+        self._max_workers = max(1, max_workers or settings.orchestration.max_workers)
+        self._dependencies: Dict[str, List[str]] = {}
+        self._specs = self._resolve_specs()
 
     def _run_with_observability(
         self,
@@ -108,7 +212,14 @@ class PhaseManager:
         metrics_builder: Callable[[Dict[str, Any]], Mapping[str, Any]] | None = None,
         observability_phase: str | None = None,
     ) -> Dict[str, Any]:
-        """Execute *runner* inside the observability phase context."""
+        """Execute *runner* inside the observability phase context.
+
+        CPU, GC, I/O and peak memory figures from :class:`ResourceMonitor` are
+        added to the phase metrics and checked against the phase's entry in
+        ``settings.orchestration.phase_budgets`` (or its ``"*"`` entry). Peak
+        RSS is also checked by the sampler while *runner* executes, and phases
+        observe that through :meth:`PhaseContext.check_budget`.
+        """
 
         metrics: Dict[str, Any] = {}
         target_phase = observability_phase or phase_name
@@ -118,16 +229,27 @@ class PhaseManager:
             phase_cm = nullcontext()
         else:
             phase_cm = self._observability.phase(target_phase)
+        orchestration = self._settings.orchestration
+        budget = orchestration.phase_budgets.get(phase_name) or orchestration.phase_budgets.get("*")
+        monitor = ResourceMonitor(
+            sample_interval_s=orchestration.resource_sample_interval_s,
+            trace_allocations=orchestration.trace_allocations,
+            budget=budget,
+            phase=phase_name,
+        )
+        violations: List[Dict[str, Any]] = []
         with phase_cm as phase_handle:
             if phase_handle is not None and hasattr(phase_handle, "log_operation"):
                 phase_handle.log_operation(operation="start")
             start = perf_counter()
+            self._context.resource_monitors[phase_name] = monitor
             try:
-                payload = runner()
+                with monitor:
+                    payload = runner()
             except Exception as exc:
                 elapsed = perf_counter() - start
                 if phase_handle is not None and hasattr(phase_handle, "performance"):
-                    phase_handle.performance({"elapsed_seconds": elapsed, "outcome": "error"})
+                    phase_handle.performance({"elapsed_seconds": elapsed, "outcome": "error", **monitor.usage})
                     if hasattr(phase_handle, "log_operation"):
                         phase_handle.log_operation(
                             operation="failure",
@@ -135,8 +257,21 @@ class PhaseManager:
                             payload={"error": str(exc)},
                         )
                 raise
+            finally:
+                self._context.resource_monitors.pop(phase_name, None)
             elapsed = perf_counter() - start
-            metrics.update({"elapsed_seconds": elapsed})
+            metrics.update({"elapsed_seconds": elapsed, **monitor.usage})
+            if budget is not None:
+                violations = budget_violations(monitor.usage, budget)
+            if violations:
+                metrics["budget_violations"] = violations
+                for violation in violations:
+                    _LOGGER.warning(
+                        "Phase exceeded resource budget",
+                        phase=phase_name,
+                        action=budget.on_exceed,
+                        **violation,
+                    )
             if metrics_builder is not None:
                 extras = dict(metrics_builder(payload))
                 metrics.update(extras)
@@ -145,7 +280,39 @@ class PhaseManager:
                 if hasattr(phase_handle, "log_operation"):
                     phase_handle.log_operation(operation="complete", payload=dict(metrics))
         self._manifest.collect_performance_data(phase_name, metrics)
-        return payload
+        if violations and budget is not None and budget.on_exceed == "abort":
+            raise ResourceBudgetExceeded(phase_name, violations)
+        return self._offload(phase_name, payload)
+
+    def _offload(self, phase_name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace bulk lists in *payload* with artifact handles.
+
+        Lists of at least ``settings.orchestration.artifact_min_rows`` rows are
+        streamed to ``artifacts/<phase>/<key path>.jsonl`` so the context keeps
+        only a handle; downstream phases iterate the handle to stream the rows.
+        Lists whose rows are not JSON serialisable stay in memory.
+        """
+
+        threshold = self._settings.orchestration.artifact_min_rows
+        if threshold <= 0 or not isinstance(payload, dict):
+            return payload
+
+        def visit(value: Any, path: Tuple[str, ...]) -> Any:
+            if isinstance(value, ArtifactHandle):
+                return value
+            if isinstance(value, dict):
+                return {key: visit(item, (*path, str(key))) for key, item in value.items()}
+            if isinstance(value, list):
+                if len(value) >= threshold:
+                    name = f"{phase_name}/{'.'.join(path)}"
+                    try:
+                        return self._checkpoint_manager.write_artifact(name, value)
+                    except TypeError:
+                        _LOGGER.debug("Keeping non-serialisable output in memory", phase=phase_name, key=name)
+                return [visit(item, (*path, str(index))) for index, item in enumerate(value)]
+            return value
+
+        return visit(payload, ())
 
     # ------------------------------------------------------------------
     # Phase execution helpers
@@ -158,7 +325,10 @@ class PhaseManager:
         _LOGGER.info("Running level generation", level=level)
 
         def _runner() -> Dict[str, Any]:
-            return self._call_with_audit_mode(generator, self._context, level)
+            kwargs: Dict[str, Any] = {}
+            if self._accepts_keyword(generator, "pipelined"):
+                kwargs["pipelined"] = self._settings.orchestration.pipelined_levels
+            return self._call_with_audit_mode(generator, self._context, level, **kwargs)
 
         payload = self._run_with_observability(
             phase_name,
@@ -204,14 +374,41 @@ class PhaseManager:
             iterations = 0
             history: List[Dict[str, Any]] = []
             changed = True
+            # Changes each processor has not yet seen; ``None`` requests a full pass.
+            pending: List[ChangeSet | None] = [None] * len(self._post_processors)
             while changed and iterations < self._max_iterations:
                 iterations += 1
                 changed = False
+                delta = ChangeSet()
+                full_pass = delta_unknown = False
                 iteration_payload: Dict[str, Any] = {"iteration": iterations, "results": []}
-                for processor in self._post_processors:
-                    result = self._call_with_audit_mode(processor, self._context)
+                for index, processor in enumerate(self._post_processors):
+                    scope = pending[index]
+                    if scope is not None and not scope:
+                        continue
+                    self._context.check_budget(self.POST_PROCESSING_PHASE)
+                    pending[index] = ChangeSet()
+                    full_pass = full_pass or scope is None
+                    kwargs: Dict[str, Any] = {}
+                    if self._accepts_keyword(processor, "change_set"):
+                        kwargs["change_set"] = scope
+                    result = self._call_with_audit_mode(processor, self._context, **kwargs)
+                    change_set = ChangeSet.from_result(result)
+                    if isinstance(result.get("change_set"), ChangeSet):
+                        result = {**result, "change_set": change_set.to_dict()}
                     iteration_payload["results"].append(result)
-                    changed = changed or bool(result.get("changed"))
+                    if change_set is None:
+                        delta_unknown = changed = True
+                        pending = [None] * len(pending)
+                        continue
+                    if change_set or result.get("changed"):
+                        changed = True
+                    delta.update(change_set)
+                    for other_scope in pending:
+                        if other_scope is not None:
+                            other_scope.update(change_set)
+                iteration_payload["delta_size"] = None if delta_unknown else len(delta)
+                iteration_payload["full_pass"] = full_pass
                 history.append(iteration_payload)
                 if not changed:
                     break
@@ -287,47 +484,248 @@ class PhaseManager:
     # ------------------------------------------------------------------
     # Composite execution
     # ------------------------------------------------------------------
+    def phase_specs(self) -> List[PhaseSpec]:
+        """Return built-in and extra phase declarations in execution order."""
+
+        return list(self._specs)
+
     def phase_order(self) -> List[str]:
-        return [
-            *self.LEVEL_PHASES,
-            self.CONSOLIDATION_PHASE,
-            self.POST_PROCESSING_PHASE,
-            self.RESUME_PHASE,
-            self.FINALIZATION_PHASE,
-        ]
+        return [spec.name for spec in self._specs]
+
+    def _builtin_specs(self) -> List[PhaseSpec]:
+        specs = [PhaseSpec(self.LEVEL_PHASES[0])]
+        specs.extend(
+            PhaseSpec(phase, inputs=(previous,))
+            for previous, phase in zip(self.LEVEL_PHASES, self.LEVEL_PHASES[1:])
+        )
+        specs.extend(
+            [
+                PhaseSpec(self.CONSOLIDATION_PHASE, inputs=tuple(self.LEVEL_PHASES)),
+                PhaseSpec(self.POST_PROCESSING_PHASE, inputs=(self.CONSOLIDATION_PHASE,)),
+                PhaseSpec(self.RESUME_PHASE, inputs=(self.POST_PROCESSING_PHASE,)),
+                PhaseSpec(
+                    self.FINALIZATION_PHASE,
+                    inputs=(self.POST_PROCESSING_PHASE, self.RESUME_PHASE),
+                ),
+            ]
+        )
+        return specs
+
+    def _resolve_specs(self) -> List[PhaseSpec]:
+        """Validate declarations and order them topologically.
+
+        Ties are broken by declaration order, so without extra phases the
+        order matches the historical fixed sequence.
+        """
+
+        declared = [*self._builtin_specs(), *self._extra_phases]
+        by_name: Dict[str, int] = {}
+        producers: Dict[str, int] = {}
+        for index, spec in enumerate(declared):
+            if spec.name in by_name:
+                raise ValueError(f"Duplicate phase declaration '{spec.name}'")
+            by_name[spec.name] = index
+            for key in (spec.name, *spec.outputs):
+                if key in producers and producers[key] != index:
+                    raise ValueError(f"Phase output '{key}' is produced by more than one phase")
+                producers[key] = index
+
+        depends_on: List[Set[int]] = [set() for _ in declared]
+        for index, spec in enumerate(declared):
+            for key in spec.inputs:
+                if key not in producers:
+                    raise ValueError(f"Phase '{spec.name}' consumes unknown input '{key}'")
+                depends_on[index].add(producers[key])
+            for dependant in spec.required_by:
+                if dependant not in by_name:
+                    raise ValueError(f"Phase '{spec.name}' is required by unknown phase '{dependant}'")
+                depends_on[by_name[dependant]].add(index)
+
+        self._dependencies = {
+            declared[index].name: sorted(declared[dep].name for dep in deps)
+            for index, deps in enumerate(depends_on)
+        }
+        remaining = [len(deps) for deps in depends_on]
+        dependants: List[List[int]] = [[] for _ in declared]
+        for index, deps in enumerate(depends_on):
+            for dep in deps:
+                dependants[dep].append(index)
+        ready = [index for index, count in enumerate(remaining) if count == 0]
+        heapq.heapify(ready)
+        ordered: List[PhaseSpec] = []
+        while ready:
+            index = heapq.heappop(ready)
+            ordered.append(declared[index])
+            for dependant in dependants[index]:
+                remaining[dependant] -= 1
+                if remaining[dependant] == 0:
+                    heapq.heappush(ready, dependant)
+        if len(ordered) != len(declared):
+            raise ValueError("Phase declarations contain a dependency cycle")
+        return ordered
+
+    def run_phase(self, phase_name: str) -> Dict[str, Any]:
+        """Execute a single phase by name, built-in or extra."""
+
+        if phase_name.startswith("phase1_level"):
+            return self.run_level_generation(int(phase_name[-1]))
+        if phase_name == self.CONSOLIDATION_PHASE:
+            return self.consolidate_raw_universe()
+        if phase_name == self.POST_PROCESSING_PHASE:
+            return self.run_post_processing()
+        if phase_name == self.RESUME_PHASE:
+            return self.resume_management()
+        if phase_name == self.FINALIZATION_PHASE:
+            return self.finalize_taxonomy()
+        for spec in self._extra_phases:
+            if spec.name == phase_name:
+                return self._run_extra_phase(spec)
+        raise KeyError(f"Unknown phase '{phase_name}'")
+
+    def _run_extra_phase(self, spec: PhaseSpec) -> Dict[str, Any]:
+        if spec.func is None:
+            raise ValueError(f"Extra phase '{spec.name}' does not declare a callable")
+        _LOGGER.info("Running extra phase", phase=spec.name)
+        func = spec.func
+        payload = self._run_with_observability(
+            spec.name,
+            lambda: self._call_with_audit_mode(func, self._context),
+            observability_phase=spec.observability_phase,
+        )
+        self._context.record(spec.name, payload)
+        self._checkpoint_manager.save_phase_checkpoint(spec.name, payload)
+        return payload
+
+    def execute_all(
+        self,
+        *,
+        resume_from: Optional[str] = None,
+        completed: Sequence[str] = (),
+    ) -> Dict[str, Any]:
+        """Run every phase except those before *resume_from* and those in *completed*.
+
+        Skipped phases count as satisfied dependencies; their checkpointed
+        state, when present, is restored into the context for later phases.
+        """
 
-    def execute_all(self, *, resume_from: Optional[str] = None) -> Dict[str, Any]:
-        results: Dict[str, Any] = {}
         order = self.phase_order()
         if resume_from is not None and resume_from not in order:
             raise ValueError(
                 f"Unknown resume phase '{resume_from}'. Valid phases: {', '.join(order)}"
             )
-        skipping = resume_from is not None
+        start_index = order.index(resume_from) if resume_from is not None else 0
+        skipped = set(order[:start_index]) | set(completed)
         for phase_name in order:
-            if skipping:
-                if phase_name == resume_from:
-                    skipping = False
-                else:
-                    _LOGGER.info("Skipping phase due to resume", phase=phase_name)
-                    self._observability.record_operation(
-                        phase=phase_name,
-                        operation="resume_skip",
-                        payload={"resume_from": resume_from},
-                    )
-                    continue
-            if phase_name.startswith("phase1_level"):
-                level = int(phase_name[-1])
-                results[phase_name] = self.run_level_generation(level)
-            elif phase_name == self.CONSOLIDATION_PHASE:
-                results[phase_name] = self.consolidate_raw_universe()
-            elif phase_name == self.POST_PROCESSING_PHASE:
-                results[phase_name] = self.run_post_processing()
-            elif phase_name == self.RESUME_PHASE:
-                results[phase_name] = self.resume_management()
-            elif phase_name == self.FINALIZATION_PHASE:
-                results[phase_name] = self.finalize_taxonomy()
-        return results
+            if phase_name not in skipped:
+                continue
+            _LOGGER.info("Skipping phase due to resume", phase=phase_name)
+            self._observability.record_operation(
+                phase=phase_name,
+                operation="resume_skip",
+                payload={"resume_from": resume_from, "completed": phase_name in completed},
+            )
+            checkpoint = self._checkpoint_manager.load_phase_checkpoint(phase_name, lazy=True)
+            if checkpoint is not None:
+                self._context.record(phase_name, checkpoint["state"])
+        pending = [phase_name for phase_name in order if phase_name not in skipped]
+        results, timings = self._schedule(pending)
+        self._manifest.record_schedule(self._schedule_summary(pending, timings))
+        return {phase_name: results[phase_name] for phase_name in pending}
+
+    def _schedule(
+        self,
+        pending: Sequence[str],
+    ) -> Tuple[Dict[str, Any], Dict[str, Tuple[float, float]]]:
+        """Run ``pending`` phases as soon as their in-run dependencies finish.
+
+        Phases skipped by resume count as satisfied. Returns the payloads and
+        ``(start, end)`` offsets in seconds from the start of scheduling.
+        """
+
+        origin = perf_counter()
+        results: Dict[str, Any] = {}
+        timings: Dict[str, Tuple[float, float]] = {}
+
+        def _timed(phase_name: str) -> Dict[str, Any]:
+            started = perf_counter() - origin
+            try:
+                return self.run_phase(phase_name)
+            finally:
+                timings[phase_name] = (started, perf_counter() - origin)
+
+        if self._max_workers == 1:
+            for phase_name in pending:
+                results[phase_name] = _timed(phase_name)
+            return results, timings
+
+        in_run = set(pending)
+        waiting = {
+            phase_name: {dep for dep in self._dependencies[phase_name] if dep in in_run}
+            for phase_name in pending
+        }
+        running: Dict[Future[Dict[str, Any]], str] = {}
+        failure: BaseException | None = None
+        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="phase") as executor:
+            while waiting or running:
+                if failure is None:
+                    for phase_name in [name for name in pending if name in waiting and not waiting[name]]:
+                        del waiting[phase_name]
+                        running[executor.submit(_timed, phase_name)] = phase_name
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    phase_name = running.pop(future)
+                    try:
+                        results[phase_name] = future.result()
+                    except BaseException as exc:  # noqa: BLE001 - re-raised below
+                        failure = failure or exc
+                        continue
+                    for deps in waiting.values():
+                        deps.discard(phase_name)
+        if failure is not None:
+            raise failure
+        return results, timings
+
+    def _schedule_summary(
+        self,
+        pending: Sequence[str],
+        timings: Mapping[str, Tuple[float, float]],
+    ) -> Dict[str, Any]:
+        """Summarise per-phase timings and the critical path through the run."""
+
+        in_run = set(pending)
+        critical: Dict[str, float] = {}
+        via: Dict[str, str | None] = {}
+        phases: Dict[str, Dict[str, Any]] = {}
+        for phase_name in pending:
+            start, end = timings[phase_name]
+            deps = [dep for dep in self._dependencies[phase_name] if dep in in_run]
+            upstream = max(deps, key=lambda dep: critical[dep], default=None)
+            critical[phase_name] = (end - start) + (critical[upstream] if upstream else 0.0)
+            via[phase_name] = upstream
+            phases[phase_name] = {
+                "depends_on": deps,
+                "started_at_seconds": start,
+                "finished_at_seconds": end,
+                "elapsed_seconds": end - start,
+                "critical_path_seconds": critical[phase_name],
+            }
+        path: List[str] = []
+        cursor = max(pending, key=lambda name: critical[name], default=None)
+        while cursor is not None:
+            path.append(cursor)
+            cursor = via[cursor]
+        path.reverse()
+        for phase_name, record in phases.items():
+            record["on_critical_path"] = phase_name in path
+        return {
+            "max_workers": self._max_workers,
+            "wall_seconds": max((end for _, end in timings.values()), default=0.0),
+            "critical_path": path,
+            "critical_path_seconds": critical[path[-1]] if path else 0.0,
+            "phases": phases,
+        }
 
     @property
     def context(self) -> PhaseContext:
@@ -349,13 +747,17 @@ class PhaseManager:
             return func(*args, **kwargs)
         return func(*args, **kwargs)
 
+    @classmethod
+    def _supports_audit_mode(cls, func: Callable[..., Any]) -> bool:
+        return cls._accepts_keyword(func, "audit_mode")
+
     @staticmethod
-    def _supports_audit_mode(func: Callable[..., Any]) -> bool:
+    def _accepts_keyword(func: Callable[..., Any], name: str) -> bool:
         try:
             signature = inspect.signature(func)
         except (TypeError, ValueError):  # pragma: no cover - fallback for builtins
             return False
-        if "audit_mode" in signature.parameters:
+        if name in signature.parameters:
             return True
         return any(
             parameter.kind == inspect.Parameter.VAR_KEYWORD
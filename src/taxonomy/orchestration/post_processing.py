@@ -0,0 +1,154 @@
+"""Post-processor adapters that run the concept processors on change-sets."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from taxonomy.entities.core import Concept
+from taxonomy.pipeline.deduplication.processor import DeduplicationProcessor
+from taxonomy.pipeline.disambiguation.processor import ContextIndex, DisambiguationProcessor
+from taxonomy.pipeline.validation.processor import ValidationProcessor
+
+from .phases import ChangeSet, PhaseContext, PhaseManager
+
+PostProcessor = Callable[..., Dict[str, Any]]
+
+
+class ConceptWorkingSet:
+    """Current concepts shared by the post-processor adapters of one run.
+
+    The set is loaded from the ``concepts`` of *source_phase* on first use and
+    replaced by each adapter whose processor returns a new concept list.
+    """
+
+    def __init__(self, source_phase: str = PhaseManager.CONSOLIDATION_PHASE) -> None:
+        self._source_phase = source_phase
+        self._concepts: Optional[List[Concept]] = None
+
+    def concepts(self, context: PhaseContext) -> List[Concept]:
+        if self._concepts is None:
+            payload = context.get(self._source_phase, {}) or {}
+            self._concepts = [
+                item if isinstance(item, Concept) else Concept.model_validate(item)
+                for item in payload.get("concepts", [])
+            ]
+        return self._concepts
+
+    def replace(self, concepts: List[Concept]) -> None:
+        self._concepts = list(concepts)
+
+
+def _focus(change_set: ChangeSet | None) -> Optional[set[str]]:
+    return None if change_set is None else change_set.ids()
+
+
+def validation_post_processor(
+    processor: ValidationProcessor,
+    working_set: ConceptWorkingSet,
+) -> PostProcessor:
+    """Validate the working set; changed concepts are those whose gate flipped."""
+
+    def run(context: PhaseContext, *, change_set: ChangeSet | None = None) -> Dict[str, Any]:
+        concepts = working_set.concepts(context)
+        outcomes = processor.process(concepts, focus=_focus(change_set))
+        return {
+            "stage": "validation",
+            "concepts": concepts,
+            "change_set": ChangeSet(modified=[outcome.concept.id for outcome in outcomes if outcome.changed]),
+            "stats": processor.stats,
+        }
+
+    return run
+
+
+def deduplication_post_processor(
+    processor: DeduplicationProcessor,
+    working_set: ConceptWorkingSet,
+) -> PostProcessor:
+    """Deduplicate the working set; winners and losers of each merge are reported."""
+
+    def run(context: PhaseContext, *, change_set: ChangeSet | None = None) -> Dict[str, Any]:
+        result = processor.process(working_set.concepts(context), focus=_focus(change_set))
+        working_set.replace(result.concepts)
+        merged = {concept_id for op in result.merge_ops for concept_id in (*op.winners, *op.losers)}
+        return {
+            "stage": "deduplication",
+            "concepts": result.concepts,
+            "merge_ops": [op.model_dump(mode="json") for op in result.merge_ops],
+            "change_set": ChangeSet(merged=merged),
+            "stats": result.stats,
+        }
+
+    return run
+
+
+def disambiguation_post_processor(
+    processor: DisambiguationProcessor,
+    working_set: ConceptWorkingSet,
+    *,
+    context_index: ContextIndex | None = None,
+) -> PostProcessor:
+    """Disambiguate the working set; split sources and their new concepts are reported."""
+
+    def run(context: PhaseContext, *, change_set: ChangeSet | None = None) -> Dict[str, Any]:
+        outcome = processor.process(working_set.concepts(context), context_index, focus=_focus(change_set))
+        working_set.replace(outcome.concepts)
+        split = {concept_id for op in outcome.split_ops for concept_id in (op.source_id, *op.new_ids)}
+        return {
+            "stage": "disambiguation",
+            "concepts": outcome.concepts,
+            "split_ops": [op.model_dump(mode="json") for op in outcome.split_ops],
+            "deferred": list(outcome.deferred),
+            "change_set": ChangeSet(split=split),
+            "stats": dict(outcome.stats),
+        }
+
+    return run
+
+
+def build_post_processors(
+    *,
+    validation: ValidationProcessor | None = None,
+    deduplication: DeduplicationProcessor | None = None,
+    disambiguation: DisambiguationProcessor | None = None,
+    context_index: ContextIndex | None = None,
+    source_phase: str = PhaseManager.CONSOLIDATION_PHASE,
+) -> List[PostProcessor]:
+    """Return adapters for the given processors sharing one working set.
+
+    Each adapter reports a :class:`ChangeSet` and receives the ids of the
+    changes it has not yet seen as its processor's ``focus``, so later
+    post-processing iterations only revisit changed concepts.
+    """
+
+    working_set = ConceptWorkingSet(source_phase)
+    adapters: List[PostProcessor] = []
+    if validation is not None:
+        adapters.append(validation_post_processor(validation, working_set))
+    if deduplication is not None:
+        adapters.append(deduplication_post_processor(deduplication, working_set))
+    if disambiguation is not None:
+        adapters.append(
+            disambiguation_post_processor(disambiguation, working_set, context_index=context_index)
+        )
+    return adapters
+
+
+def latest_concepts(history: List[Mapping[str, Any]]) -> List[Any]:
+    """Return the ``concepts`` of the most recent post-processor result reporting any."""
+
+    for iteration in reversed(history):
+        for result in reversed(iteration.get("results", [])):
+            if "concepts" in result:
+                return list(result["concepts"])
+    return []
+
+
+__all__ = [
+    "ConceptWorkingSet",
+    "build_post_processors",
+    "deduplication_post_processor",
+    "disambiguation_post_processor",
+    "latest_concepts",
+    "validation_post_processor",
+]
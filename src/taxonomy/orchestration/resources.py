@@ -0,0 +1,274 @@
+"""Per-phase resource accounting and budget enforcement."""
+
+from __future__ import annotations
+
+import gc
+import os
+import threading
+import tracemalloc
+from time import perf_counter
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from taxonomy.config.settings import PhaseResourceBudget
+from taxonomy.utils.logging import get_logger
+
+try:  # pragma: no cover - ``resource`` is unavailable on Windows
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore[assignment]
+
+_LOGGER = get_logger(module=__name__)
+
+_MB = 1024 * 1024
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+class ResourceBudgetExceeded(RuntimeError):
+    """Raised when a phase exceeds a budget configured with ``on_exceed: abort``."""
+
+    def __init__(self, phase: str, violations: List[Dict[str, Any]]) -> None:
+        details = ", ".join(f"{item['metric']}={item['value']} > {item['limit']}" for item in violations)
+        super().__init__(f"Phase '{phase}' exceeded its resource budget: {details}")
+        self.phase = phase
+        self.violations = violations
+
+
+class _GcPauseClock:
+    """Accumulates time spent inside garbage collections since installation."""
+
+    def __init__(self) -> None:
+        self.total_seconds = 0.0
+        self.collections = 0
+        self._started: Optional[float] = None
+        gc.callbacks.append(self._on_gc)
+
+    def _on_gc(self, phase: str, info: Mapping[str, Any]) -> None:
+        # Collections run under the GIL, so start/stop pairs never interleave.
+        if phase == "start":
+            self._started = perf_counter()
+        elif self._started is not None:
+            self.total_seconds += perf_counter() - self._started
+            self.collections += 1
+            self._started = None
+
+
+_GC_CLOCK: Optional[_GcPauseClock] = None
+_GC_CLOCK_LOCK = threading.Lock()
+
+
+def _gc_clock() -> _GcPauseClock:
+    global _GC_CLOCK
+    with _GC_CLOCK_LOCK:
+        if _GC_CLOCK is None:
+            _GC_CLOCK = _GcPauseClock()
+        return _GC_CLOCK
+
+
+class _TraceSession:
+    """Reference-counted :mod:`tracemalloc` use shared by concurrent monitors.
+
+    Tracing starts with the first monitor and stops with the last one, unless
+    it was already running. The interpreter's peak counter is global and only
+    reset when a session starts, so it is reported to the monitor that opened
+    the session; monitors that joined later use their sampled peak instead.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._users = 0
+        self._owned = False
+
+    def acquire(self) -> bool:
+        """Join the session; return whether the caller opened it."""
+
+        with self._lock:
+            opened = self._users == 0
+            if opened:
+                if tracemalloc.is_tracing():
+                    tracemalloc.reset_peak()
+                else:
+                    tracemalloc.start()
+                    self._owned = True
+            self._users += 1
+            return opened
+
+    def release(self, opened: bool) -> int:
+        """Leave the session and return the traced bytes: the peak if *opened*, else current."""
+
+        with self._lock:
+            current, peak = tracemalloc.get_traced_memory()
+            self._users -= 1
+            if self._users == 0 and self._owned:
+                tracemalloc.stop()
+                self._owned = False
+            return peak if opened else current
+
+
+_TRACE_SESSION = _TraceSession()
+
+
+def _current_rss() -> Optional[int]:
+    try:
+        with open("/proc/self/statm", "r", encoding="ascii") as handle:
+            return int(handle.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _io_counters() -> Tuple[Optional[int], Optional[int]]:
+    """Return bytes passed through read/write calls, or ``None`` when unknown."""
+
+    try:
+        with open("/proc/self/io", "r", encoding="ascii") as handle:
+            fields = dict(line.split(":", 1) for line in handle if ":" in line)
+        return int(fields["rchar"]), int(fields["wchar"])
+    except (OSError, ValueError, KeyError):
+        return None, None
+
+
+def _cpu_times() -> Tuple[float, float]:
+    if resource is not None:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        return usage.ru_utime, usage.ru_stime
+    times = os.times()
+    return times.user, times.system
+
+
+class ResourceMonitor:
+    """Measures process resource use while a phase runs.
+
+    CPU time, GC pauses and I/O are differences of process-wide counters, and
+    peak RSS is the largest resident set observed by a sampling thread every
+    ``sample_interval_s`` seconds. When phases overlap the figures include
+    their neighbours' work. With ``trace_allocations`` the Python heap peak is
+    also taken from :mod:`tracemalloc`, which slows allocation-heavy code.
+
+    The sampler enforces ``budget.max_peak_rss_mb`` while the phase runs: the
+    first sample over the limit logs a warning and sets :attr:`exceeded`, and
+    :meth:`check` raises :class:`ResourceBudgetExceeded` from then on when the
+    budget aborts.
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_interval_s: float = 0.05,
+        trace_allocations: bool = False,
+        budget: PhaseResourceBudget | None = None,
+        phase: str = "",
+    ) -> None:
+        self._interval = max(0.0, sample_interval_s)
+        self._trace = trace_allocations
+        self._budget = budget
+        self._phase = phase
+        self._rss_limit = None
+        if budget is not None and budget.max_peak_rss_mb is not None:
+            self._rss_limit = budget.max_peak_rss_mb * _MB
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        self._peak_rss: Optional[int] = None
+        self._trace_opened: Optional[bool] = None
+        self._traced_peak = 0
+        self._start: Dict[str, Any] = {}
+        self.exceeded = threading.Event()
+        self.usage: Dict[str, Any] = {}
+
+    def __enter__(self) -> "ResourceMonitor":
+        clock = _gc_clock()
+        self._start = {
+            "cpu": _cpu_times(),
+            "io": _io_counters(),
+            "gc": (clock.total_seconds, clock.collections),
+        }
+        if self._trace:
+            self._trace_opened = _TRACE_SESSION.acquire()
+        self._observe()
+        if self._interval > 0 and (self._peak_rss is not None or self._trace):
+            self._sampler = threading.Thread(target=self._sample, name="phase-resources", daemon=True)
+            self._sampler.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+        self._observe()
+        clock = _gc_clock()
+        user, system = _cpu_times()
+        read, written = _io_counters()
+        start_read, start_written = self._start["io"]
+        gc_seconds, gc_collections = self._start["gc"]
+        usage: Dict[str, Any] = {
+            "cpu_user_seconds": round(user - self._start["cpu"][0], 6),
+            "cpu_system_seconds": round(system - self._start["cpu"][1], 6),
+            "gc_pause_seconds": round(clock.total_seconds - gc_seconds, 6),
+            "gc_collections": clock.collections - gc_collections,
+            "io_read_bytes": None if read is None or start_read is None else read - start_read,
+            "io_write_bytes": None if written is None or start_written is None else written - start_written,
+            "peak_rss_mb": None if self._peak_rss is None else round(self._peak_rss / _MB, 3),
+        }
+        if self._trace_opened is not None:
+            traced = _TRACE_SESSION.release(self._trace_opened)
+            self._trace_opened = None
+            usage["python_peak_mb"] = round(max(self._traced_peak, traced) / _MB, 3)
+        self.usage = usage
+
+    def check(self) -> None:
+        """Raise :class:`ResourceBudgetExceeded` if an aborting budget was exceeded."""
+
+        if self.exceeded.is_set() and self._budget is not None and self._budget.on_exceed == "abort":
+            raise ResourceBudgetExceeded(self._phase, [self._rss_violation()])
+
+    def _rss_violation(self) -> Dict[str, Any]:
+        return {
+            "metric": "peak_rss_mb",
+            "limit": self._budget.max_peak_rss_mb if self._budget is not None else None,
+            "value": None if self._peak_rss is None else round(self._peak_rss / _MB, 3),
+        }
+
+    def _observe(self) -> None:
+        rss = _current_rss()
+        if rss is not None and (self._peak_rss is None or rss > self._peak_rss):
+            self._peak_rss = rss
+            if self._rss_limit is not None and rss > self._rss_limit and not self.exceeded.is_set():
+                self.exceeded.set()
+                _LOGGER.warning(
+                    "Phase exceeded resource budget while running",
+                    phase=self._phase,
+                    action=self._budget.on_exceed if self._budget is not None else "warn",
+                    **self._rss_violation(),
+                )
+        if self._trace_opened is not None:
+            self._traced_peak = max(self._traced_peak, tracemalloc.get_traced_memory()[0])
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self._interval):
+            self._observe()
+
+
+_BUDGET_METRICS = {
+    "max_peak_rss_mb": "peak_rss_mb",
+    "max_python_peak_mb": "python_peak_mb",
+    "max_cpu_seconds": "cpu_seconds",
+    "max_gc_pause_seconds": "gc_pause_seconds",
+    "max_io_bytes": "io_bytes",
+}
+
+
+def budget_violations(usage: Mapping[str, Any], budget: PhaseResourceBudget) -> List[Dict[str, Any]]:
+    """Return the limits in *budget* that *usage* exceeds; unknown metrics never violate."""
+
+    observed = dict(usage)
+    observed["cpu_seconds"] = round(usage.get("cpu_user_seconds", 0.0) + usage.get("cpu_system_seconds", 0.0), 6)
+    if usage.get("io_read_bytes") is not None and usage.get("io_write_bytes") is not None:
+        observed["io_bytes"] = usage["io_read_bytes"] + usage["io_write_bytes"]
+    violations: List[Dict[str, Any]] = []
+    for field_name, metric in _BUDGET_METRICS.items():
+        limit = getattr(budget, field_name)
+        value = observed.get(metric)
+        if limit is not None and value is not None and value > limit:
+            violations.append({"metric": metric, "limit": limit, "value": value})
+    return violations
+
+
+__all__ = ["ResourceBudgetExceeded", "ResourceMonitor", "budget_violations"]
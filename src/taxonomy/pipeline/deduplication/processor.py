@@ -6,7 +6,7 @@ import itertools
 import threading
 from time import perf_counter
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Sequence
+from typing import AbstractSet, Dict, Iterable, List, Sequence
 
 from taxonomy.config.policies import DeduplicationPolicy
 from taxonomy.entities.core import Concept, MergeOp
@@ -85,7 +85,13 @@ class DeduplicationProcessor:
         )
         return output
 
-    def _compare_block(self, block_id: str, members: Sequence[Concept], stats: Dict[str, object]) -> None:
+    def _compare_block(
+        self,
+        block_id: str,
+        members: Sequence[Concept],
+        stats: Dict[str, object],
+        focus: AbstractSet[str] | None = None,
+    ) -> None:
         comparisons = 0
         skipped_parent = 0
         skipped_threshold = 0
@@ -100,6 +106,8 @@ class DeduplicationProcessor:
                     limit=self.policy.max_comparisons_per_block,
                 )
                 break
+            if focus is not None and concept_a.id not in focus and concept_b.id not in focus:
+                continue
             comparisons += 1
             if not self.scorer.parent_compatible(concept_a, concept_b):
                 skipped_parent += 1
@@ -170,7 +178,12 @@ class DeduplicationProcessor:
         deduped = sorted(surviving.values(), key=lambda concept: concept.id)
         return deduped, merge_ops, samples
 
-    def process(self, concepts: Iterable[Concept]) -> DeduplicationResult:
+    def process(
+        self,
+        concepts: Iterable[Concept],
+        *,
+        focus: AbstractSet[str] | None = None,
+    ) -> DeduplicationResult:
         """Run the deduplication pipeline for the provided concepts.
 
         Duplicate concept IDs are detected before processing. The processor keeps
@@ -178,6 +191,10 @@ class DeduplicationProcessor:
         conflict so the caller can address the source data. Metrics for duplicate
         detection, total pair comparisons, and elapsed time are returned in the
         result stats.
+
+        When ``focus`` is given only pairs involving a focused concept are
+        compared, which limits a re-run to changed concepts and their blocking
+        neighbours.
         """
 
         with self._lock:
@@ -228,10 +245,14 @@ class DeduplicationProcessor:
                 },
             }
 
+            if focus is not None:
+                stats["focus_concepts"] = len(focus)
             for block_id, members in blocking_output.blocks.items():
                 if len(members) < 2:
                     continue
-                self._compare_block(block_id, members, stats)
+                if focus is not None and not any(member.id in focus for member in members):
+                    continue
+                self._compare_block(block_id, members, stats, focus)
 
             components = [
                 component
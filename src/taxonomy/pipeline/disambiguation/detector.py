@@ -4,8 +4,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 from dataclasses import dataclass
-from itertools import combinations
-from typing import Dict, Iterable, List, Mapping, Sequence
+from typing import AbstractSet, Dict, Iterable, Iterator, List, Mapping, Sequence
 
 from ...config.policies import DisambiguationPolicy
 from ...entities.core import Concept
@@ -32,6 +31,45 @@ class AmbiguityCandidate:
     evidence: Dict[str, object]
 
 
+def collision_key(concept: Concept) -> str:
+    """Normalized label under which concepts are grouped as potential collisions."""
+
+    return concept.canonical_label.strip().lower()
+
+
+def _encode_bitsets(groups: Sequence[Iterable[str]]) -> List[int]:
+    """Encode each set of items as an integer bitmask over the group vocabulary."""
+
+    bits: Dict[str, int] = {}
+    masks: List[int] = []
+    for items in groups:
+        mask = 0
+        for item in items:
+            bit = bits.get(item)
+            if bit is None:
+                bit = bits[item] = 1 << len(bits)
+            mask |= bit
+        masks.append(mask)
+    return masks
+
+
+def _pairwise_jaccard(masks: Sequence[int], *, empty: float) -> Iterator[float]:
+    """Yield Jaccard similarity for each pair in ``combinations`` order.
+
+    Intersections and unions are single big-integer operations, so each pair
+    costs one AND/OR and two popcounts regardless of set sizes.
+    """
+
+    counts = [mask.bit_count() for mask in masks]
+    for left_index in range(len(masks) - 1):
+        left = masks[left_index]
+        left_count = counts[left_index]
+        for right_index in range(left_index + 1, len(masks)):
+            shared = (left & masks[right_index]).bit_count()
+            union = left_count + counts[right_index] - shared
+            yield shared / union if union else empty
+
+
 class AmbiguityDetector:
     """Identify ambiguous concepts that should be considered for disambiguation."""
 
@@ -43,11 +81,12 @@ class AmbiguityDetector:
         self,
         concepts: Sequence[Concept],
         contexts: Mapping[str, Sequence[ContextWindow]] | None = None,
+        *,
+        context_tokens: Mapping[str, AbstractSet[str]] | None = None,
     ) -> List[AmbiguityCandidate]:
         grouped: Dict[str, List[Concept]] = defaultdict(list)
         for concept in concepts:
-            normalized = concept.canonical_label.strip().lower()
-            grouped[normalized].append(concept)
+            grouped[collision_key(concept)].append(concept)
 
         candidates: List[AmbiguityCandidate] = []
         for normalized_label, group in grouped.items():
@@ -63,12 +102,19 @@ class AmbiguityDetector:
                     self.stats["skipped_single_parent"] += 1
                     continue
 
-            parent_divergence = self.analyze_parent_divergence(group)
+            parent_divergence = self.analyze_parent_divergence(
+                group, stop_below=self._policy.min_parent_divergence
+            )
             if parent_divergence < self._policy.min_parent_divergence:
                 self.stats["skipped_parent_threshold"] += 1
                 continue
 
-            context_overlap = self.compute_context_overlap(group, contexts)
+            context_overlap = self.compute_context_overlap(
+                group,
+                contexts,
+                context_tokens=context_tokens,
+                stop_above=self._policy.min_context_overlap_threshold,
+            )
             context_divergence = 1.0 - min(context_overlap, 1.0)
             if context_overlap > self._policy.min_context_overlap_threshold:
                 self.stats["skipped_context_overlap"] += 1
@@ -109,82 +155,86 @@ class AmbiguityDetector:
         candidates.sort(key=lambda item: item.score, reverse=True)
         return candidates
 
-    def analyze_parent_divergence(self, concept_group: Sequence[Concept]) -> float:
+    def analyze_parent_divergence(
+        self,
+        concept_group: Sequence[Concept],
+        *,
+        stop_below: float | None = None,
+    ) -> float:
+        """Return ``1 - mean pairwise parent Jaccard`` over the group.
+
+        With ``stop_below`` the scan stops as soon as the divergence is
+        provably below that value and returns the (still lower) upper bound.
+        """
+
         if len(concept_group) < 2:
             return 0.0
-        similarities: List[float] = []
-        for left, right in combinations(concept_group, 2):
-            left_parents = set(left.parents)
-            right_parents = set(right.parents)
-            if not left_parents and not right_parents:
-                similarities.append(1.0)
-                continue
-            union = left_parents | right_parents
-            if not union:
-                similarities.append(1.0)
-                continue
-            intersection = left_parents & right_parents
-            similarities.append(len(intersection) / len(union))
-        if not similarities:
-            return 0.0
-        avg_similarity = sum(similarities) / len(similarities)
+        masks = _encode_bitsets([concept.parents for concept in concept_group])
+        pair_count = len(masks) * (len(masks) - 1) // 2
+        total = 0.0
+        for similarity in _pairwise_jaccard(masks, empty=1.0):
+            total += similarity
+            if stop_below is not None and 1.0 - total / pair_count < stop_below:
+                return max(0.0, 1.0 - total / pair_count)
+        avg_similarity = total / pair_count
         return max(0.0, min(1.0, 1.0 - avg_similarity))
 
     def compute_context_overlap(
         self,
         concept_group: Sequence[Concept],
         contexts: Mapping[str, Sequence[ContextWindow]] | None,
+        *,
+        context_tokens: Mapping[str, AbstractSet[str]] | None = None,
+        stop_above: float | None = None,
     ) -> float:
+        """Return the mean pairwise Jaccard overlap of context token sets.
+
+        With ``stop_above`` the scan stops as soon as the overlap provably
+        exceeds that value and returns the (still higher) lower bound.
+        """
+
         if not contexts:
             return 0.0
 
-        token_sets: List[set[str]] = []
+        token_sets: List[AbstractSet[str]] = []
         for concept in concept_group:
             concept_contexts = contexts.get(concept.id, [])
             if not concept_contexts:
                 continue
-            tokens = set(
-                compute_token_cooccurrence(concept_contexts, min_frequency=1).keys()
-            )
+            tokens = context_tokens.get(concept.id) if context_tokens is not None else None
+            if tokens is None:
+                tokens = set(
+                    compute_token_cooccurrence(concept_contexts, min_frequency=1).keys()
+                )
             if tokens:
                 token_sets.append(tokens)
         if len(token_sets) < 2:
             return 0.0
 
-        overlap_scores: List[float] = []
-        for left, right in combinations(token_sets, 2):
-            union = left | right
-            if not union:
-                overlap_scores.append(1.0)
-            else:
-                overlap_scores.append(len(left & right) / len(union))
-        if not overlap_scores:
-            return 0.0
-        return sum(overlap_scores) / len(overlap_scores)
+        masks = _encode_bitsets(token_sets)
+        pair_count = len(masks) * (len(masks) - 1) // 2
+        total = 0.0
+        for similarity in _pairwise_jaccard(masks, empty=1.0):
+            total += similarity
+            if stop_above is not None and total / pair_count > stop_above:
+                return total / pair_count
+        return total / pair_count
 
     def check_institution_patterns(self, concept_group: Sequence[Concept]) -> float:
         distributions = analyze_institution_distribution(concept_group)
         if not distributions:
             return 0.0
 
-        institution_sets = [set(data.keys()) for data in distributions.values() if data]
+        institution_sets = [data.keys() for data in distributions.values() if data]
         if len(institution_sets) < 2:
             return 0.0
 
-        divergences: List[float] = []
-        for left, right in combinations(institution_sets, 2):
-            if not left and not right:
-                divergences.append(0.0)
-                continue
-            union = left | right
-            if not union:
-                divergences.append(0.0)
-                continue
-            overlap = len(left & right) / len(union)
-            divergences.append(1.0 - overlap)
-        if not divergences:
-            return 0.0
-        return max(0.0, min(1.0, sum(divergences) / len(divergences)))
+        masks = _encode_bitsets(institution_sets)
+        pair_count = len(masks) * (len(masks) - 1) // 2
+        total = 0.0
+        for similarity in _pairwise_jaccard(masks, empty=1.0):
+            total += 1.0 - similarity
+        return max(0.0, min(1.0, total / pair_count))
 
     def score_ambiguity(
         self,
@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Mapping, MutableMapping, Sequence
+from typing import AbstractSet, Dict, Iterable, List, Mapping, MutableMapping, Sequence, Tuple
 
 from ...config.policies import DisambiguationPolicy
 from ...entities.core import Concept, Rationale, SplitOp, SourceRecord
-from ...utils.context_features import ContextWindow, extract_context_windows
-from .detector import AmbiguityCandidate, AmbiguityDetector
+from ...utils.context_features import (
+    ContextWindow,
+    SourceTokenIndex,
+    compute_token_cooccurrence,
+    extract_context_windows,
+)
+from .detector import AmbiguityCandidate, AmbiguityDetector, collision_key
 from .llm import LLMDisambiguationResult, LLMSenseDefinition, LLMDisambiguator
 from .splitter import ConceptSplitter, SplitDecision
 
@@ -17,6 +23,7 @@ from .splitter import ConceptSplitter, SplitDecision
 ContextSource = Sequence[SourceRecord] | Sequence[ContextWindow]
 ContextIndex = Mapping[str, ContextSource]
 CachedContexts = MutableMapping[str, List[ContextWindow]]
+GroupContexts = Dict[str, List[ContextWindow]]
 
 
 @dataclass
@@ -30,11 +37,18 @@ class DisambiguationOutcome:
 
 
 class ContextAnalyzer:
-    """Generate and cache context windows used during disambiguation."""
+    """Generate and cache context windows used during disambiguation.
+
+    Source records are tokenized once into a shared :class:`SourceTokenIndex`
+    so windows for every concept come from posting lookups, and the token set
+    of each concept's windows is cached for overlap scoring.
+    """
 
     def __init__(self, policy: DisambiguationPolicy) -> None:
         self._policy = policy
         self._cache: CachedContexts = {}
+        self._token_sets: Dict[str, AbstractSet[str]] = {}
+        self._index = SourceTokenIndex()
 
     def obtain_contexts(
         self,
@@ -54,10 +68,21 @@ class ContextAnalyzer:
                     concept,
                     sources,  # type: ignore[arg-type]
                     window_size=self._policy.context_window_size,
+                    index=self._index,
                 )
         self._cache[concept.id] = self._limit(contexts)
         return self._cache[concept.id]
 
+    def context_tokens(self, concept_id: str) -> AbstractSet[str]:
+        """Token set of the cached windows for ``concept_id``."""
+
+        tokens = self._token_sets.get(concept_id)
+        if tokens is None:
+            contexts = self._cache.get(concept_id, [])
+            tokens = frozenset(compute_token_cooccurrence(contexts, min_frequency=1)) if contexts else frozenset()
+            self._token_sets[concept_id] = tokens
+        return tokens
+
     def group_contexts(
         self,
         concept_group: Sequence[Concept],
@@ -79,6 +104,46 @@ class ContextAnalyzer:
 
     def reset(self) -> None:
         self._cache.clear()
+        self._token_sets.clear()
+        self._index.clear()
+
+
+class _ConceptOverlay:
+    """ID-indexed view over input concepts that copies a concept on first write.
+
+    Reads return the caller's objects; :meth:`writable` deep-copies a concept
+    the first time it must be mutated so inputs are never modified.
+    """
+
+    def __init__(self, concepts: Sequence[Concept]) -> None:
+        self._concepts: Dict[str, Concept] = {concept.id: concept for concept in concepts}
+        self._owned: set[str] = set()
+
+    def __getitem__(self, concept_id: str) -> Concept:
+        return self._concepts[concept_id]
+
+    def __contains__(self, concept_id: object) -> bool:
+        return concept_id in self._concepts
+
+    def get(self, concept_id: str) -> Concept | None:
+        return self._concepts.get(concept_id)
+
+    def writable(self, concept_id: str) -> Concept | None:
+        concept = self._concepts.get(concept_id)
+        if concept is None or concept_id in self._owned:
+            return concept
+        concept = concept.model_copy(deep=True)
+        self._concepts[concept_id] = concept
+        self._owned.add(concept_id)
+        return concept
+
+    def add(self, concept: Concept) -> None:
+        self._concepts[concept.id] = concept
+        self._owned.add(concept.id)
+
+    def pop(self, concept_id: str) -> Concept | None:
+        self._owned.discard(concept_id)
+        return self._concepts.pop(concept_id, None)
 
 
 class DisambiguationProcessor:
@@ -111,60 +176,110 @@ class DisambiguationProcessor:
         self,
         concepts: Iterable[Concept],
         context_index: ContextIndex | None = None,
+        *,
+        focus: AbstractSet[str] | None = None,
     ) -> DisambiguationOutcome:
+        """Detect and resolve ambiguous concepts.
+
+        When ``focus`` is given only the label groups containing a focused
+        concept are examined: contexts are extracted and collisions detected
+        for those concepts alone, and every other concept passes through
+        unchanged. A re-run thus covers changed concepts and the concepts
+        sharing their label.
+        """
+
         self._context_analyzer.reset()
-        concept_copies = [concept.model_copy(deep=True) for concept in concepts]
+        # Inputs are read in place; only concepts that get deferred are copied
+        # (see _ConceptOverlay) and split outputs are always new objects.
+        input_concepts = list(concepts)
+        examined = input_concepts
+        if focus is not None:
+            focused_labels = {collision_key(concept) for concept in input_concepts if concept.id in focus}
+            examined = [concept for concept in input_concepts if collision_key(concept) in focused_labels]
         context_indexed_sources = {
             concept.id: self._context_analyzer.obtain_contexts(
                 concept,
                 context_index.get(concept.id) if context_index else None,
             )
-            for concept in concept_copies
+            for concept in examined
         }
 
         candidates = self._detector.detect_collisions(
-            concept_copies, context_indexed_sources
+            examined,
+            context_indexed_sources,
+            context_tokens={
+                concept_id: self._context_analyzer.context_tokens(concept_id)
+                for concept_id in context_indexed_sources
+            },
         )
         self.stats.update(self._detector.stats)
 
-        concept_map: Dict[str, Concept] = {concept.id: concept for concept in concept_copies}
-        ordered_ids: List[str] = [concept.id for concept in concept_copies]
+        concept_map = _ConceptOverlay(input_concepts)
+        ordered_ids: List[str] = [concept.id for concept in input_concepts]
         split_ops: List[SplitOp] = []
         deferred: List[str] = []
 
-        for candidate in candidates:
+        # Candidates cover disjoint label groups, so their LLM checks are
+        # independent; decisions are still applied in candidate order.
+        checks = self._check_separability(candidates, context_index)
+        for candidate, (group_contexts, llm_result) in zip(candidates, checks):
             deferred_ids = self._process_candidate(
                 candidate,
                 concept_map,
                 ordered_ids,
                 split_ops,
-                context_index,
+                group_contexts,
+                llm_result,
             )
             deferred.extend(deferred_ids)
 
         rehydrated = [concept_map[concept_id] for concept_id in ordered_ids]
         return DisambiguationOutcome(rehydrated, split_ops, deferred, dict(self.stats))
 
+    def _check_separability(
+        self,
+        candidates: Sequence[AmbiguityCandidate],
+        context_index: ContextIndex | None,
+    ) -> List[Tuple[GroupContexts, LLMDisambiguationResult]]:
+        """Gather contexts, then run separability checks on a bounded thread pool.
+
+        Results are returned in candidate order.
+        """
+
+        group_contexts = [
+            self._context_analyzer.group_contexts(candidate.concepts, context_index)
+            for candidate in candidates
+        ]
+
+        def check(candidate: AmbiguityCandidate, contexts: GroupContexts) -> LLMDisambiguationResult:
+            return self._disambiguator.check_separability(
+                candidate.label,
+                candidate.concepts[0].level,
+                candidate.concepts,
+                contexts,
+            )
+
+        limit = self._policy.llm_max_concurrency
+        if limit <= 1 or len(candidates) <= 1:
+            results = [check(candidate, contexts) for candidate, contexts in zip(candidates, group_contexts)]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(limit, len(candidates)), thread_name_prefix="disambiguation-llm"
+            ) as executor:
+                results = list(executor.map(check, candidates, group_contexts))
+        return list(zip(group_contexts, results))
+
     def _process_candidate(
         self,
         candidate: AmbiguityCandidate,
-        concept_map: Dict[str, Concept],
+        concept_map: _ConceptOverlay,
         ordered_ids: List[str],
         split_ops: List[SplitOp],
-        context_index: ContextIndex | None,
+        group_contexts: GroupContexts,
+        llm_result: LLMDisambiguationResult,
     ) -> List[str]:
         candidate_deferred: List[str] = []
         self.stats["collisions_processed"] += 1
-        group_contexts = self._context_analyzer.group_contexts(
-            candidate.concepts, context_index
-        )
-
-        llm_result = self._disambiguator.check_separability(
-            candidate.label,
-            candidate.concepts[0].level,
-            candidate.concepts,
-            group_contexts,
-        )
         split_confidence = self._disambiguator.assess_split_confidence(
             llm_result.confidence,
             candidate.context_divergence,
@@ -230,11 +345,11 @@ class DisambiguationProcessor:
 
         removed_ids = {concept.id for concept in candidate.concepts}
         for concept_id in removed_ids:
-            concept_map.pop(concept_id, None)
+            concept_map.pop(concept_id)
         ordered_ids[:] = [cid for cid in ordered_ids if cid not in removed_ids]
 
         for new_concept in split_decision.new_concepts:
-            concept_map[new_concept.id] = new_concept
+            concept_map.add(new_concept)
             ordered_ids.append(new_concept.id)
 
         split_ops.append(split_decision.split_op)
@@ -271,12 +386,12 @@ class DisambiguationProcessor:
         self,
         reason: str,
         concepts: Sequence[Concept],
-        concept_map: Dict[str, Concept],
+        concept_map: _ConceptOverlay,
         deferred: List[str],
     ) -> bool:
         appended = False
         for concept in concepts:
-            tracked_concept = concept_map.get(concept.id)
+            tracked_concept = concept_map.writable(concept.id)
             if tracked_concept is None:
                 continue
             self._mark_deferred(tracked_concept, reason)
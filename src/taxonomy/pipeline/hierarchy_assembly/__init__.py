@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from .ancestry import AncestryIndex
 from .assembler import HierarchyAssembler, HierarchyAssemblyResult
 from .graph import HierarchyGraph
 from .main import assemble_hierarchy
@@ -9,6 +10,7 @@ from .validator import GraphValidator, InvariantChecker, ValidationReport
 
 __all__ = [
     "assemble_hierarchy",
+    "AncestryIndex",
     "HierarchyAssembler",
     "HierarchyAssemblyResult",
     "HierarchyGraph",
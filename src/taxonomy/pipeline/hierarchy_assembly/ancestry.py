@@ -0,0 +1,195 @@
+"""Precomputed ancestor/descendant queries over an assembled hierarchy."""
+
+from __future__ import annotations
+
+from array import array
+from typing import Dict, Iterator, List, Mapping, Sequence, Tuple
+
+
+def _set_bits(mask: int) -> Iterator[int]:
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class AncestryIndex:
+    """Interval labelling of the primary spanning forest plus a closure fallback.
+
+    Every node keeps one primary parent (its lexicographically smallest
+    parent) and nodes are numbered in depth-first pre-order over that forest,
+    so the descendants of a node occupy the contiguous position range
+    ``[position, exit)``. Nodes with several parents, and everything beneath
+    them, additionally carry a bitmap of all their ancestors so ancestor tests
+    stay exact for allowed multi-parent exceptions.
+    """
+
+    def __init__(
+        self,
+        ids: Sequence[str],
+        exits: array,
+        parents: array,
+        closure: Mapping[int, int],
+    ) -> None:
+        self._ids: List[str] = list(ids)
+        self._position: Dict[str, int] = {concept_id: index for index, concept_id in enumerate(self._ids)}
+        self._exits = exits
+        self._parents = parents
+        self._closure: Dict[int, int] = dict(closure)
+        self._extra_descendants: Dict[int, List[int]] = {}
+        for descendant, mask in sorted(self._closure.items()):
+            for ancestor in _set_bits(mask):
+                if not self._within(ancestor, descendant):
+                    self._extra_descendants.setdefault(ancestor, []).append(descendant)
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+    @classmethod
+    def build(
+        cls,
+        ids: Sequence[str],
+        topological_order: Sequence[int],
+        parent_lists: Sequence[Sequence[int]],
+    ) -> "AncestryIndex":
+        """Label a DAG given node ids, a topological order and per-node parents."""
+
+        node_count = len(ids)
+        primary = [min(parents, key=ids.__getitem__) if parents else -1 for parents in parent_lists]
+        tree_children: List[List[int]] = [[] for _ in range(node_count)]
+        roots: List[int] = []
+        for node in topological_order:
+            if primary[node] < 0:
+                roots.append(node)
+            else:
+                tree_children[primary[node]].append(node)
+
+        position = [0] * node_count
+        exits = array("I", bytes(node_count * array("I").itemsize))
+        ordered: List[int] = []
+        stack: List[Tuple[int, bool]] = [(root, False) for root in sorted(roots, key=ids.__getitem__, reverse=True)]
+        while stack:
+            node, finished = stack.pop()
+            if finished:
+                exits[position[node]] = len(ordered)
+                continue
+            position[node] = len(ordered)
+            ordered.append(node)
+            stack.append((node, True))
+            stack.extend((child, False) for child in sorted(tree_children[node], key=ids.__getitem__, reverse=True))
+
+        parents = array("i", (position[primary[node]] if primary[node] >= 0 else -1 for node in ordered))
+        closure: Dict[int, int] = {}
+        for node in topological_order:
+            node_parents = parent_lists[node]
+            if len(node_parents) < 2 and (primary[node] < 0 or position[primary[node]] not in closure):
+                continue
+            mask = 0
+            for parent in node_parents:
+                parent_position = position[parent]
+                inherited = closure.get(parent_position)
+                if inherited is None:
+                    inherited = 0
+                    cursor = parent_position
+                    while cursor >= 0:
+                        inherited |= 1 << cursor
+                        cursor = parents[cursor]
+                else:
+                    inherited |= 1 << parent_position
+                mask |= inherited
+            closure[position[node]] = mask
+        return cls([ids[node] for node in ordered], exits, parents, closure)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def __contains__(self, concept_id: str) -> bool:  # pragma: no cover - trivial
+        return concept_id in self._position
+
+    def __len__(self) -> int:  # pragma: no cover - trivial
+        return len(self._ids)
+
+    def _within(self, ancestor: int, descendant: int) -> bool:
+        return ancestor < descendant < self._exits[ancestor]
+
+    def _require(self, concept_id: str) -> int:
+        position = self._position.get(concept_id)
+        if position is None:
+            raise KeyError(f"concept '{concept_id}' is not part of the ancestry index")
+        return position
+
+    def is_ancestor(self, ancestor_id: str, descendant_id: str) -> bool:
+        """Return ``True`` when ``ancestor_id`` is a strict ancestor of ``descendant_id``."""
+
+        ancestor = self._position.get(ancestor_id)
+        descendant = self._position.get(descendant_id)
+        if ancestor is None or descendant is None:
+            return False
+        if self._within(ancestor, descendant):
+            return True
+        return bool(self._closure.get(descendant, 0) >> ancestor & 1)
+
+    def path_to_root(self, concept_id: str) -> List[str]:
+        """Return the primary lineage from ``concept_id`` up to its root."""
+
+        path: List[str] = []
+        cursor = self._require(concept_id)
+        while cursor >= 0:
+            path.append(self._ids[cursor])
+            cursor = self._parents[cursor]
+        return path
+
+    def depth(self, concept_id: str) -> int:
+        return len(self.path_to_root(concept_id)) - 1
+
+    def subtree_range(self, concept_id: str) -> Tuple[int, int]:
+        """Return the ``[start, stop)`` pre-order range of the primary subtree."""
+
+        position = self._require(concept_id)
+        return position, self._exits[position]
+
+    def subtree(self, concept_id: str) -> List[str]:
+        """Return ``concept_id`` and every descendant, primary subtree first."""
+
+        start, stop = self.subtree_range(concept_id)
+        members = self._ids[start:stop]
+        members.extend(self._ids[extra] for extra in self._extra_descendants.get(start, []))
+        return members
+
+    def subtree_size(self, concept_id: str) -> int:
+        start, stop = self.subtree_range(concept_id)
+        return stop - start + len(self._extra_descendants.get(start, []))
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def to_dict(self) -> dict:
+        return {
+            "ids": list(self._ids),
+            "exit": self._exits.tolist(),
+            "parent": self._parents.tolist(),
+            "multi_parent_ancestors": {
+                self._ids[descendant]: [self._ids[ancestor] for ancestor in _set_bits(mask)]
+                for descendant, mask in sorted(self._closure.items())
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, object]) -> "AncestryIndex":
+        ids = list(payload["ids"])  # type: ignore[arg-type]
+        position = {concept_id: index for index, concept_id in enumerate(ids)}
+        closure: Dict[int, int] = {}
+        for descendant, ancestors in dict(payload.get("multi_parent_ancestors") or {}).items():
+            mask = 0
+            for ancestor in ancestors:
+                mask |= 1 << position[ancestor]
+            closure[position[descendant]] = mask
+        return cls(
+            ids,
+            array("I", payload["exit"]),  # type: ignore[arg-type]
+            array("i", payload["parent"]),  # type: ignore[arg-type]
+            closure,
+        )
+
+
+__all__ = ["AncestryIndex"]
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Sequence, Tuple
+from itertools import groupby
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
 
 from taxonomy.config.policies import HierarchyAssemblyPolicy
 from taxonomy.entities.core import Concept
 from taxonomy.utils.logging import get_logger
 
+from .ancestry import AncestryIndex
 from .graph import HierarchyGraph
 from .validator import GraphValidator, InvariantChecker, ValidationReport
 
@@ -24,6 +26,7 @@ class HierarchyAssemblyResult:
     manifest: dict
     orphans: List[dict] = field(default_factory=list)
     placeholders: List[str] = field(default_factory=list)
+    ancestry: AncestryIndex | None = None
 
     def to_manifest(self) -> dict:
         return dict(self.manifest)
@@ -39,6 +42,7 @@ class HierarchyAssembler:
         self._validator = GraphValidator(self._checker)
         self._orphans: List[dict] = []
         self._placeholders: Dict[int, str] = {}
+        self._staged: Set[str] = set()
 
     @property
     def graph(self) -> HierarchyGraph:
@@ -63,70 +67,108 @@ class HierarchyAssembler:
     ) -> HierarchyAssemblyResult:
         self.process_concepts(concepts)
         validation_report = self._validator.run(self._graph)
-        manifest = self.generate_manifest(validation_report, config_snapshot=config_snapshot)
+        ancestry = self.build_ancestry() if self._policy.include_ancestry_index else None
+        manifest = self.generate_manifest(
+            validation_report,
+            config_snapshot=config_snapshot,
+            ancestry=ancestry,
+        )
         return HierarchyAssemblyResult(
             graph=self._graph,
             validation_report=validation_report,
             manifest=manifest,
             orphans=self.orphans,
             placeholders=self.placeholders,
+            ancestry=ancestry,
         )
 
+    def build_ancestry(self) -> AncestryIndex | None:
+        """Build the ancestor index, or return ``None`` when the graph has a cycle."""
+
+        try:
+            return self._graph.ancestry()
+        except ValueError as exc:
+            _LOGGER.warning("Skipping ancestry index for cyclic hierarchy", error=str(exc))
+            return None
+
     # ------------------------------------------------------------------
     # Concept ingestion pipeline
     # ------------------------------------------------------------------
     def process_concepts(self, concepts: Sequence[Concept]) -> None:
+        """Insert concepts level by level, committing each level as one batch.
+
+        Concepts on the same level cannot depend on each other, so a level is
+        resolved against the graph built so far, validated in bulk and then
+        committed together. Orphan records keep the order a one-at-a-time
+        insertion would have produced.
+        """
+
         ordered = sorted(concepts, key=lambda concept: (concept.level, concept.id))
-        for concept in ordered:
-            resolved_parents, missing = self.resolve_parents(concept)
-            working = concept
-            if missing:
-                strategy = self._policy.orphan_strategy
-                self._record_orphan(concept, missing, strategy)
-                if strategy == "drop":
-                    _LOGGER.warning(
-                        "Dropping concept due to missing parents",
-                        concept_id=concept.id,
-                        missing=missing,
-                    )
+        for _, level_concepts in groupby(ordered, key=lambda concept: concept.level):
+            batch: List[Concept] = []
+            slots: Dict[int, int] = {}
+            for concept in level_concepts:
+                working = self._prepare_concept(concept)
+                if working is None:
                     continue
-                if strategy == "quarantine":
-                    _LOGGER.info(
-                        "Quarantining concept with unresolved parents",
-                        concept_id=concept.id,
-                        missing=missing,
-                    )
-                    continue
-                if strategy == "attach_placeholder":
-                    if concept.level == 0:
-                        _LOGGER.warning(
-                            "Skipping placeholder attachment for root-level orphan",
-                            concept_id=concept.id,
-                            missing=missing,
-                        )
-                        continue
-                    placeholder_parent = self._ensure_placeholder(concept.level - 1)
-                    updated_parents = list(resolved_parents)
-                    updated_parents.append(placeholder_parent)
-                    working = concept.model_copy(update={"parents": updated_parents})
-            elif resolved_parents and len(resolved_parents) != len(set(resolved_parents)):
-                working = concept.model_copy(update={"parents": sorted(set(resolved_parents))})
-
-            try:
-                self._graph.add_concept(working)
-            except ValueError as exc:
+                slots[id(working)] = len(self._orphans)
+                self._staged.add(working.id)
+                batch.append(working)
+            rejected = self._graph.add_concepts(batch)
+            self._staged.clear()
+            for working, exc in reversed(rejected):
                 _LOGGER.error(
                     "Failed to insert concept into hierarchy",
                     concept_id=working.id,
                     error=str(exc),
                 )
-                self._record_orphan(working, list(working.parents), "error")
+                self._orphans.insert(
+                    slots[id(working)],
+                    self._orphan_record(working, list(working.parents), "error"),
+                )
+
+    def _prepare_concept(self, concept: Concept) -> Concept | None:
+        """Apply the orphan strategy; return the concept to insert or ``None``."""
+
+        resolved_parents, missing = self.resolve_parents(concept)
+        if missing:
+            strategy = self._policy.orphan_strategy
+            self._record_orphan(concept, missing, strategy)
+            if strategy == "drop":
+                _LOGGER.warning(
+                    "Dropping concept due to missing parents",
+                    concept_id=concept.id,
+                    missing=missing,
+                )
+                return None
+            if strategy == "quarantine":
+                _LOGGER.info(
+                    "Quarantining concept with unresolved parents",
+                    concept_id=concept.id,
+                    missing=missing,
+                )
+                return None
+            if strategy == "attach_placeholder":
+                if concept.level == 0:
+                    _LOGGER.warning(
+                        "Skipping placeholder attachment for root-level orphan",
+                        concept_id=concept.id,
+                        missing=missing,
+                    )
+                    return None
+                placeholder_parent = self._ensure_placeholder(concept.level - 1)
+                updated_parents = list(resolved_parents)
+                updated_parents.append(placeholder_parent)
+                return concept.model_copy(update={"parents": updated_parents})
+        elif resolved_parents and len(resolved_parents) != len(set(resolved_parents)):
+            return concept.model_copy(update={"parents": sorted(set(resolved_parents))})
+        return concept
 
     def resolve_parents(self, concept: Concept) -> Tuple[List[str], List[str]]:
         resolved: List[str] = []
         missing: List[str] = []
         for parent_id in concept.parents:
-            if parent_id in self._graph:
+            if parent_id in self._graph or parent_id in self._staged:
                 resolved.append(parent_id)
             else:
                 missing.append(parent_id)
@@ -138,14 +180,20 @@ class HierarchyAssembler:
         missing_parents: Sequence[str],
         strategy: str,
     ) -> None:
-        self._orphans.append(
-            {
-                "concept_id": concept.id,
-                "level": concept.level,
-                "missing_parents": list(missing_parents),
-                "strategy": strategy,
-            }
-        )
+        self._orphans.append(self._orphan_record(concept, missing_parents, strategy))
+
+    @staticmethod
+    def _orphan_record(
+        concept: Concept,
+        missing_parents: Sequence[str],
+        strategy: str,
+    ) -> dict:
+        return {
+            "concept_id": concept.id,
+            "level": concept.level,
+            "missing_parents": list(missing_parents),
+            "strategy": strategy,
+        }
 
     # ------------------------------------------------------------------
     # Placeholder management
@@ -190,6 +238,7 @@ class HierarchyAssembler:
         validation_report: ValidationReport,
         *,
         config_snapshot: dict | None,
+        ancestry: AncestryIndex | None = None,
     ) -> dict:
         manifest = {
             "policy": self._policy.model_dump(mode="json"),
@@ -198,6 +247,8 @@ class HierarchyAssembler:
             "orphans": self.orphans,
             "placeholders": self.placeholders,
         }
+        if ancestry is not None:
+            manifest["ancestry"] = ancestry.to_dict()
         if config_snapshot:
             manifest["config"] = dict(config_snapshot)
         return manifest
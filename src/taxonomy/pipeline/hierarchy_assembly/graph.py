@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-from collections import defaultdict, deque
+from array import array
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict, Iterable, Iterator, List, MutableMapping, Set
+from typing import Dict, Iterator, List, Mapping, Sequence, Tuple
 
 from taxonomy.config.policies import HierarchyAssemblyPolicy
 from taxonomy.entities.core import Concept
 from taxonomy.utils.logging import get_logger
 
+from .ancestry import AncestryIndex
+
 _LOGGER = get_logger(module=__name__)
 
 
@@ -24,40 +27,64 @@ class EdgeValidationResult:
 
 
 class HierarchyGraph:
-    """In-memory representation of a 4-level directed acyclic graph."""
+    """In-memory representation of a 4-level directed acyclic graph.
+
+    Concept IDs are interned to dense integers on insertion. Levels and
+    degree counters live in typed arrays and edges are appended to a pair of
+    parallel arrays; compressed sparse row (CSR) views for children and
+    parents are rebuilt from those arrays on the first traversal after a
+    mutation. Graph-wide checks therefore walk flat integer arrays and only
+    touch :class:`Concept` objects when a caller asks for one.
+    """
 
     def __init__(self, policy: HierarchyAssemblyPolicy) -> None:
         self._policy = policy
-        self._nodes: Dict[str, Concept] = {}
-        self._children: MutableMapping[str, Set[str]] = defaultdict(set)
-        self._parents: MutableMapping[str, Set[str]] = defaultdict(set)
-        self._levels: MutableMapping[int, Set[str]] = defaultdict(set)
+        self._index: Dict[str, int] = {}
+        self._ids: List[str] = []
+        self._concepts: List[Concept] = []
+        self._levels = array("b")
+        self._in_degree = array("I")
+        self._out_degree = array("I")
+        self._level_counts = array("I", [0, 0, 0, 0])
+        self._edge_parents = array("I")
+        self._edge_children = array("I")
+        self._children_csr: _CSR | None = None
+        self._parents_csr: _CSR | None = None
+        self._topological: List[int] | None = None
+        self._ancestry: AncestryIndex | None = None
 
     # ------------------------------------------------------------------
     # Introspection helpers
     # ------------------------------------------------------------------
     def __contains__(self, concept_id: str) -> bool:  # pragma: no cover - trivial
-        return concept_id in self._nodes
+        return concept_id in self._index
 
     def __len__(self) -> int:  # pragma: no cover - trivial
-        return len(self._nodes)
+        return len(self._ids)
 
     @property
     def policy(self) -> HierarchyAssemblyPolicy:
         return self._policy
 
     def concepts(self) -> Iterator[Concept]:
-        for concept in self._nodes.values():
+        for concept in self._concepts:
             yield concept
 
     def get(self, concept_id: str) -> Concept | None:
-        return self._nodes.get(concept_id)
+        node = self._index.get(concept_id)
+        return None if node is None else self._concepts[node]
 
     def children_of(self, concept_id: str) -> List[str]:
-        return sorted(self._children.get(concept_id, set()))
+        node = self._index.get(concept_id)
+        if node is None:
+            return []
+        return sorted(self._ids[child] for child in self._children().neighbours(node))
 
     def parents_of(self, concept_id: str) -> List[str]:
-        return sorted(self._parents.get(concept_id, set()))
+        node = self._index.get(concept_id)
+        if node is None:
+            return []
+        return sorted(self._ids[parent] for parent in self._parents().neighbours(node))
 
     # ------------------------------------------------------------------
     # Mutation
@@ -65,68 +92,142 @@ class HierarchyGraph:
     def add_concept(self, concept: Concept) -> None:
         """Insert a concept into the graph enforcing policy invariants."""
 
-        if concept.id in self._nodes:
-            raise ValueError(f"concept '{concept.id}' already exists in the hierarchy")
-        if len(self._nodes) >= self._policy.max_graph_size:
+        parent_nodes = self._resolve(concept, {})
+        self._commit([(concept, parent_nodes)])
+        _LOGGER.debug("Inserted concept into hierarchy", concept_id=concept.id, level=concept.level)
+
+    def add_concepts(self, concepts: Sequence[Concept]) -> List[Tuple[Concept, ValueError]]:
+        """Validate a batch of concepts and commit the accepted ones together.
+
+        Each concept is checked exactly as :meth:`add_concept` would check it
+        at its position in ``concepts`` (earlier accepted concepts count as
+        present), but nothing touches the graph until the whole batch has
+        been validated. Rejected concepts are returned with the error that
+        :meth:`add_concept` would have raised.
+        """
+
+        staged: Dict[str, Tuple[int, int]] = {}
+        accepted: List[Tuple[Concept, List[int]]] = []
+        rejected: List[Tuple[Concept, ValueError]] = []
+        base = len(self._ids)
+        for concept in concepts:
+            try:
+                parent_nodes = self._resolve(concept, staged)
+            except ValueError as exc:
+                rejected.append((concept, exc))
+                continue
+            staged[concept.id] = (base + len(accepted), concept.level)
+            accepted.append((concept, parent_nodes))
+        self._commit(accepted)
+        _LOGGER.debug(
+            "Inserted concept batch into hierarchy",
+            accepted=len(accepted),
+            rejected=len(rejected),
+        )
+        return rejected
+
+    def _resolve(self, concept: Concept, staged: Mapping[str, Tuple[int, int]]) -> List[int]:
+        """Validate ``concept`` and return its parent node indices.
+
+        Parent levels are read from the level array, so validation never
+        touches parent :class:`Concept` objects. ``staged`` maps concepts
+        accepted earlier in the same batch to ``(node, level)``.
+        """
+
+        concept_id = concept.id
+        if concept_id in self._index or concept_id in staged:
+            raise ValueError(f"concept '{concept_id}' already exists in the hierarchy")
+        if len(self._ids) + len(staged) >= self._policy.max_graph_size:
             raise ValueError(
-                f"max_graph_size={self._policy.max_graph_size} exceeded while inserting '{concept.id}'"
+                f"max_graph_size={self._policy.max_graph_size} exceeded while inserting '{concept_id}'"
             )
         if concept.level < 0 or concept.level > 3:
-            raise ValueError(f"concept '{concept.id}' declares invalid level {concept.level}")
+            raise ValueError(f"concept '{concept_id}' declares invalid level {concept.level}")
 
         unique_parents = list(dict.fromkeys(concept.parents))
-        parent_concepts: List[Concept] = []
+        parent_nodes: List[int] = []
         for parent_id in unique_parents:
-            parent = self._nodes.get(parent_id)
-            if parent is None:
+            parent_node = self._index.get(parent_id)
+            if parent_node is not None:
+                parent_level = self._levels[parent_node]
+            elif parent_id in staged:
+                parent_node, parent_level = staged[parent_id]
+            else:
                 raise ValueError(
-                    f"concept '{concept.id}' references missing parent '{parent_id}'"
+                    f"concept '{concept_id}' references missing parent '{parent_id}'"
                 )
-            self._validate_edge(parent, concept)
-            parent_concepts.append(parent)
+            self._check_edge(parent_id, parent_level, concept_id, concept.level)
+            parent_nodes.append(parent_node)
 
         if (
             self._policy.enforce_unique_paths
             and len(unique_parents) > 1
-            and concept.id not in set(self._policy.allow_multi_parent_exceptions)
+            and concept_id not in set(self._policy.allow_multi_parent_exceptions)
         ):
             raise ValueError(
-                f"concept '{concept.id}' violates unique path invariant with parents {unique_parents}"
+                f"concept '{concept_id}' violates unique path invariant with parents {unique_parents}"
             )
 
-        concept.validate_hierarchy(parent_concepts)
-
-        self._nodes[concept.id] = concept
-        self._levels[concept.level].add(concept.id)
-
-        if not unique_parents:
-            self._parents.setdefault(concept.id, set())
-        else:
-            store = self._parents.setdefault(concept.id, set())
-            for parent_id in unique_parents:
-                store.add(parent_id)
-                self._children[parent_id].add(concept.id)
-        self._children.setdefault(concept.id, set())
-        _LOGGER.debug("Inserted concept into hierarchy", concept_id=concept.id, level=concept.level)
+        # Parent levels were already checked edge by edge above.
+        concept.validate_hierarchy()
+        return parent_nodes
+
+    def _commit(self, accepted: Sequence[Tuple[Concept, List[int]]]) -> None:
+        """Append validated concepts and their edges in one step."""
+
+        if not accepted:
+            return
+        base = len(self._ids)
+        new_ids = [concept.id for concept, _ in accepted]
+        self._index.update(zip(new_ids, range(base, base + len(new_ids))))
+        self._ids.extend(new_ids)
+        self._concepts.extend(concept for concept, _ in accepted)
+        self._levels.extend(concept.level for concept, _ in accepted)
+        self._in_degree.extend(len(parent_nodes) for _, parent_nodes in accepted)
+        self._out_degree.extend(bytes(len(accepted) * self._out_degree.itemsize))
+        out_degree = self._out_degree
+        for node, (concept, parent_nodes) in enumerate(accepted, start=base):
+            self._level_counts[concept.level] += 1
+            for parent_node in parent_nodes:
+                out_degree[parent_node] += 1
+                self._edge_parents.append(parent_node)
+                self._edge_children.append(node)
+        self._children_csr = None
+        self._parents_csr = None
+        self._topological = None
+        self._ancestry = None
+
+    def _children(self) -> _CSR:
+        if self._children_csr is None:
+            self._children_csr = _CSR.build(len(self._ids), self._edge_parents, self._edge_children)
+        return self._children_csr
+
+    def _parents(self) -> _CSR:
+        if self._parents_csr is None:
+            self._parents_csr = _CSR.build(len(self._ids), self._edge_children, self._edge_parents)
+        return self._parents_csr
 
     def _validate_edge(self, parent: Concept, child: Concept) -> EdgeValidationResult:
         """Validate a potential edge according to policy constraints."""
 
-        if child.level <= parent.level:
+        self._check_edge(parent.id, parent.level, child.id, child.level)
+        return EdgeValidationResult(parent.id, child.id, True)
+
+    def _check_edge(self, parent_id: str, parent_level: int, child_id: str, child_level: int) -> None:
+        if child_level <= parent_level:
             raise ValueError(
-                f"edge {parent.id}->{child.id} violates level ordering: {parent.level} !< {child.level}"
+                f"edge {parent_id}->{child_id} violates level ordering: {parent_level} !< {child_level}"
             )
         if self._policy.strict_level_enforcement and not self._policy.allow_level_shortcuts:
-            if child.level - parent.level != 1:
+            if child_level - parent_level != 1:
                 raise ValueError(
-                    f"edge {parent.id}->{child.id} violates strict level progression"
+                    f"edge {parent_id}->{child_id} violates strict level progression"
                 )
         if not self._policy.strict_level_enforcement:
-            if child.level - parent.level <= 0:
+            if child_level - parent_level <= 0:
                 raise ValueError(
-                    f"edge {parent.id}->{child.id} must progress to a deeper level"
+                    f"edge {parent_id}->{child_id} must progress to a deeper level"
                 )
-        return EdgeValidationResult(parent.id, child.id, True)
 
     # ------------------------------------------------------------------
     # Analytics & validation helpers
@@ -135,24 +236,51 @@ class HierarchyGraph:
         """Return a topological ordering or raise when cycles exist."""
 
         if not self._policy.enforce_acyclicity:
-            return [concept_id for concept_id in self._nodes]
-
-        in_degree = {node: len(self._parents.get(node, set())) for node in self._nodes}
-        queue = deque(node for node, degree in in_degree.items() if degree == 0)
-        visited: List[str] = []
+            return list(self._ids)
+        ids = self._ids
+        return [ids[node] for node in self._topological_nodes()]
+
+    def _topological_nodes(self) -> List[int]:
+        if self._topological is not None:
+            return self._topological
+        children = self._children()
+        offsets, targets = children.offsets, children.targets
+        in_degree = array("I", self._in_degree)
+        queue = deque(node for node, degree in enumerate(in_degree) if degree == 0)
+        visited: List[int] = []
 
         while queue:
             node = queue.popleft()
             visited.append(node)
-            for child in self._children.get(node, set()):
+            for position in range(offsets[node], offsets[node + 1]):
+                child = targets[position]
                 in_degree[child] -= 1
                 if in_degree[child] == 0:
                     queue.append(child)
 
-        if len(visited) != len(self._nodes):
+        if len(visited) != len(self._ids):
             raise ValueError("hierarchy graph contains a cycle")
+        self._topological = visited
         return visited
 
+    def ancestry(self) -> AncestryIndex:
+        """Return the ancestor/descendant index, building it on first use.
+
+        The index is derived from a topological ordering, so it raises the
+        same ``ValueError`` as :meth:`check_acyclicity` when a cycle exists.
+        It is discarded whenever the graph is mutated.
+        """
+
+        if self._ancestry is None:
+            order = self._topological_nodes()
+            parents = self._parents()
+            self._ancestry = AncestryIndex.build(
+                self._ids,
+                order,
+                [parents.neighbours(node) for node in range(len(self._ids))],
+            )
+        return self._ancestry
+
     def check_unique_paths(self) -> List[str]:
         """Return concept IDs that violate the unique path invariant."""
 
@@ -161,53 +289,87 @@ class HierarchyGraph:
 
         violations: List[str] = []
         allowed = set(self._policy.allow_multi_parent_exceptions)
-        for concept_id, parents in self._parents.items():
-            if self._nodes[concept_id].level == 0:
-                continue
-            if not parents:
-                violations.append(concept_id)
+        ids = self._ids
+        for node, (level, degree) in enumerate(zip(self._levels, self._in_degree)):
+            if level == 0 or degree == 1:
                 continue
-            if len(parents) > 1 and concept_id not in allowed:
-                violations.append(concept_id)
+            if degree == 0 or ids[node] not in allowed:
+                violations.append(ids[node])
         return violations
 
     def find_orphans(self) -> List[dict]:
         """Identifies nodes that lack valid parents for their level."""
 
-        orphans: List[dict] = []
-        for concept in self._nodes.values():
-            parents = self._parents.get(concept.id, set())
-            if concept.level == 0:
-                continue
-            if not parents:
-                orphans.append(
-                    {
-                        "concept_id": concept.id,
-                        "level": concept.level,
-                        "reason": "missing-parent",
-                    }
-                )
-        return orphans
+        ids = self._ids
+        return [
+            {
+                "concept_id": ids[node],
+                "level": level,
+                "reason": "missing-parent",
+            }
+            for node, (level, degree) in enumerate(zip(self._levels, self._in_degree))
+            if level != 0 and degree == 0
+        ]
 
     def statistics(self) -> Dict[str, object]:
         """Return structural statistics for observability and manifests."""
 
-        edge_count = sum(len(children) for children in self._children.values())
-        out_degrees = [len(children) for children in self._children.values()]
-        in_degrees = [len(parents) for parents in self._parents.values()]
         stats = {
-            "node_count": len(self._nodes),
-            "edge_count": edge_count,
-            "level_counts": {level: len(nodes) for level, nodes in sorted(self._levels.items())},
-            "max_out_degree": max(out_degrees, default=0),
-            "max_in_degree": max(in_degrees, default=0),
+            "node_count": len(self._ids),
+            "edge_count": len(self._edge_children),
+            "level_counts": {
+                level: count for level, count in enumerate(self._level_counts) if count
+            },
+            "max_out_degree": max(self._out_degree, default=0),
+            "max_in_degree": max(self._in_degree, default=0),
         }
         return stats
 
     def adjacency(self) -> Dict[str, List[str]]:
         """Return adjacency mapping for export utilities."""
 
-        return {node: sorted(children) for node, children in self._children.items()}
+        return dict(self.iter_adjacency())
+
+    def iter_adjacency(self) -> Iterator[Tuple[str, List[str]]]:
+        """Yield ``(concept_id, sorted_child_ids)`` in insertion order."""
+
+        children = self._children()
+        ids = self._ids
+        for node in range(len(ids)):
+            yield ids[node], sorted(ids[child] for child in children.neighbours(node))
+
+    def iter_nodes(self) -> Iterator[Tuple[Concept, List[str]]]:
+        """Yield each concept with its sorted graph parents in insertion order."""
+
+        parents = self._parents()
+        ids = self._ids
+        for node, concept in enumerate(self._concepts):
+            yield concept, sorted(ids[parent] for parent in parents.neighbours(node))
+
+
+@dataclass(slots=True)
+class _CSR:
+    """Compressed sparse row adjacency over interned node indices."""
+
+    offsets: array
+    targets: array
+
+    @classmethod
+    def build(cls, node_count: int, sources: array, targets: array) -> _CSR:
+        offsets = array("I", bytes((node_count + 1) * array("I").itemsize))
+        for source in sources:
+            offsets[source + 1] += 1
+        for node in range(node_count):
+            offsets[node + 1] += offsets[node]
+        cursor = offsets[:-1]
+        packed = array("I", bytes(len(targets) * array("I").itemsize))
+        for source, target in zip(sources, targets):
+            packed[cursor[source]] = target
+            cursor[source] += 1
+        return cls(offsets, packed)
+
+    def neighbours(self, node: int) -> array:
+        return self.targets[self.offsets[node] : self.offsets[node + 1]]
 
 
 __all__ = ["HierarchyGraph", "EdgeValidationResult"]
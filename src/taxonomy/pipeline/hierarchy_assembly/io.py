@@ -5,12 +5,21 @@ from __future__ import annotations
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, Iterator, List, Sequence
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+try:  # pragma: no cover - optional dependency for tabular exports
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = None
+    pq = None
 
 from taxonomy.entities.core import Concept
 from taxonomy.utils.helpers import ensure_directory, serialize_json
 from taxonomy.utils.logging import get_logger
 
+from .ancestry import AncestryIndex
 from .graph import HierarchyGraph
 from .validator import ValidationReport
 
@@ -52,37 +61,63 @@ def write_hierarchy_manifest(manifest: dict, output_path: str | Path) -> Path:
     return path.resolve()
 
 
+GRAPH_EXPORT_FORMATS = ("json", "adjacency", "dot", "jsonl", "graphml", "parquet", "arrow")
+
+_TABLE_BATCH_SIZE = 65_536
+
+
+def graph_export_paths(output_path: str | Path, *, format: str = "json") -> List[Path]:
+    """Return every file :func:`export_graph_structure` writes for ``format``.
+
+    Tabular formats write the node table to ``output_path`` and the edge table
+    to a sibling named ``<stem>.edges<suffix>``.
+    """
+
+    path = Path(output_path)
+    if format.lower() in {"parquet", "arrow"}:
+        return [path, path.with_name(f"{path.stem}.edges{path.suffix}")]
+    return [path]
+
+
+def load_ancestry_index(manifest_path: str | Path) -> AncestryIndex | None:
+    """Restore the ancestry index persisted in a hierarchy manifest, if any."""
+
+    payload = json.loads(Path(manifest_path).read_text(encoding="utf-8"))
+    ancestry = payload.get("ancestry")
+    return AncestryIndex.from_dict(ancestry) if ancestry else None
+
+
 def export_graph_structure(
     graph: HierarchyGraph,
     output_path: str | Path,
     *,
     format: str = "json",
+    batch_size: int = _TABLE_BATCH_SIZE,
 ) -> Path:
+    """Stream the graph to ``output_path`` in the requested ``format``.
+
+    Every writer walks the graph once through its iterators so memory stays
+    flat regardless of edge count; tabular formats flush a row group (or
+    record batch) every ``batch_size`` rows.
+    """
+
     path = Path(output_path)
     ensure_directory(path.parent)
     format = format.lower()
     if format == "json":
-        payload = {
-            "nodes": [concept.id for concept in graph.concepts()],
-            "edges": [
-                {"parent": parent, "child": child}
-                for parent, children in graph.adjacency().items()
-                for child in children
-            ],
-        }
-        serialize_json(payload, path)
+        _write_json(graph, path)
     elif format == "adjacency":
         serialize_json(graph.adjacency(), path)
     elif format == "dot":
-        lines = ["digraph hierarchy {"]
-        for concept in graph.concepts():
-            label = concept.canonical_label.replace("\"", "\\\"")
-            lines.append(f'  "{concept.id}" [label="{label}"];')
-        for parent, children in graph.adjacency().items():
-            for child in children:
-                lines.append(f'  "{parent}" -> "{child}";')
-        lines.append("}")
-        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        _write_dot(graph, path)
+    elif format == "jsonl":
+        _write_jsonl_edges(graph, path)
+    elif format == "graphml":
+        _write_graphml(graph, path)
+    elif format in {"parquet", "arrow"}:
+        node_path, edge_path = graph_export_paths(path, format=format)
+        _write_table(node_path, _node_schema, _node_batches(graph, batch_size), format)
+        _write_table(edge_path, _edge_schema, _edge_batches(graph, batch_size), format)
     else:
         raise ValueError(f"unsupported graph export format: {format}")
     _LOGGER.info(
@@ -93,6 +128,126 @@ def export_graph_structure(
     return path.resolve()
 
 
+def _iter_edges(graph: HierarchyGraph) -> Iterator[Tuple[str, str]]:
+    for parent, children in graph.iter_adjacency():
+        for child in children:
+            yield parent, child
+
+
+def _write_json(graph: HierarchyGraph, path: Path) -> None:
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write('{\n  "edges": [')
+        separator = "\n    "
+        for parent, child in _iter_edges(graph):
+            handle.write(separator)
+            handle.write(json.dumps({"child": child, "parent": parent}, ensure_ascii=False))
+            separator = ",\n    "
+        handle.write('\n  ],\n  "nodes": [')
+        separator = "\n    "
+        for concept in graph.concepts():
+            handle.write(separator)
+            handle.write(json.dumps(concept.id, ensure_ascii=False))
+            separator = ",\n    "
+        handle.write("\n  ]\n}\n")
+
+
+def _write_jsonl_edges(graph: HierarchyGraph, path: Path) -> None:
+    with path.open("w", encoding="utf-8") as handle:
+        for parent, child in _iter_edges(graph):
+            handle.write(json.dumps({"parent": parent, "child": child}, ensure_ascii=False))
+            handle.write("\n")
+
+
+def _write_dot(graph: HierarchyGraph, path: Path) -> None:
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write("digraph hierarchy {\n")
+        for concept in graph.concepts():
+            label = concept.canonical_label.replace("\"", "\\\"")
+            handle.write(f'  "{concept.id}" [label="{label}"];\n')
+        for parent, child in _iter_edges(graph):
+            handle.write(f'  "{parent}" -> "{child}";\n')
+        handle.write("}\n")
+
+
+def _write_graphml(graph: HierarchyGraph, path: Path) -> None:
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        handle.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n')
+        handle.write('  <key id="label" for="node" attr.name="label" attr.type="string"/>\n')
+        handle.write('  <key id="level" for="node" attr.name="level" attr.type="int"/>\n')
+        handle.write('  <graph id="hierarchy" edgedefault="directed">\n')
+        for concept in graph.concepts():
+            handle.write(
+                f"    <node id={quoteattr(concept.id)}>"
+                f'<data key="label">{escape(concept.canonical_label)}</data>'
+                f'<data key="level">{concept.level}</data></node>\n'
+            )
+        for parent, child in _iter_edges(graph):
+            handle.write(f"    <edge source={quoteattr(parent)} target={quoteattr(child)}/>\n")
+        handle.write("  </graph>\n</graphml>\n")
+
+
+def _node_batches(graph: HierarchyGraph, batch_size: int) -> Iterator[Dict[str, list]]:
+    batch: Dict[str, list] = {"id": [], "level": [], "label": [], "parents": []}
+    for concept, parents in graph.iter_nodes():
+        batch["id"].append(concept.id)
+        batch["level"].append(concept.level)
+        batch["label"].append(concept.canonical_label)
+        batch["parents"].append(parents)
+        if len(batch["id"]) >= batch_size:
+            yield batch
+            batch = {"id": [], "level": [], "label": [], "parents": []}
+    if batch["id"]:
+        yield batch
+
+
+def _edge_batches(graph: HierarchyGraph, batch_size: int) -> Iterator[Dict[str, list]]:
+    batch: Dict[str, list] = {"parent": [], "child": []}
+    for parent, child in _iter_edges(graph):
+        batch["parent"].append(parent)
+        batch["child"].append(child)
+        if len(batch["parent"]) >= batch_size:
+            yield batch
+            batch = {"parent": [], "child": []}
+    if batch["parent"]:
+        yield batch
+
+
+def _node_schema() -> pa.Schema:
+    return pa.schema(
+        [
+            ("id", pa.string()),
+            ("level", pa.int8()),
+            ("label", pa.string()),
+            ("parents", pa.list_(pa.string())),
+        ]
+    )
+
+
+def _edge_schema() -> pa.Schema:
+    return pa.schema([("parent", pa.string()), ("child", pa.string())])
+
+
+def _write_table(
+    path: Path,
+    schema_factory: Callable[[], pa.Schema],
+    batches: Iterable[Dict[str, list]],
+    format: str,
+) -> None:
+    if pa is None:
+        raise RuntimeError(f"pyarrow is required for '{format}' graph exports")
+    schema = schema_factory()
+    if format == "parquet":
+        writer = pq.ParquetWriter(str(path), schema)
+    else:
+        writer = pa.ipc.new_file(str(path), schema)
+    try:
+        for batch in batches:
+            writer.write_batch(pa.RecordBatch.from_pydict(batch, schema=schema))
+    finally:
+        writer.close()
+
+
 def write_hierarchy_statistics(stats: dict, output_path: str | Path) -> Path:
     path = Path(output_path)
     ensure_directory(path.parent)
@@ -131,7 +286,10 @@ def generate_hierarchy_metadata(
 __all__ = [
     "load_concepts",
     "write_hierarchy_manifest",
+    "load_ancestry_index",
     "export_graph_structure",
+    "graph_export_paths",
+    "GRAPH_EXPORT_FORMATS",
     "write_hierarchy_statistics",
     "write_validation_report",
     "write_orphan_report",
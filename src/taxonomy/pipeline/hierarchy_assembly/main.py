@@ -12,7 +12,9 @@ from taxonomy.utils.logging import get_logger, logging_context
 
 from .assembler import HierarchyAssembler, HierarchyAssemblyResult
 from .io import (
+    GRAPH_EXPORT_FORMATS,
     export_graph_structure,
+    graph_export_paths,
     generate_hierarchy_metadata,
     load_concepts,
     write_hierarchy_manifest,
@@ -106,7 +108,7 @@ def _build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--graph-format",
         default="json",
-        choices=["json", "adjacency", "dot"],
+        choices=list(GRAPH_EXPORT_FORMATS),
         help="Format used when exporting the graph structure",
     )
     parser.add_argument(
@@ -170,7 +172,7 @@ def main(argv: Iterable[str] | None = None) -> int:
         if args.metadata:
             cleanup_candidates.append(Path(args.metadata))
         if args.graph:
-            cleanup_candidates.append(Path(args.graph))
+            cleanup_candidates.extend(graph_export_paths(args.graph, format=args.graph_format))
         if args.validation_report:
             cleanup_candidates.append(Path(args.validation_report))
         if args.orphans:
@@ -0,0 +1,375 @@
+"""Per-level S1 → S2 → S3 generation, optionally as a bounded-queue pipeline."""
+
+from __future__ import annotations
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence
+
+from taxonomy.config.settings import Settings
+from taxonomy.entities.core import Candidate, Concept, SourceRecord
+from taxonomy.observability import ObservabilityContext
+from taxonomy.utils.helpers import chunked
+from taxonomy.utils.logging import get_logger, logging_context
+
+from .s1_extraction_normalization.extractor import ExtractionProcessor
+from .s1_extraction_normalization.io import load_source_records
+from .s1_extraction_normalization.normalizer import CandidateNormalizer
+from .s1_extraction_normalization.parent_index import ParentIndex
+from .s1_extraction_normalization.processor import AggregatedCandidate, S1Processor, merge_aggregated_state
+from .s2_frequency_filtering.aggregator import (
+    CandidateAggregator,
+    CandidateEvidence,
+    FrequencyAggregationResult,
+)
+from .s2_frequency_filtering.institution_resolver import InstitutionResolver
+from .s2_frequency_filtering.processor import S2Processor
+from .s3_token_verification.processor import (
+    S3Processor,
+    TokenVerificationResult,
+    VerificationInput,
+)
+from .s3_token_verification.rules import TokenRuleEngine
+from .s3_token_verification.verifier import LLMTokenVerifier
+
+_LOGGER = get_logger(module=__name__)
+
+_POLL_SECONDS = 0.05
+_DONE = object()
+
+
+class _PipelineAborted(Exception):
+    """Raised inside a stage when another stage has already failed."""
+
+
+class _Channel:
+    """Bounded hand-off between two stages that gives up once the run fails."""
+
+    def __init__(self, maxsize: int, failed: threading.Event) -> None:
+        self._queue: "queue.Queue[object]" = queue.Queue(maxsize=maxsize)
+        self._failed = failed
+
+    def put(self, item: object) -> None:
+        while True:
+            if self._failed.is_set():
+                raise _PipelineAborted
+            try:
+                self._queue.put(item, timeout=_POLL_SECONDS)
+                return
+            except queue.Full:
+                continue
+
+    def close(self) -> None:
+        self.put(_DONE)
+
+    def __iter__(self) -> Iterator[Any]:
+        while True:
+            if self._failed.is_set():
+                raise _PipelineAborted
+            try:
+                item = self._queue.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                continue
+            if item is _DONE:
+                return
+            yield item
+
+
+@dataclass
+class LevelGenerationResult:
+    """Outputs of the three per-level stages."""
+
+    level: int
+    candidates: List[Candidate]
+    frequency: FrequencyAggregationResult
+    verification: TokenVerificationResult
+    stats: Dict[str, Any] = field(default_factory=dict)
+
+    def candidate_rows(self) -> Iterator[Dict[str, Any]]:
+        """Yield the JSON form of each verified candidate."""
+
+        for decision in self.verification.verified:
+            yield decision.candidate.model_dump(mode="json", exclude_none=True)
+
+    def to_payload(
+        self,
+        *,
+        write_rows: Callable[[Iterable[Dict[str, Any]]], Any] | None = None,
+    ) -> Dict[str, Any]:
+        """Return the JSON-safe payload expected from a level generator.
+
+        With *write_rows* the candidate rows are streamed to it, typically
+        :meth:`PhaseContext.write_artifact`, and its result is used in place of
+        the candidate list.
+        """
+
+        rows = self.candidate_rows()
+        return {
+            "level": self.level,
+            "candidates": list(rows) if write_rows is None else write_rows(rows),
+            "stats": dict(self.stats),
+        }
+
+
+class LevelPipeline:
+    """Run S1 extraction, S2 frequency filtering and S3 token verification for a level.
+
+    Sequentially each stage consumes the complete output of the previous one.
+    With ``pipelined=True`` the stages run on their own threads joined by
+    bounded queues of ``queue_size`` items: S2 aggregates S1 candidates batch by
+    batch, and every bucket that meets its frequency threshold is handed to S3,
+    which fetches its LLM verdict while S1 and S2 are still running. S3 then
+    evaluates the final S2 decisions against those verdicts, so both modes
+    produce the same decisions. ``on_batch`` is called after each S1 batch,
+    letting the caller stop a long run by raising.
+    """
+
+    def __init__(
+        self,
+        *,
+        settings: Settings,
+        observability: ObservabilityContext | None = None,
+        batch_size: int = 32,
+        queue_size: int = 64,
+        extraction_runner: Callable[[str, Dict[str, object]], object] | None = None,
+        verification_runner: Callable[[str, Dict[str, object]], object] | None = None,
+    ) -> None:
+        self._settings = settings
+        self._observability = observability
+        self._batch_size = max(1, batch_size)
+        self._queue_size = max(1, queue_size)
+        self._extraction_runner = extraction_runner
+        self._verification_runner = verification_runner
+
+    def run(
+        self,
+        records: Iterable[SourceRecord],
+        *,
+        level: int,
+        previous_parents: Sequence[Candidate | Concept] = (),
+        pipelined: bool = False,
+        on_batch: Callable[[], None] | None = None,
+    ) -> LevelGenerationResult:
+        policies = self._settings.policies
+        label_policy = policies.label_policy
+        parent_index = ParentIndex(
+            label_policy=label_policy,
+            similarity_cutoff=label_policy.parent_similarity_cutoff,
+        )
+        if previous_parents:
+            parent_index.build_index(previous_parents)
+        extractor = ExtractionProcessor(
+            runner=self._extraction_runner,
+            observability=self._observability,
+        )
+        s1 = S1Processor(
+            extractor=extractor,
+            normalizer=CandidateNormalizer(label_policy=label_policy),
+            parent_index=parent_index,
+        )
+        s2 = S2Processor(
+            aggregator=CandidateAggregator(
+                thresholds=policies.level_thresholds,
+                resolver=InstitutionResolver(policy=policies.institution_policy),
+                frequency_policy=policies.frequency_filtering,
+            ),
+            observability=self._observability,
+        )
+        s3 = S3Processor(
+            rule_engine=TokenRuleEngine(
+                policy=policies.single_token,
+                minimal_form=label_policy.minimal_canonical_form,
+            ),
+            llm_verifier=LLMTokenVerifier(runner=self._verification_runner),
+            policy=policies.single_token,
+        )
+
+        state: Dict[Any, AggregatedCandidate] = {}
+        counts = {"records_in": 0, "llm_prefetched": 0}
+        if pipelined:
+            frequency = self._run_pipelined(records, level, s1, s2, s3, state, counts, on_batch)
+        else:
+            with logging_context(stage="s1", level=level):
+                for batch in self._s1_batches(records, level, s1, counts, on_batch):
+                    merge_aggregated_state(state, batch)
+            with logging_context(stage="s2", level=level):
+                frequency = s2.process(_evidence(s1, state.values()))
+
+        with logging_context(stage="s3", level=level):
+            verification = s3.process(
+                VerificationInput(
+                    candidate=decision.candidate.model_copy(deep=True),
+                    rationale=decision.rationale,
+                    institutions=decision.institutions,
+                    record_fingerprints=decision.record_fingerprints,
+                )
+                for decision in frequency.kept
+            )
+
+        candidates = s1.materialize(state.values())
+        stats = {
+            "records_in": counts["records_in"],
+            "candidates_out": len(candidates),
+            "kept": len(frequency.kept),
+            "dropped": len(frequency.dropped),
+            "verified": len(verification.verified),
+            "failed": len(verification.failed),
+            "llm_prefetched": counts["llm_prefetched"],
+            "pipelined": pipelined,
+        }
+        _LOGGER.info("Level generation complete", level=level, **stats)
+        return LevelGenerationResult(
+            level=level,
+            candidates=candidates,
+            frequency=frequency,
+            verification=verification,
+            stats=stats,
+        )
+
+    def _s1_batches(
+        self,
+        records: Iterable[SourceRecord],
+        level: int,
+        s1: S1Processor,
+        counts: Dict[str, int],
+        on_batch: Callable[[], None] | None = None,
+    ) -> Iterator[List[AggregatedCandidate]]:
+        for batch in chunked(records, self._batch_size):
+            counts["records_in"] += len(batch)
+            yield s1.process_batch(batch, level=level, observability=self._observability)
+            if on_batch is not None:
+                on_batch()
+
+    def _run_pipelined(
+        self,
+        records: Iterable[SourceRecord],
+        level: int,
+        s1: S1Processor,
+        s2: S2Processor,
+        s3: S3Processor,
+        state: Dict[Any, AggregatedCandidate],
+        counts: Dict[str, int],
+        on_batch: Callable[[], None] | None = None,
+    ) -> FrequencyAggregationResult:
+        failed = threading.Event()
+        evidence = _Channel(self._queue_size, failed)
+        settled = _Channel(self._queue_size, failed)
+
+        def extract() -> None:
+            with logging_context(stage="s1", level=level):
+                for batch in self._s1_batches(records, level, s1, counts, on_batch):
+                    merge_aggregated_state(state, batch)
+                    for item in _evidence(s1, batch):
+                        evidence.put(item)
+            evidence.close()
+
+        def filter_frequency() -> FrequencyAggregationResult:
+            with logging_context(stage="s2", level=level):
+                result = s2.process(evidence, on_settled=settled.put)
+            settled.close()
+            return result
+
+        def prefetch_verdicts() -> None:
+            with logging_context(stage="s3", level=level):
+                for candidate in settled:
+                    if s3.prefetch(candidate.normalized, candidate.level):
+                        counts["llm_prefetched"] += 1
+
+        def guarded(stage: Callable[[], Any]) -> Callable[[], Any]:
+            def run() -> Any:
+                try:
+                    return stage()
+                except BaseException:
+                    failed.set()
+                    raise
+
+            return run
+
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix=f"level{level}") as executor:
+            futures = [
+                executor.submit(guarded(stage))
+                for stage in (extract, filter_frequency, prefetch_verdicts)
+            ]
+        errors = [future.exception() for future in futures]
+        for error in errors:
+            if error is not None and not isinstance(error, _PipelineAborted):
+                raise error
+        return futures[1].result()
+
+
+def _evidence(s1: S1Processor, items: Iterable[AggregatedCandidate]) -> Iterator[CandidateEvidence]:
+    """Convert S1 aggregates into S2 evidence, skipping invalid candidates."""
+
+    for item in items:
+        candidate = s1.build_candidate(item)
+        if candidate is None:
+            continue
+        yield CandidateEvidence(
+            candidate=candidate,
+            institutions=set(item.institutions),
+            record_fingerprints=set(item.record_fingerprints),
+        )
+
+
+def level_pipeline_generator(
+    source_records_path: str | Path,
+    *,
+    batch_size: int = 32,
+    queue_size: int | None = None,
+) -> Callable[..., Dict[str, Any]]:
+    """Return a level generator for :class:`~taxonomy.orchestration.PhaseManager`.
+
+    The generator reads S0 records from *source_records_path*, takes parents
+    from the previous level's payload and honours the ``pipelined`` flag the
+    phase manager passes from ``settings.orchestration.pipelined_levels``.
+    When ``settings.orchestration.artifact_min_rows`` is set and reached, the
+    verified candidates are streamed straight into a run artifact.
+    """
+
+    def generator(
+        context: Any,
+        level: int,
+        *,
+        audit_mode: bool = False,
+        pipelined: bool = False,
+    ) -> Dict[str, Any]:
+        settings: Settings = context.settings
+        records: Iterable[SourceRecord] = load_source_records(source_records_path)
+        if audit_mode:
+            records = islice(records, settings.audit_mode.limit)
+        parents: List[Candidate] = []
+        if level > 0:
+            parent_payload = context.get(f"phase1_level{level - 1}", {}) or {}
+            parents = [Candidate.model_validate(item) for item in parent_payload.get("candidates", [])]
+        pipeline = LevelPipeline(
+            settings=settings,
+            observability=context.observability,
+            batch_size=batch_size,
+            queue_size=queue_size or settings.orchestration.pipeline_queue_size,
+        )
+        on_batch = None
+        if hasattr(context, "check_budget"):
+            on_batch = partial(context.check_budget, f"phase1_level{level}")
+        result = pipeline.run(
+            records,
+            level=level,
+            previous_parents=parents,
+            pipelined=pipelined,
+            on_batch=on_batch,
+        )
+        threshold = settings.orchestration.artifact_min_rows
+        if threshold and len(result.verification.verified) >= threshold and hasattr(context, "write_artifact"):
+            return result.to_payload(
+                write_rows=lambda rows: context.write_artifact(f"phase1_level{level}/candidates", rows)
+            )
+        return result.to_payload()
+
+    return generator
+
+
+__all__ = ["LevelGenerationResult", "LevelPipeline", "level_pipeline_generator"]
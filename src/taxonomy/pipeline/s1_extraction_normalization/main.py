@@ -17,7 +17,7 @@ from .extractor import ExtractionProcessor
 from .io import generate_metadata, load_source_records
 from .normalizer import CandidateNormalizer
 from .parent_index import ParentIndex
-from .processor import AggregatedCandidate, S1Processor
+from .processor import AggregatedCandidate, S1Processor, merge_aggregated_state
 from taxonomy.utils.helpers import chunked
 
 
@@ -135,15 +135,13 @@ def extract_candidates(
 
     with logging_context(stage="s1", level=level, records=total_records):
         for batch in chunked(remaining_records, batch_size):
-            raw = extractor.extract_candidates(batch, level=level, observability=obs_context)
-            normalized = normalizer.normalize(raw, level=level)
-            aggregated_batch = processor._aggregate(normalized)
-            _merge_aggregated_state(aggregated_state, aggregated_batch)
+            aggregated_batch = processor.process_batch(batch, level=level, observability=obs_context)
+            merge_aggregated_state(aggregated_state, aggregated_batch)
             processed_records += len(batch)
             if resume_path is not None:
                 _write_resume_checkpoint(resume_path, processed_records, aggregated_state)
 
-        candidates = processor._materialize(aggregated_state.values())
+        candidates = processor.materialize(aggregated_state.values())
 
         output_destination: Path | None = None
         if output_path is not None:
@@ -254,33 +252,6 @@ def _limit_source_records(records: Iterable[T], *, limit: int = 10) -> Iterator[
     return islice(records, limit)
 
 
-def _merge_aggregated_state(
-    target: Dict[Tuple[str, Tuple[str, ...]], AggregatedCandidate],
-    items: Iterable[AggregatedCandidate],
-) -> None:
-    for item in items:
-        key = (item.normalized, item.parents)
-        if key not in target:
-            target[key] = AggregatedCandidate(
-                level=item.level,
-                normalized=item.normalized,
-                parents=item.parents,
-                primary_label=item.primary_label,
-                aliases=set(item.aliases),
-                record_fingerprints=set(item.record_fingerprints),
-                institutions=set(item.institutions),
-                total_count=item.total_count,
-            )
-            continue
-        existing = target[key]
-        existing.aliases.update(item.aliases)
-        existing.record_fingerprints.update(item.record_fingerprints)
-        existing.institutions.update(item.institutions)
-        existing.total_count += item.total_count
-        if not existing.primary_label.strip():
-            existing.primary_label = item.primary_label
-
-
 def _stream_candidates(candidates: Sequence[Candidate], output_path: str | Path) -> Path:
     """Deprecated: write bare Candidate JSONL without support details.
 
@@ -6,7 +6,7 @@ consumers can distinguish resolved identifiers from raw anchors."""
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Iterable, List, Sequence, Tuple
+from typing import TYPE_CHECKING, Iterable, List, MutableMapping, Sequence, Tuple
 
 from taxonomy.entities.core import Candidate, SourceRecord, SupportStats
 from taxonomy.utils.helpers import normalize_whitespace
@@ -16,6 +16,9 @@ from .extractor import ExtractionProcessor
 from .normalizer import CandidateNormalizer, NormalizedCandidate
 from .parent_index import ParentIndex
 
+if TYPE_CHECKING:  # pragma: no cover
+    from taxonomy.observability import ObservabilityContext
+
 
 @dataclass
 class AggregatedCandidate:
@@ -58,10 +61,24 @@ class S1Processor:
         if previous_candidates:
             self._parent_index.build_index(previous_candidates)
 
-        raw = self._extractor.extract_candidates(records, level=level)
-        normalized = self._normalizer.normalize(raw, level=level)
-        aggregated = self._aggregate(normalized)
-        return self._materialize(aggregated)
+        return self.materialize(self.process_batch(records, level=level))
+
+    def process_batch(
+        self,
+        records: Sequence[SourceRecord],
+        *,
+        level: int,
+        observability: "ObservabilityContext" | None = None,
+    ) -> List[AggregatedCandidate]:
+        """Extract, normalize and aggregate one batch of records.
+
+        Aggregates of successive batches are combined with
+        :func:`merge_aggregated_state` and turned into candidates by
+        :meth:`materialize`.
+        """
+
+        raw = self._extractor.extract_candidates(records, level=level, observability=observability)
+        return self._aggregate(self._normalizer.normalize(raw, level=level))
 
     def _aggregate(self, normalized: Sequence[NormalizedCandidate]) -> List[AggregatedCandidate]:
         buckets: dict[Tuple[str, Tuple[str, ...]], AggregatedCandidate] = {}
@@ -98,38 +115,73 @@ class S1Processor:
         cleaned = [normalize_whitespace(value) for value in parent_values if value]
         return tuple(dict.fromkeys(cleaned))
 
-    def _materialize(self, aggregated: Iterable[AggregatedCandidate]) -> List[Candidate]:
-        results: List[Candidate] = []
-        for item in aggregated:
-            support = SupportStats(
-                records=len(item.record_fingerprints),
-                institutions=len(item.institutions),
-                count=item.total_count,
+    def build_candidate(self, item: AggregatedCandidate) -> Candidate | None:
+        """Return the candidate for an aggregate, or ``None`` if it fails validation."""
+
+        support = SupportStats(
+            records=len(item.record_fingerprints),
+            institutions=len(item.institutions),
+            count=item.total_count,
+        )
+        aliases = sorted(dict.fromkeys(item.aliases))
+        candidates_parents = list(item.parents)
+        if item.level == 0:
+            candidates_parents = []
+        try:
+            return Candidate(
+                level=item.level,
+                label=item.primary_label,
+                normalized=item.normalized,
+                parents=candidates_parents,
+                aliases=aliases,
+                support=support,
             )
-            aliases = sorted(dict.fromkeys(item.aliases))
-            candidates_parents = list(item.parents)
-            if item.level == 0:
-                candidates_parents = []
-            try:
-                results.append(
-                    Candidate(
-                        level=item.level,
-                        label=item.primary_label,
-                        normalized=item.normalized,
-                        parents=candidates_parents,
-                        aliases=aliases,
-                        support=support,
-                    )
-                )
-            except ValueError as exc:
-                self._log.warning(
-                    "Discarding candidate failing validation",
-                    error=str(exc),
-                    label=item.primary_label,
-                    level=item.level,
-                )
+        except ValueError as exc:
+            self._log.warning(
+                "Discarding candidate failing validation",
+                error=str(exc),
+                label=item.primary_label,
+                level=item.level,
+            )
+            return None
+
+    def materialize(self, aggregated: Iterable[AggregatedCandidate]) -> List[Candidate]:
+        """Build the valid candidates of ``aggregated`` sorted by label and parents."""
+
+        results = [
+            candidate for candidate in map(self.build_candidate, aggregated) if candidate is not None
+        ]
         results.sort(key=lambda cand: (cand.normalized, tuple(cand.parents)))
         return results
 
 
-__all__ = ["S1Processor", "AggregatedCandidate"]
+def merge_aggregated_state(
+    target: MutableMapping[Tuple[str, Tuple[str, ...]], AggregatedCandidate],
+    items: Iterable[AggregatedCandidate],
+) -> None:
+    """Fold batch aggregates into ``target``, keyed by normalized label and parents."""
+
+    for item in items:
+        key = (item.normalized, item.parents)
+        if key not in target:
+            target[key] = AggregatedCandidate(
+                level=item.level,
+                normalized=item.normalized,
+                parents=item.parents,
+                primary_label=item.primary_label,
+                aliases=set(item.aliases),
+                record_fingerprints=set(item.record_fingerprints),
+                institutions=set(item.institutions),
+                total_count=item.total_count,
+            )
+            continue
+        existing = target[key]
+        existing.aliases.update(item.aliases)
+        existing.record_fingerprints.update(item.record_fingerprints)
+        existing.institutions.update(item.institutions)
+        existing.total_count += item.total_count
+        if not existing.primary_label.strip():
+            existing.primary_label = item.primary_label
+
+
+__all__ = ["S1Processor", "AggregatedCandidate", "merge_aggregated_state"]
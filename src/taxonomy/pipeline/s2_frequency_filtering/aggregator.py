@@ -5,7 +5,7 @@ from __future__ import annotations
 import re
 from collections import Counter, defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Sequence, Set, Tuple
+from typing import Callable, Dict, Iterable, List, Sequence, Set, Tuple
 
 from taxonomy.config.policies import (
     FrequencyFilteringPolicy,
@@ -119,44 +119,89 @@ class CandidateAggregator:
         )
         self._log = get_logger(module=__name__)
 
-    def aggregate(self, items: Iterable[CandidateEvidence]) -> FrequencyAggregationResult:
+    def aggregate(
+        self,
+        items: Iterable[CandidateEvidence],
+        *,
+        on_settled: Callable[[Candidate], None] | None = None,
+    ) -> FrequencyAggregationResult:
+        """Aggregate *items* and evaluate every bucket against its threshold.
+
+        When ``on_settled`` is given it is called once per bucket, with the
+        bucket's provisional candidate, as soon as the bucket meets its level
+        threshold so downstream stages can start before the stream ends.
+        """
+
         buckets: Dict[Tuple[int, str, Tuple[str, ...]], _AggregationBucket] = {}
+        settled: Set[Tuple[int, str, Tuple[str, ...]]] = set()
         total_inputs = 0
         for evidence in items:
-            candidate = evidence.candidate
             total_inputs += 1
-            key = self.generate_key(candidate)
-            bucket = buckets.get(key)
-            if bucket is None:
-                bucket = _AggregationBucket(
-                    level=candidate.level,
-                    normalized=candidate.normalized.strip(),
-                    parents=key[2],
-                    primary_label=candidate.label,
-                )
-                buckets[key] = bucket
-            alias_iterable = candidate.aliases or ()
-            bucket.aliases.update(alias_iterable)
-            bucket.aliases.add(candidate.label)
-            bucket.total_count += max(candidate.support.count, 0)
-            bucket.total_records += max(candidate.support.records, 0)
-
-            canonical_institutions = set()
-            for name in evidence.institutions:
-                if not name:
-                    continue
-                resolved = self._resolver.resolve_identity(name)
-                if resolved:
-                    canonical_institutions.add(resolved)
-            if not canonical_institutions:
-                canonical_institutions = {self._unknown_institution_placeholder}
-            bucket.institutions.update(canonical_institutions)
-            bucket.record_fingerprints.update(evidence.record_fingerprints)
-            for institution in canonical_institutions:
-                record_set = bucket.records_by_institution.setdefault(
-                    institution, set()
-                )
-                record_set.update(evidence.record_fingerprints)
+            key, bucket = self.accumulate(buckets, evidence)
+            if on_settled is not None and key not in settled and self.meets_threshold(bucket):
+                settled.add(key)
+                on_settled(bucket.as_candidate())
+        return self.finalize(buckets, total_inputs)
+
+    def accumulate(
+        self,
+        buckets: Dict[Tuple[int, str, Tuple[str, ...]], _AggregationBucket],
+        evidence: CandidateEvidence,
+    ) -> Tuple[Tuple[int, str, Tuple[str, ...]], _AggregationBucket]:
+        """Merge *evidence* into its bucket, creating the bucket when new."""
+
+        candidate = evidence.candidate
+        key = self.generate_key(candidate)
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = _AggregationBucket(
+                level=candidate.level,
+                normalized=candidate.normalized.strip(),
+                parents=key[2],
+                primary_label=candidate.label,
+            )
+            buckets[key] = bucket
+        alias_iterable = candidate.aliases or ()
+        bucket.aliases.update(alias_iterable)
+        bucket.aliases.add(candidate.label)
+        bucket.total_count += max(candidate.support.count, 0)
+        bucket.total_records += max(candidate.support.records, 0)
+
+        canonical_institutions = set()
+        for name in evidence.institutions:
+            if not name:
+                continue
+            resolved = self._resolver.resolve_identity(name)
+            if resolved:
+                canonical_institutions.add(resolved)
+        if not canonical_institutions:
+            canonical_institutions = {self._unknown_institution_placeholder}
+        bucket.institutions.update(canonical_institutions)
+        bucket.record_fingerprints.update(evidence.record_fingerprints)
+        for institution in canonical_institutions:
+            record_set = bucket.records_by_institution.setdefault(
+                institution, set()
+            )
+            record_set.update(evidence.record_fingerprints)
+        return key, bucket
+
+    def meets_threshold(self, bucket: _AggregationBucket) -> bool:
+        """Return ``True`` when *bucket* currently satisfies its level threshold."""
+
+        threshold = self._threshold_for_level(bucket.level)
+        if len(bucket.institutions) < threshold.min_institutions:
+            return False
+        records = bucket.record_fingerprints
+        if self._near_duplicate_policy and bucket.records_by_institution:
+            records = self._deduplicated_records(bucket, self._near_duplicate_policy)[1]
+        return (len(records) or bucket.total_records) >= threshold.min_src_count
+
+    def finalize(
+        self,
+        buckets: Dict[Tuple[int, str, Tuple[str, ...]], _AggregationBucket],
+        total_inputs: int,
+    ) -> FrequencyAggregationResult:
+        """Evaluate accumulated *buckets* and build the aggregation result."""
 
         kept: List[FrequencyDecision] = []
         dropped: List[FrequencyDecision] = []
@@ -273,6 +318,15 @@ class CandidateAggregator:
         if not policy or not bucket.records_by_institution:
             return
 
+        updated_mapping, deduped_records = self._deduplicated_records(bucket, policy)
+        bucket.records_by_institution = updated_mapping
+        bucket.record_fingerprints = deduped_records
+
+    def _deduplicated_records(
+        self,
+        bucket: _AggregationBucket,
+        policy: NearDuplicateDedupPolicy,
+    ) -> Tuple[Dict[str, Set[str]], Set[str]]:
         deduped_records: Set[str] = set()
         updated_mapping: Dict[str, Set[str]] = {}
         for institution, records in bucket.records_by_institution.items():
@@ -288,9 +342,7 @@ class CandidateAggregator:
                     collapsed_records.add(fingerprint)
             updated_mapping[institution] = collapsed_records
             deduped_records.update(collapsed_records)
-
-        bucket.records_by_institution = updated_mapping
-        bucket.record_fingerprints = deduped_records
+        return updated_mapping, deduped_records
 
     def _fingerprint_key(self, fingerprint: str, policy: NearDuplicateDedupPolicy) -> str:
         key = fingerprint
@@ -5,8 +5,9 @@ from __future__ import annotations
 from contextlib import nullcontext
 from dataclasses import dataclass
 from time import perf_counter
-from typing import Iterable, TYPE_CHECKING
+from typing import Callable, Iterable, TYPE_CHECKING
 
+from taxonomy.entities.core import Candidate
 from taxonomy.utils.logging import get_logger
 
 from .aggregator import (
@@ -50,8 +51,16 @@ class S2Processor:
 
         self.observability = context
 
-    def process(self, items: Iterable[CandidateEvidence]) -> FrequencyAggregationResult:
-        """Process an iterable of S1 candidates through frequency filtering."""
+    def process(
+        self,
+        items: Iterable[CandidateEvidence],
+        *,
+        on_settled: Callable[[Candidate], None] | None = None,
+    ) -> FrequencyAggregationResult:
+        """Process an iterable of S1 candidates through frequency filtering.
+
+        ``on_settled`` is forwarded to :meth:`CandidateAggregator.aggregate`.
+        """
 
         observability = self.observability
         phase_cm = observability.phase("S2") if observability is not None else nullcontext()
@@ -63,7 +72,10 @@ class S2Processor:
                 phase.log_operation(operation="frequency_aggregation_start")
 
             try:
-                result = self.aggregator.aggregate(items)
+                if on_settled is None:
+                    result = self.aggregator.aggregate(items)
+                else:
+                    result = self.aggregator.aggregate(items, on_settled=on_settled)
             except Exception as exc:  # pragma: no cover - defensive guard
                 if phase is not None:
                     phase.log_operation(
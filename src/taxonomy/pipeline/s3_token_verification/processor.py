@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from taxonomy.config.policies import SingleTokenVerificationPolicy
 from taxonomy.entities.core import Candidate, Rationale
@@ -60,8 +60,30 @@ class S3Processor:
         self._rule_engine = rule_engine
         self._llm_verifier = llm_verifier
         self._policy = policy
+        self._llm_results: Dict[Tuple[str, int], LLMVerificationResult] = {}
         self._log = get_logger(module=__name__)
 
+    def prefetch(self, normalized: str, level: int) -> bool:
+        """Run the LLM check for a label ahead of :meth:`process`.
+
+        The LLM verdict depends only on the normalized label and level, so it
+        can be computed as soon as a candidate is known to survive S2 and is
+        reused when the candidate is evaluated. Returns ``True`` when an LLM
+        call was made.
+        """
+
+        key = (normalized, level)
+        if key in self._llm_results:
+            return False
+        token_count = self._rule_engine.count_tokens(normalized)
+        if token_count > 1:
+            return False
+        rule_evaluation = self._rule_engine.apply_all_rules(normalized, level)
+        if rule_evaluation.allowlist_hit or (token_count != 1 and rule_evaluation.passed):
+            return False
+        self._llm_results[key] = self._llm_verifier.verify(normalized, level)
+        return True
+
     def process(self, items: Iterable[VerificationInput]) -> TokenVerificationResult:
         verified: List[TokenVerificationDecision] = []
         failed: List[TokenVerificationDecision] = []
@@ -136,7 +158,9 @@ class S3Processor:
             if not rule_evaluation.allowlist_hit:
                 needs_llm = token_count == 1 or not rule_evaluation.passed
                 if needs_llm:
-                    llm_result = self._llm_verifier.verify(candidate.normalized, candidate.level)
+                    llm_result = self._llm_results.get((candidate.normalized, candidate.level))
+                    if llm_result is None:
+                        llm_result = self._llm_verifier.verify(candidate.normalized, candidate.level)
                     rationale.passed_gates["token_llm"] = llm_result.passed
                     if llm_result.reason:
                         rationale.reasons.append(f"llm:{llm_result.reason}")
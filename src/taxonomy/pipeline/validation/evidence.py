@@ -2,13 +2,29 @@
 
 from __future__ import annotations
 
+import hashlib
+import heapq
+import json
+import mmap
+import os
+import re
+import shutil
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping as MappingABC, Sequence as SequenceABC
 from dataclasses import dataclass
 from functools import lru_cache
-from typing import Dict, Iterable, List, Sequence, Tuple
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple
 from urllib.parse import urlparse
 
 from ...config.policies import ValidationPolicy
 from ...entities.core import PageSnapshot
+from ...observability import stable_hash
+from ...utils.logging import get_logger
+from .matcher import PhraseAutomaton
 
 
 @dataclass
@@ -21,25 +37,374 @@ class EvidenceSnippet:
     score: float
 
 
+_LOGGER = get_logger(module=__name__)
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text)
+
+
+@lru_cache(maxsize=4096)
+def _label_pattern(label_lower: str) -> re.Pattern[str]:
+    """Match ``label_lower`` only where its edge tokens are whole tokens."""
+
+    head = r"(?<!\w)" if _TOKEN_RE.match(label_lower[:1]) else ""
+    tail = r"(?!\w)" if _TOKEN_RE.match(label_lower[-1:]) else ""
+    return re.compile(head + re.escape(label_lower) + tail)
+
+
+def _find_occurrences(text_lower: str, label_lower: str) -> List[int]:
+    if not label_lower:
+        return []
+    return [match.start() for match in _label_pattern(label_lower).finditer(text_lower)]
+
+
+def _find_all(text_lower: str, needle: str) -> array:
+    """Every (possibly overlapping) start offset of ``needle`` in ``text_lower``."""
+
+    offsets = array("I")
+    if not needle:
+        return offsets
+    index = text_lower.find(needle)
+    while index != -1:
+        offsets.append(index)
+        index = text_lower.find(needle, index + 1)
+    return offsets
+
+
+EvidenceHits = List[Tuple[PageSnapshot, List[int]]]
+"""Matching snapshots paired with the character offsets of each label hit."""
+
+
+@dataclass
+class _Posting:
+    """Sorted snapshot ids containing a token and the token offsets in each."""
+
+    docs: Sequence[int]
+    positions: Sequence[Sequence[int]]
+
+    def find(self, doc_id: int, lo: int = 0) -> int:
+        """Return the slot of ``doc_id`` in :attr:`docs` or ``-1``."""
+
+        slot = bisect_left(self.docs, doc_id, lo)
+        if slot < len(self.docs) and self.docs[slot] == doc_id:
+            return slot
+        return -1
+
+
+_INDEX_FORMAT = 1
+_UINT32_ARRAYS = frozenset({"docs", "positions", "institution_offsets"})
+
+
+def _map_bytes(path: Path) -> memoryview:
+    with path.open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            return memoryview(b"")
+        return memoryview(mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def _map_array(path: Path, typecode: str) -> Sequence[int]:
+    view = _map_bytes(path)
+    if not view.nbytes:
+        return array(typecode)
+    return view.cast(typecode)
+
+
+class _MappedSlices(SequenceABC):
+    """Read-only ``values[starts[i]:starts[i + 1]]`` views over mapped arrays."""
+
+    def __init__(self, starts: Sequence[int], values: Sequence[int], base: int = 0, length: int | None = None) -> None:
+        self._starts = starts
+        self._values = values
+        self._base = base
+        self._length = len(starts) - 1 if length is None else length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> Sequence[int]:  # type: ignore[override]
+        if not 0 <= index < self._length:
+            raise IndexError(index)
+        slot = self._base + index
+        return self._values[self._starts[slot] : self._starts[slot + 1]]
+
+
+class _MappedTexts(SequenceABC):
+    """Lowered snapshot texts decoded on access from a mapped UTF-8 blob."""
+
+    def __init__(self, blob: memoryview, starts: Sequence[int]) -> None:
+        self._blob = blob
+        self._starts = starts
+
+    def __len__(self) -> int:
+        return len(self._starts) - 1
+
+    def __getitem__(self, index: int) -> str:  # type: ignore[override]
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return str(self._blob[self._starts[index] : self._starts[index + 1]], "utf-8")
+
+
+class _MappedPostings(MappingABC):
+    """Token postings materialized lazily from mapped arrays."""
+
+    def __init__(
+        self,
+        tokens: Sequence[str],
+        token_starts: Sequence[int],
+        docs: Sequence[int],
+        position_starts: Sequence[int],
+        positions: Sequence[int],
+    ) -> None:
+        self._slots = {token: slot for slot, token in enumerate(tokens)}
+        self._token_starts = token_starts
+        self._docs = docs
+        self._position_starts = position_starts
+        self._positions = positions
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._slots)
+
+    def __getitem__(self, token: str) -> _Posting:
+        slot = self._slots[token]
+        begin, end = self._token_starts[slot], self._token_starts[slot + 1]
+        return _Posting(
+            self._docs[begin:end],
+            _MappedSlices(self._position_starts, self._positions, begin, end - begin),
+        )
+
+
 class EvidenceIndexer:
-    """Index page snapshots for fast evidence lookup."""
+    """Index page snapshots for fast evidence lookup.
+
+    ``build_index`` lowers every snapshot once and builds a token-level
+    inverted index (token -> snapshot ids -> token offsets). Snapshots are
+    stored grouped by institution so each institution owns a contiguous id
+    range; an institution filter is therefore a bisect slice of the posting
+    lists rather than a separate copy of the corpus. Labels match on token
+    boundaries: candidate snapshots come from posting intersection, a
+    positional phrase check, and a final boundary-anchored match on the
+    lowered text. :meth:`scan_labels` answers many labels in one corpus pass.
+    """
 
     def __init__(self, policy: ValidationPolicy) -> None:
         self._policy = policy
         self._built = False
         self._snapshots: List[PageSnapshot] = []
-        self._by_institution: Dict[str, List[PageSnapshot]] = {}
-        self._by_domain: Dict[str, List[PageSnapshot]] = {}
+        self._lowered: Sequence[str] = []
+        self._order: List[int] = []
+        self._doc_ids: Dict[int, int] = {}
+        self._postings: Mapping[str, _Posting] = {}
+        self._institution_slices: Dict[str, Tuple[int, int]] = {}
+        self._authority_by_domain: Dict[str, float] = {}
+        self._authority: List[float] = []
+        self._institution_offsets: Sequence[Sequence[int]] = []
+
+    def _assign_documents(self, snapshots: Sequence[PageSnapshot]) -> None:
+        grouped: Dict[str, List[Tuple[int, PageSnapshot]]] = {}
+        for original_index, snapshot in enumerate(snapshots):
+            grouped.setdefault(snapshot.institution, []).append((original_index, snapshot))
+        self._snapshots = []
+        self._order = []
+        self._doc_ids = {}
+        self._institution_slices = {}
+        for institution, members in grouped.items():
+            start = len(self._snapshots)
+            for original_index, snapshot in members:
+                self._doc_ids[id(snapshot)] = len(self._snapshots)
+                self._snapshots.append(snapshot)
+                self._order.append(original_index)
+            self._institution_slices[institution] = (start, len(self._snapshots))
 
     def build_index(self, snapshots: Sequence[PageSnapshot]) -> None:
-        self._snapshots = list(snapshots)
-        self._by_institution.clear()
-        self._by_domain.clear()
-        for snapshot in self._snapshots:
-            self._by_institution.setdefault(snapshot.institution, []).append(snapshot)
+        self._assign_documents(snapshots)
+        lowered_texts: List[str] = []
+        postings: Dict[str, _Posting] = {}
+        institution_offsets: List[array] = []
+        self._authority_by_domain = {}
+        self._authority = []
+        for doc_id, snapshot in enumerate(self._snapshots):
+            lowered = snapshot.text.lower()
+            lowered_texts.append(lowered)
+            local: Dict[str, array] = {}
+            for position, token in enumerate(_tokenize(lowered)):
+                offsets = local.get(token)
+                if offsets is None:
+                    offsets = local[token] = array("I")
+                offsets.append(position)
+            for token, offsets in local.items():
+                posting = postings.get(token)
+                if posting is None:
+                    posting = postings[token] = _Posting(array("I"), [])
+                posting.docs.append(doc_id)
+                posting.positions.append(offsets)
             domain = self._extract_domain(snapshot.canonical_url or snapshot.url)
-            self._by_domain.setdefault(domain, []).append(snapshot)
+            self._authority.append(self._domain_authority(domain))
+            institution_offsets.append(_find_all(lowered, (snapshot.institution or "").lower()))
+        self._lowered = lowered_texts
+        self._postings = postings
+        self._institution_offsets = institution_offsets
+        self._built = True
+
+    def corpus_checksum(self, snapshots: Sequence[PageSnapshot]) -> str:
+        """Key identifying an on-disk index for ``snapshots`` under this policy.
+
+        ``PageSnapshot.checksum`` ignores whitespace, but the saved offsets
+        point into the raw text, so its length and hash are part of the key.
+        """
+
+        return stable_hash(
+            {
+                "format": _INDEX_FORMAT,
+                "authoritative_domains": list(self._authoritative_domains()),
+                "snapshots": [
+                    [
+                        snap.institution,
+                        snap.url,
+                        snap.canonical_url,
+                        snap.checksum,
+                        len(snap.text),
+                        hashlib.sha256(snap.text.encode("utf-8")).hexdigest(),
+                    ]
+                    for snap in snapshots
+                ],
+            }
+        )
+
+    def build_or_load(self, snapshots: Sequence[PageSnapshot], cache_dir: Path) -> bool:
+        """Memory-map a saved index for ``snapshots`` or build and save one.
+
+        Returns ``True`` when an existing index was reused.
+        """
+
+        directory = Path(cache_dir) / self.corpus_checksum(snapshots)
+        if self.load(directory, snapshots):
+            return True
+        self.build_index(snapshots)
+        try:
+            self.save(directory)
+        except OSError as exc:  # pragma: no cover - cache writes are best effort
+            _LOGGER.warning("Failed to persist evidence index", path=str(directory), error=str(exc))
+        return False
+
+    def save(self, directory: Path) -> None:
+        """Write the built index to ``directory`` as flat arrays plus JSON metadata."""
+
+        self._ensure_built()
+        directory = Path(directory)
+        directory.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{directory.name}-", dir=directory.parent))
+        try:
+            tokens: List[str] = []
+            token_starts = array("Q", [0])
+            docs = array("I")
+            position_starts = array("Q", [0])
+            positions = array("I")
+            for token, posting in self._postings.items():
+                tokens.append(token)
+                docs.extend(posting.docs)
+                for offsets in posting.positions:
+                    positions.extend(offsets)
+                    position_starts.append(len(positions))
+                token_starts.append(len(docs))
+
+            text_starts = array("Q", [0])
+            with (staging / "lowered.bin").open("wb") as handle:
+                for lowered in self._lowered:
+                    encoded = lowered.encode("utf-8")
+                    handle.write(encoded)
+                    text_starts.append(text_starts[-1] + len(encoded))
+
+            institution_starts = array("Q", [0])
+            institution_offsets = array("I")
+            for offsets in self._institution_offsets:
+                institution_offsets.extend(offsets)
+                institution_starts.append(len(institution_offsets))
+
+            arrays = {
+                "token_starts": token_starts,
+                "docs": docs,
+                "position_starts": position_starts,
+                "positions": positions,
+                "text_starts": text_starts,
+                "institution_starts": institution_starts,
+                "institution_offsets": institution_offsets,
+            }
+            for name, values in arrays.items():
+                with (staging / f"{name}.bin").open("wb") as handle:
+                    values.tofile(handle)
+            meta = {
+                "format": _INDEX_FORMAT,
+                "byteorder": sys.byteorder,
+                "documents": len(self._snapshots),
+                "order": self._order,
+                "tokens": tokens,
+                "authority": self._authority,
+                "authority_by_domain": self._authority_by_domain,
+            }
+            (staging / "meta.json").write_text(json.dumps(meta), encoding="utf-8")
+            if directory.exists():
+                shutil.rmtree(directory)
+            os.replace(staging, directory)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+    def load(self, directory: Path, snapshots: Sequence[PageSnapshot]) -> bool:
+        """Memory-map an index saved by :meth:`save`; ``False`` if unusable."""
+
+        directory = Path(directory)
+        meta_path = directory / "meta.json"
+        if not meta_path.exists():
+            return False
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            if (
+                meta.get("format") != _INDEX_FORMAT
+                or meta.get("byteorder") != sys.byteorder
+                or meta.get("documents") != len(snapshots)
+            ):
+                return False
+            views = {
+                name: _map_array(directory / f"{name}.bin", "I" if name in _UINT32_ARRAYS else "Q")
+                for name in (
+                    "token_starts",
+                    "docs",
+                    "position_starts",
+                    "positions",
+                    "text_starts",
+                    "institution_starts",
+                    "institution_offsets",
+                )
+            }
+            lowered_bytes = _map_bytes(directory / "lowered.bin")
+        except (OSError, ValueError, TypeError) as exc:
+            _LOGGER.warning("Ignoring unreadable evidence index", path=str(directory), error=str(exc))
+            return False
+
+        self._assign_documents(snapshots)
+        if self._order != meta["order"]:
+            return False
+        self._lowered = _MappedTexts(lowered_bytes, views["text_starts"])
+        self._postings = _MappedPostings(
+            meta["tokens"],
+            views["token_starts"],
+            views["docs"],
+            views["position_starts"],
+            views["positions"],
+        )
+        self._institution_offsets = _MappedSlices(views["institution_starts"], views["institution_offsets"])
+        self._authority = [float(value) for value in meta["authority"]]
+        self._authority_by_domain = {
+            str(domain): float(value) for domain, value in meta["authority_by_domain"].items()
+        }
         self._built = True
+        return True
 
     def search_evidence(
         self,
@@ -47,43 +412,123 @@ class EvidenceIndexer:
         institution_filter: str | None = None,
     ) -> List[PageSnapshot]:
         self._ensure_built()
-        haystacks: Iterable[PageSnapshot]
         if institution_filter:
-            haystacks = self._by_institution.get(institution_filter, [])
+            lo, hi = self._institution_slices.get(institution_filter, (0, 0))
         else:
-            haystacks = self._snapshots
+            lo, hi = 0, len(self._snapshots)
         label_lower = concept_label.lower()
-        results = [snap for snap in haystacks if label_lower in snap.text.lower()]
+        doc_ids = self._match_documents(label_lower, lo, hi)
+        doc_ids.sort(key=self._order.__getitem__)
+        return [self._snapshots[doc_id] for doc_id in doc_ids]
+
+    def scan_labels(self, concept_labels: Iterable[str]) -> Dict[str, EvidenceHits]:
+        """Locate every label in a single pass over the corpus.
+
+        All labels are compiled into one :class:`PhraseAutomaton` and each
+        snapshot's token stream is fed through it once, so the cost is linear
+        in corpus size regardless of how many labels are requested. Results
+        match :meth:`search_evidence` and carry hit offsets for
+        :meth:`extract_snippets`.
+        """
+
+        self._ensure_built()
+        labels = list(dict.fromkeys(label.lower() for label in concept_labels))
+        phrases = [_tokenize(label) for label in labels]
+        # Characters preceding a label's first token (e.g. ".net"), used to map
+        # a token hit back to the start of the full label.
+        leads = [
+            match.start() if (match := _TOKEN_RE.search(label)) else 0 for label in labels
+        ]
+        automaton = PhraseAutomaton(phrases)
+        found: List[Dict[int, List[int]]] = [{} for _ in labels]
+
+        for doc_id, lowered in enumerate(self._lowered):
+            matches = list(_TOKEN_RE.finditer(lowered))
+            last_end: Dict[int, int] = {}
+            for label_id, token_index in automaton.scan(match.group() for match in matches):
+                label = labels[label_id]
+                start = matches[token_index].start() - leads[label_id]
+                if start < last_end.get(label_id, 0) or not lowered.startswith(label, start):
+                    continue
+                last_end[label_id] = start + len(label)
+                found[label_id].setdefault(doc_id, []).append(start)
+
+        for label_id, phrase in enumerate(phrases):
+            if not phrase and labels[label_id]:
+                for doc_id, lowered in enumerate(self._lowered):
+                    positions = _find_occurrences(lowered, labels[label_id])
+                    if positions:
+                        found[label_id][doc_id] = positions
+
+        results: Dict[str, EvidenceHits] = {}
+        for label, hits in zip(labels, found):
+            ordered = sorted(hits, key=self._order.__getitem__)
+            results[label] = [(self._snapshots[doc_id], hits[doc_id]) for doc_id in ordered]
         return results
 
+    def _match_documents(self, label_lower: str, lo: int, hi: int) -> List[int]:
+        if not label_lower:
+            return []
+        pattern = _label_pattern(label_lower)
+        tokens = _tokenize(label_lower)
+        if not tokens:
+            return [doc_id for doc_id in range(lo, hi) if pattern.search(self._lowered[doc_id])]
+
+        postings: List[_Posting] = []
+        for token in tokens:
+            posting = self._postings.get(token)
+            if posting is None:
+                return []
+            postings.append(posting)
+
+        # Drive the intersection from the rarest token; other lists are probed
+        # by bisection so cost scales with the shortest posting list.
+        rarest = min(range(len(postings)), key=lambda index: len(postings[index].docs))
+        driver = postings[rarest]
+        begin = bisect_left(driver.docs, lo)
+        end = bisect_left(driver.docs, hi, begin)
+        cursors = [bisect_left(posting.docs, lo) for posting in postings]
+        matches: List[int] = []
+        for doc_id in driver.docs[begin:end]:
+            slots: List[int] = []
+            for index, posting in enumerate(postings):
+                slot = posting.find(doc_id, cursors[index])
+                if slot < 0:
+                    break
+                cursors[index] = slot
+                slots.append(slot)
+            else:
+                if self._phrase_present(postings, slots) and pattern.search(self._lowered[doc_id]):
+                    matches.append(doc_id)
+        return matches
+
+    @staticmethod
+    def _phrase_present(postings: Sequence[_Posting], slots: Sequence[int]) -> bool:
+        if len(postings) == 1:
+            return True
+        following = [set(posting.positions[slot]) for posting, slot in zip(postings[1:], slots[1:])]
+        for start in postings[0].positions[slots[0]]:
+            if all(start + offset in positions for offset, positions in enumerate(following, start=1)):
+                return True
+        return False
+
     def extract_snippets(
         self,
         snapshot: PageSnapshot,
         concept_label: str,
         max_length: int | None = None,
+        *,
+        positions: Sequence[int] | None = None,
     ) -> List[EvidenceSnippet]:
         max_length = max_length or self._policy.web.snippet_max_length
-        text_lower = snapshot.text.lower()
         label_lower = concept_label.lower()
+        if positions is None:
+            positions = _find_occurrences(self._lowered_text(snapshot), label_lower)
         snippets: List[EvidenceSnippet] = []
-        start = 0
-        while True:
-            index = text_lower.find(label_lower, start)
-            if index == -1:
-                break
-            begin = max(0, index - max_length // 2)
-            end = min(len(snapshot.text), index + len(label_lower) + max_length // 2)
-            snippet_text = snapshot.text[begin:end].strip()
+        for index in positions:
+            snippet_text = self._snippet_text(snapshot, index, len(label_lower), max_length)
             score = self.score_relevance(snippet_text, concept_label, snapshot)
-            snippets.append(
-                EvidenceSnippet(
-                    text=snippet_text,
-                    url=snapshot.canonical_url or snapshot.url,
-                    institution=snapshot.institution,
-                    score=score,
-                )
-            )
-            start = index + len(label_lower)
+            snippets.append(self._materialize(snapshot, snippet_text, score))
         return snippets
 
     def score_relevance(
@@ -96,38 +541,128 @@ class EvidenceIndexer:
         return min(score, 1.5)
 
     def assess_authority(self, snapshot: PageSnapshot) -> float:
-        domain = self._extract_domain(snapshot.canonical_url or snapshot.url)
+        doc_id = self._doc_id(snapshot)
+        if doc_id is not None:
+            return self._authority[doc_id]
+        return self._domain_authority(self._extract_domain(snapshot.canonical_url or snapshot.url))
+
+    def _domain_authority(self, domain: str) -> float:
+        cached = self._authority_by_domain.get(domain)
+        if cached is not None:
+            return cached
         authoritative_domains = self._authoritative_domains()
         if any(domain == auth or domain.endswith(f".{auth}") for auth in authoritative_domains):
-            return 1.0
-        if domain.endswith(".edu") or domain.endswith(".gov"):
-            return 0.8
-        return 0.3
+            authority = 1.0
+        elif domain.endswith(".edu") or domain.endswith(".gov"):
+            authority = 0.8
+        else:
+            authority = 0.3
+        self._authority_by_domain[domain] = authority
+        return authority
 
     def aggregate_evidence(
         self,
         concept_label: str,
         snapshots: Sequence[PageSnapshot],
+        *,
+        positions: Sequence[Sequence[int]] | None = None,
     ) -> List[EvidenceSnippet]:
-        snippets: List[EvidenceSnippet] = []
-        for snapshot in snapshots:
-            snippets.extend(
-                self.extract_snippets(
-                    snapshot,
-                    concept_label,
-                    max_length=self._policy.web.snippet_max_length,
-                )
-            )
-        snippets.sort(key=lambda snippet: snippet.score, reverse=True)
+        """Return the ``max_snippets_per_concept`` best snippets for a label.
+
+        Hits are scored from per-snapshot features computed at index time, so
+        only the winning ``k`` windows are sliced into :class:`EvidenceSnippet`
+        objects. Selection is equivalent to a stable descending sort.
+        """
+
         limit = self._policy.evidence.max_snippets_per_concept
         if limit <= 0:
             return []
-        return snippets[:limit]
+        max_length = self._policy.web.snippet_max_length
+        label_lower = concept_label.lower()
+        scored = self._score_hits(label_lower, snapshots, positions, max_length)
+        winners = heapq.nlargest(limit, scored, key=lambda hit: hit[0])
+        snippets: List[EvidenceSnippet] = []
+        for score, snapshot, index in winners:
+            snippet_text = self._snippet_text(snapshot, index, len(label_lower), max_length)
+            snippets.append(self._materialize(snapshot, snippet_text, score))
+        return snippets
+
+    def _score_hits(
+        self,
+        label_lower: str,
+        snapshots: Sequence[PageSnapshot],
+        positions: Sequence[Sequence[int]] | None,
+        max_length: int,
+    ) -> Iterator[Tuple[float, PageSnapshot, int]]:
+        half = max_length // 2
+        label_length = len(label_lower)
+        # Snippets are stripped before scoring; window containment only equals
+        # substring containment when neither needle has edge whitespace.
+        exact = label_lower == label_lower.strip()
+        for slot, snapshot in enumerate(snapshots):
+            offsets = positions[slot] if positions is not None else None
+            if offsets is None:
+                offsets = _find_occurrences(self._lowered_text(snapshot), label_lower)
+            if not offsets:
+                continue
+            institution_lower = (snapshot.institution or "").lower()
+            if not exact or institution_lower != institution_lower.strip():
+                for index in offsets:
+                    snippet_text = self._snippet_text(snapshot, index, label_length, max_length)
+                    yield self.score_relevance(snippet_text, label_lower, snapshot), snapshot, index
+                continue
+            doc_id = self._doc_id(snapshot)
+            if doc_id is not None:
+                authority = self._authority[doc_id]
+                institution_offsets: Sequence[int] = self._institution_offsets[doc_id]
+            else:
+                authority = self.assess_authority(snapshot)
+                institution_offsets = _find_all(snapshot.text.lower(), institution_lower)
+            base = 1.0 + 0.3 * authority
+            boosted = 1.0 + 0.2 + 0.3 * authority
+            text_length = len(snapshot.text)
+            institution_length = len(institution_lower)
+            for index in offsets:
+                begin = max(0, index - half)
+                end = min(text_length, index + label_length + half)
+                nearest = bisect_left(institution_offsets, begin)
+                mentioned = (
+                    nearest < len(institution_offsets)
+                    and institution_offsets[nearest] + institution_length <= end
+                )
+                yield min(boosted if mentioned else base, 1.5), snapshot, index
+
+    @staticmethod
+    def _snippet_text(snapshot: PageSnapshot, index: int, label_length: int, max_length: int) -> str:
+        begin = max(0, index - max_length // 2)
+        end = min(len(snapshot.text), index + label_length + max_length // 2)
+        return snapshot.text[begin:end].strip()
+
+    @staticmethod
+    def _materialize(snapshot: PageSnapshot, text: str, score: float) -> EvidenceSnippet:
+        return EvidenceSnippet(
+            text=text,
+            url=snapshot.canonical_url or snapshot.url,
+            institution=snapshot.institution,
+            score=score,
+        )
 
     def is_empty(self) -> bool:
         self._ensure_built()
         return not self._snapshots
 
+    def _doc_id(self, snapshot: PageSnapshot) -> int | None:
+        doc_id = self._doc_ids.get(id(snapshot))
+        if doc_id is not None and self._snapshots[doc_id] is snapshot:
+            return doc_id
+        return None
+
+    def _lowered_text(self, snapshot: PageSnapshot) -> str:
+        doc_id = self._doc_id(snapshot)
+        if doc_id is not None:
+            return self._lowered[doc_id]
+        return snapshot.text.lower()
+
     def _ensure_built(self) -> None:
         if not self._built:
             raise RuntimeError("Evidence index has not been built yet")
@@ -0,0 +1,69 @@
+"""Multi-pattern phrase matching over token streams."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+
+class PhraseAutomaton:
+    """Aho-Corasick automaton whose alphabet is tokens rather than characters.
+
+    Every phrase is a token sequence; :meth:`scan` streams a token sequence
+    through the automaton once and reports each phrase occurrence regardless
+    of how many phrases were compiled.
+    """
+
+    def __init__(self, phrases: Iterable[Sequence[str]]) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[List[Tuple[int, int]]] = [[]]
+        self.phrase_count = 0
+        for phrase_id, phrase in enumerate(phrases):
+            self.phrase_count = phrase_id + 1
+            if phrase:
+                self._insert(phrase_id, phrase)
+        self._link()
+
+    def _insert(self, phrase_id: int, phrase: Sequence[str]) -> None:
+        state = 0
+        for token in phrase:
+            following = self._goto[state].get(token)
+            if following is None:
+                following = len(self._goto)
+                self._goto[state][token] = following
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            state = following
+        self._outputs[state].append((phrase_id, len(phrase)))
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, following in self._goto[state].items():
+                queue.append(following)
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                self._fail[following] = target if target != following else 0
+                self._outputs[following] = self._outputs[following] + self._outputs[self._fail[following]]
+
+    def scan(self, tokens: Iterable[str]) -> Iterator[Tuple[int, int]]:
+        """Yield ``(phrase_id, start_token_index)`` for every occurrence."""
+
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        state = 0
+        for index, token in enumerate(tokens):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            for phrase_id, length in outputs[state]:
+                yield phrase_id, index - length + 1
+
+
+__all__ = ["PhraseAutomaton"]
@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from copy import deepcopy
 from dataclasses import dataclass, field
-from typing import Iterable, List, Sequence
+from pathlib import Path
+from typing import AbstractSet, Deque, Dict, Iterable, List, Sequence, Tuple
 
 from ...config.policies import ValidationPolicy
 from ...entities.core import Concept, Rationale, ValidationFinding, PageSnapshot
 from .aggregator import AggregatedDecision, ValidationAggregator
-from .evidence import EvidenceIndexer, EvidenceSnippet
+from .evidence import EvidenceHits, EvidenceIndexer, EvidenceSnippet
 from .llm import LLMValidator, LLMResult
 from .rules import RuleValidator, RuleResult
 from .web import WebValidator, WebResult
@@ -27,12 +30,17 @@ META_CONFIDENCE = "confidence"
 
 @dataclass
 class ValidationOutcome:
-    """Outcome for a single concept including aggregated decision."""
+    """Outcome for a single concept including aggregated decision.
+
+    ``changed`` is set when the concept already carried a different result
+    for the validation gate, i.e. re-validation flipped it.
+    """
 
     concept: Concept
     decision: AggregatedDecision
     findings: List[ValidationFinding] = field(default_factory=list)
     evidence: List[EvidenceSnippet] = field(default_factory=list)
+    changed: bool = False
 
 
 class ValidationProcessor:
@@ -45,13 +53,16 @@ class ValidationProcessor:
         indexer: EvidenceIndexer | None = None,
         enable_web: bool = True,
         enable_llm: bool | None = None,
+        llm_validator: LLMValidator | None = None,
+        llm_executor: Executor | None = None,
     ) -> None:
         self._policy = policy
         self._indexer = indexer or EvidenceIndexer(policy)
         self._rule_validator = RuleValidator(policy)
         self._web_validator = WebValidator(policy, self._indexer) if enable_web else None
         llm_enabled = policy.llm.entailment_enabled if enable_llm is None else enable_llm
-        self._llm_validator = LLMValidator(policy) if llm_enabled else None
+        self._llm_validator = (llm_validator or LLMValidator(policy)) if llm_enabled else None
+        self._llm_executor = llm_executor
         self._aggregator = ValidationAggregator(policy)
         self._stats = {
             "concepts": 0,
@@ -70,11 +81,93 @@ class ValidationProcessor:
     def stats(self) -> dict:
         return dict(self._stats)
 
-    def prepare_evidence(self, snapshots: Sequence[PageSnapshot]) -> None:
-        self._indexer.build_index(snapshots)
+    def prepare_evidence(
+        self, snapshots: Sequence[PageSnapshot], *, cache_dir: Path | None = None
+    ) -> bool:
+        """Index ``snapshots``, reusing a saved index when a cache directory is configured.
 
-    def process(self, concepts: Iterable[Concept]) -> List[ValidationOutcome]:
-        outcomes: List[ValidationOutcome] = []
+        Returns ``True`` when the index was memory-mapped from the cache.
+        """
+
+        configured = self._policy.evidence.index_cache_directory
+        cache_dir = cache_dir or (Path(configured) if configured else None)
+        if cache_dir is None:
+            self._indexer.build_index(snapshots)
+            return False
+        return self._indexer.build_or_load(snapshots, cache_dir)
+
+    def _scan_evidence(self, concepts: Sequence[Concept]) -> Dict[str, EvidenceHits] | None:
+        """Gather evidence for the whole batch in one corpus pass when worthwhile."""
+
+        web_policy = self._policy.web
+        if (
+            self._web_validator is None
+            or not web_policy.batch_scan_enabled
+            or len(concepts) < web_policy.batch_scan_min_concepts
+        ):
+            return None
+        return self._indexer.scan_labels(concept.canonical_label for concept in concepts)
+
+    def _run_entailment(
+        self,
+        validator: LLMValidator,
+        requests: Sequence[Tuple[Concept, List[EvidenceSnippet]]],
+    ) -> List[LLMResult]:
+        """Run LLM entailment for ``requests`` with at most ``llm.max_concurrency`` in flight.
+
+        Results are returned in request order regardless of completion order.
+        A caller-supplied executor is used as-is; otherwise a thread pool is
+        created for the batch.
+        """
+
+        limit = self._policy.llm.max_concurrency
+        if self._llm_executor is None and (limit <= 1 or len(requests) <= 1):
+            return [validator.validate_concept(concept, evidence) for concept, evidence in requests]
+
+        executor = self._llm_executor or ThreadPoolExecutor(
+            max_workers=min(limit, len(requests)), thread_name_prefix="validation-llm"
+        )
+        results: List[LLMResult] = []
+        in_flight: Deque[Future[LLMResult]] = deque()
+        try:
+            for concept, evidence in requests:
+                if len(in_flight) >= limit:
+                    results.append(in_flight.popleft().result())
+                in_flight.append(executor.submit(validator.validate_concept, concept, evidence))
+            while in_flight:
+                results.append(in_flight.popleft().result())
+        finally:
+            for future in in_flight:
+                future.cancel()
+            if executor is not self._llm_executor:
+                executor.shutdown(wait=True)
+        return results
+
+    def process(
+        self,
+        concepts: Iterable[Concept],
+        *,
+        focus: AbstractSet[str] | None = None,
+    ) -> List[ValidationOutcome]:
+        """Validate ``concepts`` in three passes.
+
+        Rule and web checks run for the whole batch first, then LLM entailment
+        is dispatched concurrently, and finally decisions are aggregated in
+        input order so outcomes and ``stats`` are deterministic. Concepts with
+        a hard rule failure are not sent to the LLM when the policy lets such
+        failures block, and the ``llm_*`` counters cover only those sent.
+
+        When ``focus`` is given only concepts whose id it contains are
+        validated, so a re-run covers just the changed concepts.
+        """
+
+        concepts = [concept for concept in concepts if focus is None or concept.id in focus]
+        previous = [
+            (concept.rationale.passed_gates or {}).get(VALIDATION_GATE) if concept.rationale else None
+            for concept in concepts
+        ]
+        batch_hits = self._scan_evidence(concepts)
+        checked: List[Tuple[Concept, dict, RuleResult, WebResult | None, List[EvidenceSnippet]]] = []
         for concept in concepts:
             metadata, _ = self._ensure_validation_structures(concept)
             self._stats["concepts"] += 1
@@ -88,16 +181,40 @@ class ValidationProcessor:
             web_result: WebResult | None = None
             evidence_payload: List[EvidenceSnippet] = []
             if self._web_validator is not None:
-                web_result = self._web_validator.validate_concept(concept)
+                hits = (
+                    batch_hits.get(concept.canonical_label.lower(), [])
+                    if batch_hits is not None
+                    else None
+                )
+                web_result = self._web_validator.validate_concept(concept, hits=hits)
                 if web_result.passed:
                     self._stats["web_passed"] += 1
                 elif not web_result.unknown:
                     self._stats["web_failed"] += 1
                 evidence_payload = [snippet for snippet in web_result.evidence]
+            checked.append((concept, metadata, rule_result, web_result, evidence_payload))
 
-            llm_result: LLMResult | None = None
-            if self._llm_validator is not None:
-                llm_result = self._llm_validator.validate_concept(concept, evidence_payload)
+        llm_results: List[LLMResult | None] = [None] * len(checked)
+        if self._llm_validator is not None:
+            # A blocking hard rule failure decides the outcome, so entailment is skipped.
+            blocks = self._policy.aggregation.hard_rule_failure_blocks
+            dispatched = [
+                index
+                for index, (_, _, rule_result, _, _) in enumerate(checked)
+                if not (blocks and rule_result.hard_fail)
+            ]
+            entailed = self._run_entailment(
+                self._llm_validator,
+                [(checked[index][0], checked[index][4]) for index in dispatched],
+            )
+            for index, llm_result in zip(dispatched, entailed):
+                llm_results[index] = llm_result
+
+        outcomes: List[ValidationOutcome] = []
+        for (concept, metadata, rule_result, web_result, evidence_payload), llm_result, before in zip(
+            checked, llm_results, previous
+        ):
+            if llm_result is not None:
                 if llm_result.passed:
                     self._stats["llm_passed"] += 1
                 else:
@@ -121,6 +238,7 @@ class ValidationProcessor:
                     decision=decision,
                     findings=decision.findings,
                     evidence=evidence_payload,
+                    changed=before is not None and before != decision.passed,
                 )
             )
         return outcomes
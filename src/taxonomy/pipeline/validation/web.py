@@ -8,7 +8,7 @@ from typing import List
 
 from ...config.policies import ValidationPolicy
 from ...entities.core import Concept, FindingMode, ValidationFinding
-from .evidence import EvidenceIndexer, EvidenceSnippet
+from .evidence import EvidenceHits, EvidenceIndexer, EvidenceSnippet
 
 
 @dataclass
@@ -30,12 +30,24 @@ class WebValidator:
         self._indexer = indexer
 
     def validate_concept(
-        self, concept: Concept, *, retrieval_timed_out: bool = False
+        self,
+        concept: Concept,
+        *,
+        retrieval_timed_out: bool = False,
+        hits: EvidenceHits | None = None,
     ) -> WebResult:
-        snapshots = self._indexer.search_evidence(concept.canonical_label)
+        """Validate ``concept``; ``hits`` from :meth:`EvidenceIndexer.scan_labels` skip the lookup."""
+
+        if hits is None:
+            snapshots = self._indexer.search_evidence(concept.canonical_label)
+            positions = None
+        else:
+            snapshots = [snapshot for snapshot, _ in hits]
+            positions = [offsets for _, offsets in hits]
         evidence = self._indexer.aggregate_evidence(
             concept.canonical_label,
             snapshots,
+            positions=positions,
         )
 
         unknown = False
@@ -3,6 +3,7 @@
 from .acronym import abbrev_score, detect_acronym, is_acronym_expansion
 from .context_features import (
     ContextWindow,
+    SourceTokenIndex,
     analyze_institution_distribution,
     compute_context_divergence,
     compute_token_cooccurrence,
@@ -77,6 +78,7 @@ __all__ = [
     "phonetic_bucket_keys",
     "bucket_by_phonetic",
     "ContextWindow",
+    "SourceTokenIndex",
     "extract_parent_lineage_key",
     "extract_context_windows",
     "compute_token_cooccurrence",
@@ -52,16 +52,84 @@ def _iter_source_records(
             yield index, str(index), record
 
 
+class SourceTokenIndex:
+    """Positional token index over source records shared across concepts.
+
+    Each record is split and lower-cased once, and its tokens are posted as
+    ``token -> record -> offsets``. Window extraction for a label then looks up
+    the offsets of the label's first token instead of sliding over every token
+    of every record. Records are keyed by identity and held by the index.
+    """
+
+    def __init__(self) -> None:
+        self._records: Dict[int, Tuple[SourceRecord, List[str], List[str]]] = {}
+        self._postings: Dict[str, Dict[int, List[int]]] = defaultdict(dict)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def add(self, record: SourceRecord) -> Tuple[List[str], List[str]]:
+        """Index ``record`` if needed and return its raw and lowered tokens."""
+
+        key = id(record)
+        entry = self._records.get(key)
+        if entry is None:
+            raw_tokens = record.text.split()
+            lowered_tokens = [token.lower() for token in raw_tokens]
+            for offset, token in enumerate(lowered_tokens):
+                self._postings[token].setdefault(key, []).append(offset)
+            entry = self._records[key] = (record, raw_tokens, lowered_tokens)
+        return entry[1], entry[2]
+
+    def offsets(self, record: SourceRecord, token: str) -> Sequence[int]:
+        postings = self._postings.get(token)
+        if not postings:
+            return ()
+        return postings.get(id(record), ())
+
+    def clear(self) -> None:
+        self._records.clear()
+        self._postings.clear()
+
+
+def _window(
+    concept: Concept,
+    record: SourceRecord,
+    snippet: str,
+    lineage_key: str,
+    source_index: int,
+    key: str,
+) -> ContextWindow:
+    return ContextWindow(
+        concept_id=concept.id,
+        text=snippet,
+        institution=getattr(record.provenance, "institution", None),
+        parent_lineage=lineage_key,
+        source_index=source_index,
+        metadata={
+            "source_id": key,
+            "url": getattr(record.provenance, "url", None) or "",
+        },
+    )
+
+
 def extract_context_windows(
     concept: Concept,
     source_records: Sequence[SourceRecord] | Mapping[str, SourceRecord],
     window_size: int = 100,
+    *,
+    index: SourceTokenIndex | None = None,
 ) -> List[ContextWindow]:
-    """Extract token windows surrounding concept mentions from supporting sources."""
+    """Extract token windows surrounding concept mentions from supporting sources.
+
+    Pass a shared :class:`SourceTokenIndex` to reuse record tokenization and
+    postings across concepts.
+    """
 
     if window_size <= 0:
         raise ValueError("window_size must be positive")
 
+    index = index if index is not None else SourceTokenIndex()
     target_tokens = concept.canonical_label.lower().split()
     lineage_key = extract_parent_lineage_key(concept)
     radius = max(1, window_size // 2)
@@ -69,51 +137,26 @@ def extract_context_windows(
     seen_snippets: set[Tuple[int, str]] = set()
 
     for source_index, key, record in _iter_source_records(source_records):
-        raw_tokens = record.text.split()
-        lowered_tokens = [token.lower() for token in raw_tokens]
+        raw_tokens, lowered_tokens = index.add(record)
         matched = False
         if target_tokens:
             span = len(target_tokens)
-            for idx in range(0, max(0, len(lowered_tokens) - span + 1)):
-                segment = lowered_tokens[idx : idx + span]
-                if segment == target_tokens:
-                    start = max(0, idx - radius)
-                    end = min(len(raw_tokens), idx + span + radius)
-                    snippet = " ".join(raw_tokens[start:end]).strip()
-                    match_key = (source_index, snippet)
-                    if match_key not in seen_snippets:
-                        contexts.append(
-                            ContextWindow(
-                                concept_id=concept.id,
-                                text=snippet,
-                                institution=getattr(record.provenance, "institution", None),
-                                parent_lineage=lineage_key,
-                                source_index=source_index,
-                                metadata={
-                                    "source_id": key,
-                                    "url": getattr(record.provenance, "url", None) or "",
-                                },
-                            )
-                        )
-                        seen_snippets.add(match_key)
-                    matched = True
+            for idx in index.offsets(record, target_tokens[0]):
+                if lowered_tokens[idx : idx + span] != target_tokens:
+                    continue
+                start = max(0, idx - radius)
+                end = min(len(raw_tokens), idx + span + radius)
+                snippet = " ".join(raw_tokens[start:end]).strip()
+                match_key = (source_index, snippet)
+                if match_key not in seen_snippets:
+                    contexts.append(_window(concept, record, snippet, lineage_key, source_index, key))
+                    seen_snippets.add(match_key)
+                matched = True
         if not matched and raw_tokens:
             snippet = " ".join(raw_tokens[: min(len(raw_tokens), window_size)]).strip()
             match_key = (source_index, snippet)
             if match_key not in seen_snippets:
-                contexts.append(
-                    ContextWindow(
-                        concept_id=concept.id,
-                        text=snippet,
-                        institution=getattr(record.provenance, "institution", None),
-                        parent_lineage=lineage_key,
-                        source_index=source_index,
-                        metadata={
-                            "source_id": key,
-                            "url": getattr(record.provenance, "url", None) or "",
-                        },
-                    )
-                )
+                contexts.append(_window(concept, record, snippet, lineage_key, source_index, key))
                 seen_snippets.add(match_key)
 
     contexts.sort(key=lambda ctx: (ctx.institution or "", ctx.source_index, ctx.text))
@@ -264,6 +307,7 @@ __all__ = [
     "ContextWindow",
     "extract_parent_lineage_key",
     "extract_context_windows",
+    "SourceTokenIndex",
     "compute_token_cooccurrence",
     "analyze_institution_distribution",
     "compute_context_divergence",
@@ -8,15 +8,18 @@ from pathlib import Path
 from taxonomy.config.policies import Policies
 from taxonomy.entities.core import PageSnapshot
 
+from .batch import BatchCrawler, CrawlFrontier, SharedCrawlBudget, load_crawl_manifest
 from .cache import CacheManager
 from .client import WebMiner
 from .content import ContentProcessor
+from .extraction import ExtractionStage
 from .models import (
     BudgetStatus,
     CacheEntry,
     ContentMetadata,
     CrawlConfig,
     CrawlError,
+    CrawlFrontierState,
     CrawlResult,
     CrawlSession,
 )
@@ -54,6 +57,8 @@ def build_web_miner(policies: Policies, paths_root: Path) -> WebMiner:
         user_agent=firecrawl_settings.user_agent,
         cache_ttl_seconds=policies.web.robots_cache_ttl_hours * 3600,
         request_timeout_seconds=firecrawl_settings.request_timeout_seconds,
+        cache_dir=cache_dir / "robots",
+        max_logged_urls=policies.web.robots_decision_log_limit,
     )
 
     api_key = os.getenv(firecrawl_settings.api_key_env_var)
@@ -67,9 +72,12 @@ def build_web_miner(policies: Policies, paths_root: Path) -> WebMiner:
         rate_limit_per_sec=float(firecrawl_settings.concurrency),
         firecrawl_api_key=api_key,
         firecrawl_endpoint=firecrawl_settings.endpoint_url,
+        extraction_workers=content_settings.extraction_workers,
+        extraction_queue_size=content_settings.extraction_queue_size or None,
     )
 
 __all__ = [
+    "BatchCrawler",
     "BudgetStatus",
     "CacheEntry",
     "CacheManager",
@@ -78,11 +86,16 @@ __all__ = [
     "build_web_miner",
     "CrawlConfig",
     "CrawlError",
+    "CrawlFrontier",
+    "CrawlFrontierState",
     "CrawlResult",
     "CrawlSession",
+    "ExtractionStage",
     "MetricsCollector",
     "PageSnapshot",
     "RateLimiter",
     "RobotsChecker",
+    "SharedCrawlBudget",
     "WebMiner",
+    "load_crawl_manifest",
 ]
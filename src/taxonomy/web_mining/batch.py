@@ -0,0 +1,302 @@
+"""Multi-institution crawling with shared budgets and resumable frontiers."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Sequence
+
+import yaml
+
+from taxonomy.entities.core import PageSnapshot
+from taxonomy.utils.helpers import ensure_directory, serialize_json
+from taxonomy.utils.logging import get_logger
+
+from .models import CrawlConfig, CrawlFrontierState, CrawlResult
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .client import WebMiner
+
+
+_SLUG_RE = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def _slug(identifier: str) -> str:
+    return _SLUG_RE.sub("_", identifier).strip("_") or "institution"
+
+
+def _atomic_write_text(path: Path, payload: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=path.parent, prefix=f".{path.name}-", suffix=".tmp", delete=False
+    ) as handle:
+        handle.write(payload)
+        temp_name = handle.name
+    os.replace(temp_name, path)
+
+
+class SharedCrawlBudget:
+    """Thread-safe page and byte budget shared by concurrent crawls."""
+
+    def __init__(self, *, max_pages: int | None = None, max_bytes: int | None = None) -> None:
+        self.max_pages = max_pages or None
+        self.max_bytes = max_bytes or None
+        self.pages_fetched = 0
+        self.bytes_downloaded = 0
+        self._lock = threading.Lock()
+
+    def record_page(self) -> None:
+        with self._lock:
+            self.pages_fetched += 1
+
+    def record_bytes(self, amount: int) -> None:
+        with self._lock:
+            self.bytes_downloaded += max(0, amount)
+
+    def within_limits(self) -> bool:
+        with self._lock:
+            if self.max_pages is not None and self.pages_fetched >= self.max_pages:
+                return False
+            if self.max_bytes is not None and self.bytes_downloaded >= self.max_bytes:
+                return False
+            return True
+
+    def to_dict(self) -> Dict[str, int | None]:
+        with self._lock:
+            return {
+                "max_pages": self.max_pages,
+                "max_bytes": self.max_bytes,
+                "pages_fetched": self.pages_fetched,
+                "bytes_downloaded": self.bytes_downloaded,
+            }
+
+
+class CrawlFrontier:
+    """Disk-backed URL frontier and visited set for a single institution."""
+
+    def __init__(self, path: Path, *, checkpoint_interval: int = 25) -> None:
+        self.path = path
+        self.checkpoint_interval = max(1, checkpoint_interval)
+
+    def load(self) -> CrawlFrontierState | None:
+        if not self.path.exists():
+            return None
+        try:
+            return CrawlFrontierState.model_validate_json(self.path.read_text(encoding="utf-8"))
+        except ValueError:
+            get_logger(component="crawl_frontier").warning("Ignoring corrupt frontier", path=str(self.path))
+            return None
+
+    def save(self, state: CrawlFrontierState) -> None:
+        _atomic_write_text(self.path, state.model_dump_json())
+
+    def clear(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+class _SnapshotAppender:
+    """Appends snapshots to a JSONL file from concurrent crawl callbacks."""
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._handle = path.open("a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def __call__(self, snapshot: PageSnapshot) -> None:
+        line = json.dumps(snapshot.model_dump(mode="json"), ensure_ascii=False)
+        with self._lock:
+            self._handle.write(line + "\n")
+            self._handle.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._handle.close()
+
+
+def _dedupe_snapshot_file(path: Path) -> int:
+    """Drop repeated URLs left behind by interrupted runs; returns the row count."""
+
+    if not path.exists():
+        return 0
+    seen: set[str] = set()
+    lines: List[str] = []
+    with path.open("r", encoding="utf-8") as handle:
+        for raw_line in handle:
+            stripped = raw_line.strip()
+            if not stripped:
+                continue
+            try:
+                url = json.loads(stripped).get("url")
+            except json.JSONDecodeError:
+                continue
+            if url in seen:
+                continue
+            seen.add(url)
+            lines.append(stripped)
+    _atomic_write_text(path, "".join(line + "\n" for line in lines))
+    return len(lines)
+
+
+def load_crawl_manifest(path: Path) -> List[CrawlConfig]:
+    """Load institution crawl configurations from a YAML or JSON manifest.
+
+    The manifest may be a list of crawl configs or a mapping with an
+    ``institutions`` list; an optional ``defaults`` mapping is merged into
+    every entry.
+    """
+
+    raw = yaml.safe_load(path.read_text(encoding="utf-8")) or []
+    defaults: Mapping[str, Any] = {}
+    if isinstance(raw, Mapping):
+        defaults = raw.get("defaults") or {}
+        entries = raw.get("institutions") or []
+    else:
+        entries = raw
+    if not isinstance(entries, Sequence):
+        raise ValueError("Crawl manifest must list institutions")
+    configs = [CrawlConfig.model_validate({**defaults, **dict(entry)}) for entry in entries]
+    identifiers = [config.institution_id for config in configs]
+    duplicates = sorted({identifier for identifier in identifiers if identifiers.count(identifier) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate institution ids in crawl manifest: {', '.join(duplicates)}")
+    return configs
+
+
+class BatchCrawler:
+    """Crawl several institutions concurrently under shared global budgets.
+
+    Layout under ``output_dir``:
+
+    - ``snapshots/<institution>.jsonl`` — snapshots appended as pages complete.
+    - ``frontier/<institution>.json`` — periodic queue/visited checkpoints.
+    - ``summaries/<institution>.json`` — per-institution result, written on completion.
+    - ``batch_summary.json`` — aggregate report for the invocation.
+
+    Resuming skips institutions whose summary is ``completed`` and continues
+    the others from their saved frontier.
+    """
+
+    def __init__(
+        self,
+        miner: "WebMiner",
+        output_dir: Path,
+        *,
+        max_workers: int = 2,
+        max_total_pages: int | None = None,
+        max_total_bytes: int | None = None,
+        checkpoint_interval: int = 25,
+    ) -> None:
+        self.miner = miner
+        self.output_dir = ensure_directory(output_dir)
+        self.max_workers = max(1, max_workers)
+        self.budget = SharedCrawlBudget(max_pages=max_total_pages, max_bytes=max_total_bytes)
+        self.checkpoint_interval = checkpoint_interval
+        self._logger = get_logger(component="batch_crawler")
+
+    def _paths(self, institution_id: str) -> Dict[str, Path]:
+        slug = _slug(institution_id)
+        return {
+            "snapshots": self.output_dir / "snapshots" / f"{slug}.jsonl",
+            "frontier": self.output_dir / "frontier" / f"{slug}.json",
+            "summary": self.output_dir / "summaries" / f"{slug}.json",
+        }
+
+    def _load_summary(self, path: Path) -> Dict[str, Any] | None:
+        if not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            return None
+
+    def _crawl_one(self, config: CrawlConfig, *, resume: bool) -> Dict[str, Any]:
+        paths = self._paths(config.institution_id)
+        frontier = CrawlFrontier(paths["frontier"], checkpoint_interval=self.checkpoint_interval)
+        if resume:
+            previous = self._load_summary(paths["summary"])
+            if previous and previous.get("status") == "completed":
+                self._logger.info("Skipping completed institution", institution=config.institution_id)
+                return {**previous, "skipped": True}
+        else:
+            frontier.clear()
+            paths["snapshots"].unlink(missing_ok=True)
+        paths["summary"].unlink(missing_ok=True)
+
+        if not self.budget.within_limits():
+            result = CrawlResult(institution_id=config.institution_id)
+            result.metrics["stop_reason"] = "shared_budget"
+        else:
+            appender = _SnapshotAppender(paths["snapshots"])
+            try:
+                result = self.miner.crawl_institution(
+                    config,
+                    frontier=frontier,
+                    shared_budget=self.budget,
+                    on_snapshot=appender,
+                )
+            finally:
+                appender.close()
+
+        stop_reason = str(result.metrics.get("stop_reason", "frontier_exhausted"))
+        status = "interrupted" if stop_reason == "shared_budget" else "completed"
+        snapshot_count = _dedupe_snapshot_file(paths["snapshots"])
+        if status == "completed":
+            frontier.clear()
+        summary = {
+            "institution_id": config.institution_id,
+            "status": status,
+            "stop_reason": stop_reason,
+            "snapshots": snapshot_count,
+            "errors": len(result.errors),
+            "pages_fetched": result.budget_status.pages_fetched,
+            "bytes_downloaded": result.budget_status.bytes_downloaded,
+            "snapshots_path": str(paths["snapshots"]),
+            "finished_at": result.finished_at.isoformat(),
+        }
+        serialize_json(summary, paths["summary"])
+        self._logger.info("Institution crawl finished", institution=config.institution_id, status=status)
+        return summary
+
+    def run(self, configs: Iterable[CrawlConfig], *, resume: bool = True) -> Dict[str, Any]:
+        ordered = list(configs)
+        summaries: Dict[str, Dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._crawl_one, config, resume=resume): config.institution_id
+                for config in ordered
+            }
+            for future in as_completed(futures):
+                institution_id = futures[future]
+                try:
+                    summaries[institution_id] = future.result()
+                except Exception as exc:
+                    self._logger.error("Institution crawl failed", institution=institution_id, error=str(exc))
+                    summaries[institution_id] = {
+                        "institution_id": institution_id,
+                        "status": "failed",
+                        "error": str(exc),
+                    }
+
+        report = {
+            "institutions": [summaries[config.institution_id] for config in ordered],
+            "shared_budget": self.budget.to_dict(),
+            "completed": sum(1 for item in summaries.values() if item.get("status") == "completed"),
+            "interrupted": sum(1 for item in summaries.values() if item.get("status") == "interrupted"),
+            "failed": sum(1 for item in summaries.values() if item.get("status") == "failed"),
+        }
+        serialize_json(report, self.output_dir / "batch_summary.json")
+        return report
+
+
+__all__ = [
+    "BatchCrawler",
+    "CrawlFrontier",
+    "SharedCrawlBudget",
+    "load_crawl_manifest",
+]
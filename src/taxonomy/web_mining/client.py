@@ -2,24 +2,21 @@
 
 from __future__ import annotations
 
-import gzip
 import os
 import re
 import time
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Iterable, List, Optional, Sequence
+from typing import Callable, Deque, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 import requests
 from requests import Response
 from requests.exceptions import RequestException
 from xml.etree import ElementTree as ET
 
-try:  # pragma: no cover - optional dependency
-    from bs4 import BeautifulSoup
-except Exception:  # pragma: no cover - fallback path
-    BeautifulSoup = None
-
 try:  # pragma: no cover - optional dependency
     from firecrawl.v2 import FirecrawlClient
     from firecrawl.v2.types import Document
@@ -31,13 +28,20 @@ from taxonomy.entities.core import PageSnapshot
 from taxonomy.utils.logging import get_logger
 
 from .cache import CacheManager
-from .content import ContentPolicyError, ContentProcessor
-from .models import CrawlConfig, CrawlError, CrawlResult, CrawlSession, URLQueueEntry
+from .content import ContentPolicyError, ContentProcessor, extract_links
+from .extraction import ExtractionJob, ExtractionOutcome, ExtractionStage
+from .batch import CrawlFrontier, SharedCrawlBudget
+from .models import CrawlConfig, CrawlError, CrawlFrontierState, CrawlResult, CrawlSession, URLQueueEntry
 from .observability import MetricsCollector
 from .robots import RobotsChecker
 from .utils import RateLimiter, canonicalize_url, retryable, should_follow, within_content_budget
 
 
+_SITEMAP_CHUNK_BYTES = 64 * 1024
+
+SitemapPayload = Union[str, bytes, Iterable[bytes]]
+
+
 class FetchError(Exception):
     """Exception raised when a network fetch fails."""
 
@@ -101,11 +105,17 @@ class WebMiner:
         rate_limit_per_sec: float = 1.0,
         firecrawl_api_key: str | None = None,
         firecrawl_endpoint: str | None = None,
+        extraction_workers: int = 0,
+        extraction_queue_size: int | None = None,
+        sitemap_concurrency: int | None = None,
     ) -> None:
         self.cache = cache
         self.content_processor = content_processor
         self.robots_checker = robots_checker
         self.user_agent = user_agent
+        self.extraction_workers = max(0, extraction_workers)
+        self.extraction_queue_size = extraction_queue_size
+        self.sitemap_concurrency = max(1, sitemap_concurrency or max_concurrency)
         self.rate_limiter = RateLimiter(rate_per_second=rate_limit_per_sec, burst=max_concurrency)
         self._logger = get_logger(component="web_miner", user_agent=user_agent)
         self._firecrawl: FirecrawlClient | None = None
@@ -117,7 +127,22 @@ class WebMiner:
             else:
                 self._firecrawl = FirecrawlClient(api_key=api_key, timeout=timeout)
 
-    def crawl_institution(self, config: CrawlConfig) -> CrawlResult:
+    def crawl_institution(
+        self,
+        config: CrawlConfig,
+        *,
+        frontier: CrawlFrontier | None = None,
+        shared_budget: SharedCrawlBudget | None = None,
+        on_snapshot: Callable[[PageSnapshot], None] | None = None,
+    ) -> CrawlResult:
+        """Crawl one institution.
+
+        ``frontier`` persists the queue and visited set so an interrupted crawl
+        resumes where it stopped, ``shared_budget`` caps pages/bytes across
+        concurrent crawls, and ``on_snapshot`` receives snapshots as soon as
+        they are accepted.
+        """
+
         metrics = MetricsCollector(config.institution_id)
         session = CrawlSession(config=config)
         ttl_override_seconds = config.ttl_days * 24 * 3600
@@ -139,16 +164,81 @@ class WebMiner:
                 return False
             return any(matcher.search(candidate) for matcher in include_matchers)
 
-        session.enqueue_seed_urls(prioritize=matches_include)
-        queued_urls: set[str] = {entry.url for entry in session.queue.iter_pending()}
         visited: set[str] = set()
+        restored = frontier.load() if frontier is not None else None
+        if restored is not None:
+            session.queue.extend(restored.queue)
+            queued_urls: set[str] = set(restored.queued)
+            visited.update(restored.visited)
+            session.budget.pages_fetched = restored.pages_fetched
+            session.budget.bytes_downloaded = restored.bytes_downloaded
+            session.budget.depth_max_seen = restored.depth_max_seen
+            metrics.increment("frontier_resumed")
+            self._logger.info(
+                "Resuming crawl from frontier",
+                institution=config.institution_id,
+                pending=len(session.queue),
+                visited=len(visited),
+            )
+        else:
+            session.enqueue_seed_urls(prioritize=matches_include)
+            queued_urls = {entry.url for entry in session.queue.iter_pending()}
+        stage = ExtractionStage(
+            self.content_processor,
+            metrics=metrics,
+            max_workers=self.extraction_workers,
+            max_pending=self.extraction_queue_size,
+        )
+        pages_since_checkpoint = 0
+
+        def save_frontier() -> None:
+            if frontier is None:
+                return
+            in_flight = stage.pending_jobs()
+            in_flight_urls = {job.queue_url for job in in_flight}
+            frontier.save(
+                CrawlFrontierState(
+                    institution_id=config.institution_id,
+                    queue=[
+                        URLQueueEntry(url=job.queue_url, depth=job.depth, discovered_from=None)
+                        for job in in_flight
+                    ]
+                    + list(session.queue.iter_pending()),
+                    visited=sorted(visited - in_flight_urls),
+                    queued=sorted(queued_urls),
+                    pages_fetched=session.budget.pages_fetched,
+                    bytes_downloaded=session.budget.bytes_downloaded,
+                    depth_max_seen=session.budget.depth_max_seen,
+                )
+            )
+
+        def page_accepted(snapshot: PageSnapshot) -> None:
+            nonlocal pages_since_checkpoint
+            if on_snapshot is not None:
+                on_snapshot(snapshot)
+            if shared_budget is not None:
+                shared_budget.record_page()
+            pages_since_checkpoint += 1
+
+        def checkpoint_if_due() -> None:
+            # Called only once an accepted page's outlinks are queued, so a saved
+            # frontier never marks a page visited without its discovered links.
+            nonlocal pages_since_checkpoint
+            if frontier is not None and pages_since_checkpoint >= frontier.checkpoint_interval:
+                save_frontier()
+                pages_since_checkpoint = 0
 
         def has_capacity_for_new_url() -> bool:
             if config.max_pages:
-                return len(session.queue) + session.budget.pages_fetched < config.max_pages
+                return len(session.queue) + stage.pending + session.budget.pages_fetched < config.max_pages
             return True
 
-        if config.respect_robots and config.max_depth >= 1:
+        def accept_sitemap_url(candidate: str) -> bool:
+            if candidate in queued_urls or candidate in visited:
+                return False
+            return should_follow(candidate, config.allowed_domains, config.disallowed_paths)
+
+        if restored is None and config.respect_robots and config.max_depth >= 1:
             processed_sitemaps: set[str] = set()
             for seed_url in config.seed_urls:
                 try:
@@ -176,6 +266,7 @@ class WebMiner:
                         timeout=config.page_timeout_seconds,
                         seen=set(),
                         max_urls=remaining_capacity,
+                        accept=accept_sitemap_url,
                     )
                     for candidate in discovered_urls:
                         if candidate in queued_urls or candidate in visited:
@@ -196,94 +287,25 @@ class WebMiner:
 
         result = CrawlResult(institution_id=config.institution_id)
 
-        while True:
-            if not session.budget.within_limits():
-                self._logger.info("Budget exhausted", institution=config.institution_id)
-                break
-            queue_entry = session.queue.dequeue()
-            if queue_entry is None:
-                break
-            url = queue_entry.url
-            if url in visited:
-                continue
-            visited.add(url)
-            session.budget.depth_max_seen = max(session.budget.depth_max_seen, queue_entry.depth)
-            if queue_entry.depth > config.max_depth:
-                continue
-            if not should_follow(url, config.allowed_domains, config.disallowed_paths):
-                metrics.increment("filtered")
-                continue
-            if config.respect_robots and not self.robots_checker.is_allowed(url):
-                metrics.record_fetch(robots_blocked=True)
-                continue
-            crawl_delay = self.robots_checker.crawl_delay(url) if config.respect_robots else None
-            if crawl_delay and config.respect_crawl_delay:
-                time.sleep(crawl_delay)
-
-            cached_snapshot = self.cache.get(url)
-            if cached_snapshot:
-                metrics.record_cache_hit()
-                result.add_snapshot(cached_snapshot)
-                session.visited[url] = datetime.now(timezone.utc)
-                session.budget.pages_fetched += 1
-                continue
-
-            metrics.record_cache_miss()
-            try:
-                fetch_response = self._fetch_url(url, config)
-            except ContentPolicyError as exc:
-                error = CrawlError(url=url, error_type="content_policy", detail=str(exc), retryable=False)
-                session.record_error(error)
-                result.add_error(error)
-                metrics.record_error("content_policy")
-                continue
-            except FetchError as exc:
-                error = CrawlError(url=url, error_type=exc.error_type, detail=str(exc), retryable=exc.retryable)
-                session.record_error(error)
-                result.add_error(error)
-                metrics.record_error(exc.error_type)
-                continue
-            except Exception as exc:  # pragma: no cover - defensive catch
-                error = CrawlError(url=url, error_type="fetch", detail=str(exc), retryable=False)
-                session.record_error(error)
-                result.add_error(error)
-                metrics.record_error("fetch")
-                continue
-
-            session.budget.bytes_downloaded += fetch_response.bytes_downloaded
-            if not within_content_budget(fetch_response.bytes_downloaded, config.max_content_size_mb):
-                metrics.record_error("over_budget")
-                continue
-
-            try:
-                snapshot, content_meta = self.content_processor.process(
-                    institution=config.institution_id,
-                    url=fetch_response.url,
-                    http_status=fetch_response.status_code,
-                    content_type=fetch_response.content_type,
-                    body=fetch_response.body,
-                    fetched_at=fetch_response.fetched_at,
-                    rendered=fetch_response.rendered,
-                    robots_blocked=False,
-                    redirects=fetch_response.redirects,
-                    metrics=metrics,
+        def handle_outcome(outcome: ExtractionOutcome) -> None:
+            job = outcome.job
+            if outcome.error_type is not None or outcome.snapshot is None:
+                error_type = outcome.error_type or "content"
+                error = CrawlError(
+                    url=job.queue_url,
+                    error_type=error_type,
+                    detail=outcome.error_detail or "Content extraction failed",
+                    retryable=False,
                 )
-            except ContentPolicyError as exc:
-                error = CrawlError(url=url, error_type="content_policy", detail=str(exc), retryable=False)
                 session.record_error(error)
                 result.add_error(error)
-                metrics.record_error("content_policy")
-                continue
-            except Exception as exc:
-                error = CrawlError(url=url, error_type="content", detail=str(exc), retryable=False)
-                session.record_error(error)
-                result.add_error(error)
-                metrics.record_error("content")
-                continue
+                metrics.record_error(error_type)
+                return
 
+            snapshot = outcome.snapshot
             if snapshot.http_status >= 400:
                 error = CrawlError(
-                    url=url,
+                    url=job.queue_url,
                     error_type="http",
                     detail=f"HTTP status {snapshot.http_status}",
                     retryable=False,
@@ -291,16 +313,20 @@ class WebMiner:
                 session.record_error(error)
                 result.add_error(error)
                 metrics.record_error("http")
-                continue
+                return
 
             self.cache.store(snapshot, metrics=metrics, ttl_seconds=ttl_override_seconds)
             result.add_snapshot(snapshot)
-            session.visited[url] = fetch_response.fetched_at
+            session.visited[job.queue_url] = job.fetched_at
             session.budget.pages_fetched += 1
-            metrics.record_fetch(rendered=fetch_response.rendered)
-
-            if queue_entry.depth < config.max_depth and snapshot.html:
-                discovered = self._discover_links(snapshot.html, snapshot.url)
+            metrics.record_fetch(rendered=job.rendered)
+            page_accepted(snapshot)
+
+            if job.depth < config.max_depth and snapshot.html:
+                if outcome.content_meta is not None:
+                    discovered = outcome.content_meta.outlinks
+                else:  # pragma: no cover - processors always return metadata
+                    discovered = self._discover_links(snapshot.html, snapshot.url)
                 followable = [link for link in discovered if should_follow(link, config.allowed_domains, config.disallowed_paths)]
                 for link in followable:
                     if link in visited or link in queued_urls:
@@ -308,11 +334,115 @@ class WebMiner:
                     if not has_capacity_for_new_url():
                         break
                     session.queue.enqueue(
-                        URLQueueEntry(url=link, depth=queue_entry.depth + 1, discovered_from=snapshot.url),
+                        URLQueueEntry(url=link, depth=job.depth + 1, discovered_from=snapshot.url),
                         priority=matches_include(link),
                     )
                     queued_urls.add(link)
                     metrics.increment("urls_queued")
+            checkpoint_if_due()
+
+        stop_reason = "frontier_exhausted"
+        try:
+            while True:
+                for outcome in stage.poll():
+                    handle_outcome(outcome)
+                if not session.budget.within_limits():
+                    self._logger.info("Budget exhausted", institution=config.institution_id)
+                    stop_reason = "budget"
+                    break
+                if shared_budget is not None and not shared_budget.within_limits():
+                    self._logger.info("Shared budget exhausted", institution=config.institution_id)
+                    stop_reason = "shared_budget"
+                    break
+                if stage.pending and config.max_pages and session.budget.pages_fetched + stage.pending >= config.max_pages:
+                    # In-flight extractions may still fill the page budget.
+                    handle_outcome(stage.wait_next())
+                    continue
+                queue_entry = session.queue.dequeue()
+                if queue_entry is None:
+                    if stage.pending:
+                        handle_outcome(stage.wait_next())
+                        continue
+                    break
+                url = queue_entry.url
+                if url in visited:
+                    continue
+                visited.add(url)
+                session.budget.depth_max_seen = max(session.budget.depth_max_seen, queue_entry.depth)
+                if queue_entry.depth > config.max_depth:
+                    continue
+                if not should_follow(url, config.allowed_domains, config.disallowed_paths):
+                    metrics.increment("filtered")
+                    continue
+                if config.respect_robots and not self.robots_checker.is_allowed(url):
+                    metrics.record_fetch(robots_blocked=True)
+                    continue
+                crawl_delay = self.robots_checker.crawl_delay(url) if config.respect_robots else None
+                if crawl_delay and config.respect_crawl_delay:
+                    time.sleep(crawl_delay)
+
+                cached_snapshot = self.cache.get(url)
+                if cached_snapshot:
+                    metrics.record_cache_hit()
+                    result.add_snapshot(cached_snapshot)
+                    session.visited[url] = datetime.now(timezone.utc)
+                    session.budget.pages_fetched += 1
+                    page_accepted(cached_snapshot)
+                    checkpoint_if_due()
+                    continue
+
+                metrics.record_cache_miss()
+                fetch_started = time.perf_counter()
+                try:
+                    fetch_response = self._fetch_url(url, config)
+                except ContentPolicyError as exc:
+                    error = CrawlError(url=url, error_type="content_policy", detail=str(exc), retryable=False)
+                    session.record_error(error)
+                    result.add_error(error)
+                    metrics.record_error("content_policy")
+                    continue
+                except FetchError as exc:
+                    error = CrawlError(url=url, error_type=exc.error_type, detail=str(exc), retryable=exc.retryable)
+                    session.record_error(error)
+                    result.add_error(error)
+                    metrics.record_error(exc.error_type)
+                    continue
+                except Exception as exc:  # pragma: no cover - defensive catch
+                    error = CrawlError(url=url, error_type="fetch", detail=str(exc), retryable=False)
+                    session.record_error(error)
+                    result.add_error(error)
+                    metrics.record_error("fetch")
+                    continue
+                finally:
+                    metrics.record_timing("fetch_seconds", time.perf_counter() - fetch_started)
+
+                session.budget.bytes_downloaded += fetch_response.bytes_downloaded
+                if shared_budget is not None:
+                    shared_budget.record_bytes(fetch_response.bytes_downloaded)
+                if not within_content_budget(fetch_response.bytes_downloaded, config.max_content_size_mb):
+                    metrics.record_error("over_budget")
+                    continue
+
+                job = ExtractionJob(
+                    institution=config.institution_id,
+                    queue_url=url,
+                    depth=queue_entry.depth,
+                    url=fetch_response.url,
+                    http_status=fetch_response.status_code,
+                    content_type=fetch_response.content_type,
+                    body=fetch_response.body,
+                    fetched_at=fetch_response.fetched_at,
+                    rendered=fetch_response.rendered,
+                    redirects=fetch_response.redirects,
+                )
+                for outcome in stage.submit(job):
+                    handle_outcome(outcome)
+
+            for outcome in stage.drain():
+                handle_outcome(outcome)
+        finally:
+            save_frontier()
+            stage.close()
 
         result.budget_status = session.budget
         metrics.record_budget(
@@ -321,6 +451,7 @@ class WebMiner:
             elapsed_seconds=session.budget.elapsed_seconds(),
         )
         result.merge_metrics(metrics.finalize())
+        result.metrics["stop_reason"] = stop_reason
         result.errors.extend(session.errors)
         return result
 
@@ -427,10 +558,10 @@ class WebMiner:
             bytes_downloaded=len(final_body),
         )
 
-    def _fetch_sitemap(self, sitemap_url: str, timeout: float) -> str | None:
+    def _fetch_sitemap(self, sitemap_url: str, timeout: float) -> SitemapPayload | None:
         headers = {"User-Agent": self.user_agent}
         try:
-            response = requests.get(sitemap_url, headers=headers, timeout=timeout)
+            response = requests.get(sitemap_url, headers=headers, timeout=timeout, stream=True)
             response.raise_for_status()
         except RequestException as exc:
             self._logger.debug("Sitemap fetch failed", sitemap_url=sitemap_url, error=str(exc))
@@ -439,22 +570,111 @@ class WebMiner:
             self._logger.debug("Sitemap fetch error", sitemap_url=sitemap_url, error=str(exc))
             return None
 
+        content_type = response.headers.get("content-type", "").lower()
+        gzipped = "gzip" in content_type or sitemap_url.endswith(".gz")
+        return self._iter_sitemap_chunks(response, sitemap_url, gzipped=gzipped)
+
+    def _iter_sitemap_chunks(self, response: Response, sitemap_url: str, *, gzipped: bool) -> Iterator[bytes]:
+        decompressor = None
+        first = True
         try:
-            content = response.content
-            content_type = response.headers.get("content-type", "").lower()
-            if "gzip" in content_type or sitemap_url.endswith(".gz"):
-                try:
-                    content = gzip.decompress(content)
-                except OSError as exc:
-                    self._logger.debug("Sitemap decompress failed", sitemap_url=sitemap_url, error=str(exc))
-                    return None
-            try:
-                return content.decode("utf-8")
-            except UnicodeDecodeError:
-                return content.decode("utf-8", errors="ignore")
+            for chunk in response.iter_content(chunk_size=_SITEMAP_CHUNK_BYTES):
+                if not chunk:
+                    continue
+                if first:
+                    first = False
+                    # Servers frequently decode .gz sitemaps transparently; sniff the magic bytes.
+                    if gzipped and chunk[:2] == b"\x1f\x8b":
+                        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                if decompressor is not None:
+                    try:
+                        chunk = decompressor.decompress(chunk)
+                    except zlib.error as exc:
+                        self._logger.debug("Sitemap decompress failed", sitemap_url=sitemap_url, error=str(exc))
+                        return
+                if chunk:
+                    yield chunk
+            if decompressor is not None:
+                tail = decompressor.flush()
+                if tail:
+                    yield tail
+        except RequestException as exc:
+            # The body streams lazily, so connection errors surface here rather
+            # than in ``_fetch_sitemap``; the parser keeps what it already read.
+            self._logger.debug("Sitemap fetch failed", sitemap_url=sitemap_url, error=str(exc))
         finally:
             response.close()
 
+    def _parse_sitemap(
+        self,
+        payload: SitemapPayload,
+        sitemap_url: str,
+        *,
+        accept: Callable[[str], bool] | None = None,
+        limit: int | None = None,
+    ) -> Tuple[bool, List[str]]:
+        """Incrementally parse a sitemap, returning ``(is_index, locations)``.
+
+        Page locations are filtered through ``accept`` as they are parsed and
+        parsing stops once ``limit`` accepted locations were seen. Index
+        documents return their child sitemap URLs unfiltered.
+        """
+
+        if isinstance(payload, (str, bytes)):
+            chunks: Iterable[str | bytes] = (
+                payload[offset : offset + _SITEMAP_CHUNK_BYTES]
+                for offset in range(0, len(payload), _SITEMAP_CHUNK_BYTES)
+            )
+        else:
+            chunks = payload
+
+        parser = ET.XMLPullParser(events=("start", "end"))
+        root: ET.Element | None = None
+        is_index = False
+        locations: List[str] = []
+        try:
+            for chunk in chunks:
+                parser.feed(chunk)
+                for event, element in parser.read_events():
+                    if event == "start":
+                        if root is None:
+                            root = element
+                            is_index = element.tag.lower().endswith("sitemapindex")
+                        continue
+                    tag = element.tag.lower()
+                    if tag.endswith("loc"):
+                        candidate = (element.text or "").strip()
+                        if candidate and (is_index or accept is None or accept(candidate)):
+                            locations.append(candidate)
+                            if not is_index and limit is not None and len(locations) >= limit:
+                                return is_index, locations
+                    elif root is not None and (tag.endswith("}url") or tag.endswith("}sitemap") or tag in {"url", "sitemap"}):
+                        root.clear()
+            parser.close()
+        except ET.ParseError as exc:
+            self._logger.debug(
+                "Sitemap parse failed",
+                sitemap_url=sitemap_url,
+                error=str(exc),
+                parsed=len(locations),
+            )
+        finally:
+            if not isinstance(payload, (str, bytes)) and hasattr(payload, "close"):
+                payload.close()  # type: ignore[union-attr]
+        return is_index, locations
+
+    def _load_sitemap(
+        self,
+        sitemap_url: str,
+        timeout: float,
+        accept: Callable[[str], bool] | None,
+        limit: int | None,
+    ) -> Tuple[bool, List[str]]:
+        payload = self._fetch_sitemap(sitemap_url, timeout)
+        if payload is None:
+            return False, []
+        return self._parse_sitemap(payload, sitemap_url, accept=accept, limit=limit)
+
     def _collect_sitemap_urls(
         self,
         sitemap_url: str,
@@ -464,87 +684,104 @@ class WebMiner:
         depth: int = 0,
         max_depth: int = 2,
         max_urls: int | None = None,
+        accept: Callable[[str], bool] | None = None,
     ) -> List[str]:
+        """Collect page URLs from a sitemap tree, fetching child sitemaps concurrently.
+
+        Children of an index are fetched ``sitemap_concurrency`` at a time but
+        consumed in document order, so the returned list is deterministic.
+        URLs are filtered by ``accept`` and de-duplicated while streaming, and
+        collection stops as soon as ``max_urls`` URLs were accepted.
+        """
+
         if sitemap_url in seen or depth > max_depth:
             return []
-        seen.add(sitemap_url)
-
-        body = self._fetch_sitemap(sitemap_url, timeout)
-        if body is None:
+        if max_urls is not None and max_urls <= 0:
             return []
+        urls: List[str] = []
+        emitted: set[str] = set()
+        with ThreadPoolExecutor(max_workers=self.sitemap_concurrency) as executor:
+            self._gather_sitemaps(
+                [sitemap_url],
+                executor=executor,
+                timeout=timeout,
+                seen=seen,
+                depth=depth,
+                max_depth=max_depth,
+                max_urls=max_urls,
+                accept=accept,
+                urls=urls,
+                emitted=emitted,
+            )
+        return urls
 
-        try:
-            root = ET.fromstring(body)
-        except ET.ParseError as exc:
-            self._logger.debug("Sitemap parse failed", sitemap_url=sitemap_url, error=str(exc))
-            return []
+    def _gather_sitemaps(
+        self,
+        sitemap_urls: Sequence[str],
+        *,
+        executor: ThreadPoolExecutor,
+        timeout: float,
+        seen: set[str],
+        depth: int,
+        max_depth: int,
+        max_urls: int | None,
+        accept: Callable[[str], bool] | None,
+        urls: List[str],
+        emitted: set[str],
+    ) -> None:
+        pending: Deque[Future[Tuple[bool, List[str]]]] = deque()
+        candidates = iter(sitemap_urls)
 
-        urls: List[str] = []
-        tag = root.tag.lower()
-        if tag.endswith("sitemapindex") and depth < max_depth:
-            for loc in root.findall(".//{*}loc"):
-                nested = (loc.text or "").strip()
-                if not nested:
-                    continue
-                remaining = None if max_urls is None else max_urls - len(urls)
+        def budget_left() -> int | None:
+            return None if max_urls is None else max_urls - len(urls)
+
+        def fill_window() -> None:
+            while len(pending) < self.sitemap_concurrency:
+                remaining = budget_left()
                 if remaining is not None and remaining <= 0:
-                    break
-                nested_urls = self._collect_sitemap_urls(
-                    nested,
-                    timeout=timeout,
-                    seen=seen,
-                    depth=depth + 1,
-                    max_depth=max_depth,
-                    max_urls=remaining,
-                )
-                urls.extend(nested_urls)
-                if max_urls is not None and len(urls) >= max_urls:
-                    return urls[:max_urls]
-        else:
-            for loc in root.findall(".//{*}loc"):
-                candidate = (loc.text or "").strip()
-                if not candidate:
+                    return
+                nested = next(candidates, None)
+                if nested is None:
+                    return
+                if not nested or nested in seen:
                     continue
-                urls.append(candidate)
-                if max_urls is not None and len(urls) >= max_urls:
-                    return urls
-
-        return urls
+                seen.add(nested)
+                pending.append(executor.submit(self._load_sitemap, nested, timeout, accept, remaining))
+
+        fill_window()
+        while pending:
+            remaining = budget_left()
+            if remaining is not None and remaining <= 0:
+                for future in pending:
+                    future.cancel()
+                return
+            is_index, locations = pending.popleft().result()
+            if is_index:
+                if depth < max_depth:
+                    self._gather_sitemaps(
+                        locations,
+                        executor=executor,
+                        timeout=timeout,
+                        seen=seen,
+                        depth=depth + 1,
+                        max_depth=max_depth,
+                        max_urls=max_urls,
+                        accept=accept,
+                        urls=urls,
+                        emitted=emitted,
+                    )
+            else:
+                for candidate in locations:
+                    if candidate in emitted:
+                        continue
+                    emitted.add(candidate)
+                    urls.append(candidate)
+                    if max_urls is not None and len(urls) >= max_urls:
+                        break
+            fill_window()
 
     def _discover_links(self, html: str, base_url: str) -> Sequence[str]:
-        seen: set[str] = set()
-        discovered: List[str] = []
-
-        def add_candidate(raw_href: str) -> None:
-            href = raw_href.strip()
-            if not href:
-                return
-            try:
-                normalized = canonicalize_url(href, base=base_url)
-            except Exception:
-                return
-            if normalized in seen:
-                return
-            seen.add(normalized)
-            discovered.append(normalized)
-
-        if BeautifulSoup is not None:
-            soup = BeautifulSoup(html, "html.parser")
-            for anchor in soup.find_all("a", href=True):
-                href_value = anchor["href"]
-                if isinstance(href_value, list):  # pragma: no cover - defensive
-                    for option in href_value:
-                        add_candidate(str(option))
-                else:
-                    add_candidate(str(href_value))
-            return discovered
-
-        pattern = re.compile(r"<a[^>]+href\s*=\s*(?:\"([^\"]+)\"|'([^']+)'|([^\s>]+))", re.IGNORECASE)
-        for match in pattern.finditer(html):
-            href = next((group for group in match.groups() if group), "")
-            if href:
-                add_candidate(href)
-        return discovered
+        return extract_links(html, base_url)
 
 
 __all__ = ["WebMiner", "FetchResponse"]
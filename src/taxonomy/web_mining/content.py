@@ -70,6 +70,57 @@ class LanguageDetectionResult:
     confidence: float
 
 
+class _LinkAccumulator:
+    """Canonicalises and de-duplicates anchor targets in document order."""
+
+    def __init__(self, base_url: str | None) -> None:
+        self.base_url = base_url
+        self.links: List[str] = []
+        self._seen: set[str] = set()
+
+    def add(self, raw_href: str) -> None:
+        href = raw_href.strip()
+        if not href:
+            return
+        try:
+            normalized = canonicalize_url(href, base=self.base_url)
+        except Exception:
+            return
+        if normalized in self._seen:
+            return
+        self._seen.add(normalized)
+        self.links.append(normalized)
+
+
+class _AnchorCollector(HTMLParser):
+    """Tokenizer-only pass that records ``<a href>`` values without building a tree."""
+
+    def __init__(self, accumulator: _LinkAccumulator) -> None:
+        super().__init__(convert_charrefs=True)
+        self.accumulator = accumulator
+
+    def handle_starttag(self, tag: str, attrs: List[tuple[str, str | None]]) -> None:
+        if tag != "a":
+            return
+        for name, value in attrs:
+            if name == "href" and value:
+                self.accumulator.add(value)
+                return
+
+
+def extract_links(html: str, base_url: str | None = None) -> List[str]:
+    """Return canonical outlinks from ``html`` in document order."""
+
+    accumulator = _LinkAccumulator(base_url)
+    collector = _AnchorCollector(accumulator)
+    try:
+        collector.feed(html)
+        collector.close()
+    except Exception:  # pragma: no cover - malformed markup
+        pass
+    return accumulator.links
+
+
 class ContentProcessor:
     """Processes raw HTTP responses into structured page snapshots."""
 
@@ -89,6 +140,15 @@ class ContentProcessor:
         self.pdf_size_limit_mb = pdf_size_limit_mb
         self._logger = get_logger(component="content")
 
+    def __getstate__(self) -> dict[str, object]:
+        state = self.__dict__.copy()
+        state.pop("_logger", None)
+        return state
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        self.__dict__.update(state)
+        self._logger = get_logger(component="content")
+
     def _detect_language(self, text: str) -> LanguageDetectionResult:
         if not text.strip():
             return LanguageDetectionResult(language="und", confidence=0.0)
@@ -143,7 +203,8 @@ class ContentProcessor:
         self,
         html: str,
         base_url: str | None = None,
-    ) -> Tuple[str, str | None, str | None, str | None]:
+    ) -> Tuple[str, str | None, str | None, str | None, List[str]]:
+        links = _LinkAccumulator(base_url)
         if BeautifulSoup is None:
             class _SimpleHTMLExtractor(HTMLParser):
                 BLOCK_TAGS = {
@@ -199,6 +260,10 @@ class ContentProcessor:
                         if content and self.canonical is None and prop == "og:url":
                             self._set_canonical(content)
                         return
+                    if tag_lower == "a":
+                        href = attrs_dict.get("href", "")
+                        if href:
+                            links.add(href)
                     if tag_lower == "link":
                         rel = attrs_dict.get("rel", "").lower().split()
                         href = attrs_dict.get("href", "")
@@ -302,9 +367,16 @@ class ContentProcessor:
                 text = clean_text("\n".join(lines))
             else:
                 text = clean_text(re.sub(r"<[^>]+>", " ", html))
-            return text, extractor.canonical, extractor.title, extractor.description
+            return text, extractor.canonical, extractor.title, extractor.description, links.links
 
         soup = BeautifulSoup(html, "html.parser")
+        for anchor in soup.find_all("a", href=True):
+            href_value = anchor["href"]
+            if isinstance(href_value, list):  # pragma: no cover - defensive
+                for option in href_value:
+                    links.add(str(option))
+            else:
+                links.add(str(href_value))
         for element in soup(["script", "style", "noscript"]):
             element.decompose()
 
@@ -436,7 +508,7 @@ class ContentProcessor:
                     description = candidate_description.replace("\n", " ")
                     break
 
-        return text, canonical, title, description
+        return text, canonical, title, description, links.links
 
     def _extract_text_from_pdf(self, payload: bytes) -> str:
         if not self.pdf_extraction_enabled or pdfplumber is None:
@@ -469,6 +541,7 @@ class ContentProcessor:
         canonical_url: str | None = None
         page_title: str | None = None
         page_description: str | None = None
+        outlinks: List[str] = []
         payload = body
         if isinstance(payload, bytes):
             if "text" in content_type or "html" in content_type:
@@ -491,7 +564,9 @@ class ContentProcessor:
             if metrics is not None and self.pdf_extraction_enabled:
                 metrics.record_pdf_extracted()
         elif html is not None:
-            text, canonical_url, page_title, page_description = self._extract_text_from_html(html, base_url=url)
+            text, canonical_url, page_title, page_description, outlinks = self._extract_text_from_html(
+                html, base_url=url
+            )
         else:
             if isinstance(payload, bytes):
                 text = clean_text(self._decode_payload(payload, content_type))
@@ -531,6 +606,7 @@ class ContentProcessor:
             language_confidence=detection.confidence,
             checksum=checksum,
             quality=quality,
+            outlinks=outlinks,
         )
 
         if len(text) < self.min_text_length:
@@ -557,4 +633,4 @@ class ContentProcessor:
         return snapshot, content_meta
 
 
-__all__ = ["ContentProcessor", "LanguageDetectionResult", "ContentPolicyError"]
+__all__ = ["ContentProcessor", "LanguageDetectionResult", "ContentPolicyError", "extract_links"]
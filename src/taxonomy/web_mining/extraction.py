@@ -0,0 +1,210 @@
+"""Content extraction stage decoupled from the crawl fetch loop."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Tuple
+
+from taxonomy.entities.core import PageSnapshot
+from taxonomy.utils.logging import get_logger
+
+from .content import ContentPolicyError, ContentProcessor
+from .models import ContentMetadata
+from .observability import MetricsCollector
+
+
+@dataclass
+class ExtractionJob:
+    """Fetched payload awaiting content extraction."""
+
+    institution: str
+    queue_url: str
+    depth: int
+    url: str
+    http_status: int
+    content_type: str
+    body: bytes
+    fetched_at: datetime
+    rendered: bool = False
+    redirects: List[str] = field(default_factory=list)
+    submitted_at: float = field(default_factory=time.perf_counter)
+
+    def process_kwargs(self) -> Dict[str, Any]:
+        return {
+            "institution": self.institution,
+            "url": self.url,
+            "http_status": self.http_status,
+            "content_type": self.content_type,
+            "body": self.body,
+            "fetched_at": self.fetched_at,
+            "rendered": self.rendered,
+            "robots_blocked": False,
+            "redirects": list(self.redirects),
+        }
+
+
+@dataclass
+class ExtractionOutcome:
+    """Result of processing an :class:`ExtractionJob`."""
+
+    job: ExtractionJob
+    snapshot: PageSnapshot | None = None
+    content_meta: ContentMetadata | None = None
+    error_type: str | None = None
+    error_detail: str | None = None
+    extract_seconds: float = 0.0
+    wait_seconds: float = 0.0
+
+
+_ExtractionPayload = Tuple[
+    PageSnapshot | None,
+    ContentMetadata | None,
+    str | None,
+    str | None,
+    Dict[str, int],
+    float,
+]
+
+_WORKER_PROCESSOR: ContentProcessor | None = None
+
+
+def _initialize_worker(processor: ContentProcessor) -> None:
+    global _WORKER_PROCESSOR
+    _WORKER_PROCESSOR = processor
+
+
+def _extract(processor: ContentProcessor, kwargs: Dict[str, Any]) -> _ExtractionPayload:
+    local_metrics = MetricsCollector(kwargs["institution"])
+    started = time.perf_counter()
+    try:
+        snapshot, content_meta = processor.process(**kwargs, metrics=local_metrics)
+    except ContentPolicyError as exc:
+        return None, None, "content_policy", str(exc), local_metrics.counters(), time.perf_counter() - started
+    except Exception as exc:
+        return None, None, "content", str(exc), local_metrics.counters(), time.perf_counter() - started
+    return snapshot, content_meta, None, None, local_metrics.counters(), time.perf_counter() - started
+
+
+def _extract_in_worker(kwargs: Dict[str, Any]) -> _ExtractionPayload:
+    if _WORKER_PROCESSOR is None:  # pragma: no cover - initializer guarantees presence
+        raise RuntimeError("Extraction worker was not initialized")
+    return _extract(_WORKER_PROCESSOR, kwargs)
+
+
+class ExtractionStage:
+    """Runs :class:`ContentProcessor` work inline or on a bounded process pool.
+
+    With ``max_workers=0`` every submitted job is processed immediately on the
+    calling thread. Otherwise jobs are dispatched to a process pool and at most
+    ``max_pending`` payloads may be in flight; :meth:`submit` blocks on the
+    oldest job once that bound is reached so the fetcher cannot outrun parsing.
+    Outcomes are always released in submission order.
+    """
+
+    def __init__(
+        self,
+        processor: ContentProcessor,
+        *,
+        metrics: MetricsCollector,
+        max_workers: int = 0,
+        max_pending: int | None = None,
+    ) -> None:
+        self.processor = processor
+        self.metrics = metrics
+        self.max_workers = max(0, int(max_workers))
+        self.max_pending = max(1, int(max_pending or self.max_workers * 2 or 1))
+        self._pending: Deque[Tuple[ExtractionJob, Future[_ExtractionPayload]]] = deque()
+        self._executor: ProcessPoolExecutor | None = None
+        if self.max_workers > 0:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_initialize_worker,
+                initargs=(processor,),
+            )
+        self._logger = get_logger(component="content_extraction", workers=self.max_workers)
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def pending_jobs(self) -> List[ExtractionJob]:
+        return [job for job, _ in self._pending]
+
+    def submit(self, job: ExtractionJob) -> List[ExtractionOutcome]:
+        """Queue ``job`` and return any outcomes that are ready in order."""
+
+        if self._executor is None:
+            return [self._complete(job, _extract(self.processor, job.process_kwargs()))]
+
+        ready: List[ExtractionOutcome] = []
+        if len(self._pending) >= self.max_pending:
+            self.metrics.increment("extraction_backpressure")
+            while len(self._pending) >= self.max_pending:
+                ready.append(self._resolve_oldest())
+        job.submitted_at = time.perf_counter()
+        self._pending.append((job, self._executor.submit(_extract_in_worker, job.process_kwargs())))
+        ready.extend(self.poll())
+        return ready
+
+    def poll(self) -> List[ExtractionOutcome]:
+        """Return completed outcomes from the head of the queue without blocking."""
+
+        ready: List[ExtractionOutcome] = []
+        while self._pending and self._pending[0][1].done():
+            ready.append(self._resolve_oldest())
+        return ready
+
+    def wait_next(self) -> ExtractionOutcome | None:
+        """Block until the oldest in-flight job completes."""
+
+        if not self._pending:
+            return None
+        return self._resolve_oldest()
+
+    def drain(self) -> List[ExtractionOutcome]:
+        return [self._resolve_oldest() for _ in range(len(self._pending))]
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        self._pending.clear()
+
+    def __enter__(self) -> "ExtractionStage":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _resolve_oldest(self) -> ExtractionOutcome:
+        job, future = self._pending.popleft()
+        try:
+            payload = future.result()
+        except Exception as exc:  # pragma: no cover - worker crash
+            self._logger.warning("Extraction worker failed", url=job.url, error=str(exc))
+            payload = (None, None, "content", str(exc), {}, 0.0)
+        return self._complete(job, payload)
+
+    def _complete(self, job: ExtractionJob, payload: _ExtractionPayload) -> ExtractionOutcome:
+        snapshot, content_meta, error_type, error_detail, counters, extract_seconds = payload
+        for metric, amount in counters.items():
+            self.metrics.increment(metric, amount)
+        wait_seconds = max(0.0, time.perf_counter() - job.submitted_at - extract_seconds)
+        self.metrics.record_timing("extract_seconds", extract_seconds)
+        self.metrics.record_timing("extract_wait_seconds", wait_seconds)
+        return ExtractionOutcome(
+            job=job,
+            snapshot=snapshot,
+            content_meta=content_meta,
+            error_type=error_type,
+            error_detail=error_detail,
+            extract_seconds=extract_seconds,
+            wait_seconds=wait_seconds,
+        )
+
+
+__all__ = ["ExtractionJob", "ExtractionOutcome", "ExtractionStage"]
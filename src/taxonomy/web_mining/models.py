@@ -55,6 +55,7 @@ class ContentMetadata(BaseModel):
     checksum: str = Field(..., min_length=64, max_length=64)
     extracted_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     quality: QualityMetrics = Field(default_factory=QualityMetrics)
+    outlinks: List[str] = Field(default_factory=list)
 
 
 class CacheEntry(BaseModel):
@@ -93,6 +94,8 @@ class RobotsInfo(BaseModel):
     sitemaps: List[str] = Field(default_factory=list)
     disallowed: List[str] = Field(default_factory=list)
     allowed: List[str] = Field(default_factory=list)
+    disallowed_count: int = Field(default=0, ge=0)
+    allowed_count: int = Field(default=0, ge=0)
     fetched_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
@@ -136,6 +139,19 @@ class URLQueue(BaseModel):
         return tuple(self._queue)
 
 
+class CrawlFrontierState(BaseModel):
+    """Persisted crawl frontier allowing an interrupted crawl to resume."""
+
+    institution_id: str = Field(..., min_length=1)
+    queue: List[URLQueueEntry] = Field(default_factory=list)
+    visited: List[str] = Field(default_factory=list)
+    queued: List[str] = Field(default_factory=list)
+    pages_fetched: int = Field(default=0, ge=0)
+    bytes_downloaded: int = Field(default=0, ge=0)
+    depth_max_seen: int = Field(default=0, ge=0)
+    saved_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
 class CrawlConfig(BaseModel):
     """Configuration for an institutional crawl invocation."""
 
@@ -230,6 +246,7 @@ __all__ = [
     "ContentMetadata",
     "CrawlConfig",
     "CrawlError",
+    "CrawlFrontierState",
     "CrawlResult",
     "CrawlSession",
     "QualityMetrics",
@@ -57,6 +57,9 @@ class MetricsCollector:
         if robots_blocked:
             self.increment("robots_blocked")
 
+    def counters(self) -> Dict[str, int]:
+        return dict(self._counters)
+
     def record_budget(self, *, pages_fetched: int, bytes_downloaded: int, elapsed_seconds: float) -> None:
         self._counters["budget_pages_fetched"] = pages_fetched
         self._counters["budget_bytes_downloaded"] = bytes_downloaded
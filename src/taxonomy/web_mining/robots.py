@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Callable, Dict, Tuple
-from urllib.parse import urlparse, urlunparse
+from urllib.parse import quote, unquote, urlparse, urlunparse
 from urllib.robotparser import RobotFileParser
 
 import requests
@@ -15,15 +20,45 @@ from taxonomy.utils.logging import get_logger
 from .models import RobotsInfo
 
 
+_MAX_MEMOIZED_PREFIXES = 4096
+
+
 @dataclass
 class RobotsCacheEntry:
     parser: RobotFileParser
     info: RobotsInfo
     fetched_at: datetime
+    prefix_length: int = 0
+    decisions: Dict[str, bool] = field(default_factory=dict)
+
+
+def _longest_rule_length(parser: RobotFileParser) -> int:
+    entries = list(getattr(parser, "entries", []) or [])
+    default_entry = getattr(parser, "default_entry", None)
+    if default_entry is not None:
+        entries.append(default_entry)
+    lengths = [len(rule.path) for entry in entries for rule in getattr(entry, "rulelines", [])]
+    return max(lengths, default=0)
+
+
+def _robots_path(url: str) -> str:
+    """Mirror the path normalisation performed by ``RobotFileParser.can_fetch``."""
+
+    parsed = urlparse(unquote(url))
+    path = urlunparse(("", "", parsed.path, parsed.params, parsed.query, parsed.fragment))
+    return quote(path) or "/"
 
 
 class RobotsChecker:
-    """Parses robots.txt files and enforces access rules."""
+    """Parses robots.txt files and enforces access rules.
+
+    Parsed documents are memoised in memory and, when ``cache_dir`` is set,
+    persisted as small JSON records so later crawls and other processes reuse
+    them until ``cache_ttl_seconds`` elapses. ``can_fetch`` decisions are
+    memoised per path prefix: the standard parser only compares paths by
+    prefix, so the outcome depends solely on the first ``N`` characters of the
+    normalised path where ``N`` is the longest rule length.
+    """
 
     def __init__(
         self,
@@ -32,13 +67,19 @@ class RobotsChecker:
         cache_ttl_seconds: int = 3600,
         request_timeout_seconds: float = 10.0,
         fetcher: Callable[[str], Tuple[int, str]] | None = None,
+        cache_dir: Path | None = None,
+        max_logged_urls: int = 100,
     ) -> None:
         self.user_agent = user_agent
         self.cache_ttl_seconds = cache_ttl_seconds
         self.request_timeout_seconds = request_timeout_seconds
+        self.cache_dir = cache_dir
+        self.max_logged_urls = max(0, max_logged_urls)
         self._fetcher = fetcher or self._default_fetcher
         self._cache: Dict[str, RobotsCacheEntry] = {}
         self._logger = get_logger(component="robots", user_agent=user_agent)
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
 
     def _default_fetcher(self, url: str) -> Tuple[int, str]:
         headers = {"User-Agent": self.user_agent}
@@ -49,12 +90,79 @@ class RobotsChecker:
         parsed = urlparse(url)
         return urlunparse((parsed.scheme, parsed.netloc, "/robots.txt", "", "", ""))
 
+    def _is_fresh(self, fetched_at: datetime) -> bool:
+        return (datetime.now(timezone.utc) - fetched_at).total_seconds() < self.cache_ttl_seconds
+
+    def _disk_path(self, robots_url: str) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.sha256(robots_url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def _load_from_disk(self, robots_url: str) -> RobotsCacheEntry | None:
+        path = self._disk_path(robots_url)
+        if path is None or not path.exists():
+            return None
+        try:
+            record = json.loads(path.read_text(encoding="utf-8"))
+            fetched_at = datetime.fromisoformat(record["fetched_at"])
+            body = str(record.get("body", ""))
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            self._logger.debug("Ignoring unreadable robots cache record", robots_url=robots_url, error=str(exc))
+            return None
+        if not self._is_fresh(fetched_at):
+            return None
+        return self._build_entry(robots_url, body, fetched_at)
+
+    def _store_on_disk(self, robots_url: str, status_code: int, body: str, fetched_at: datetime) -> None:
+        path = self._disk_path(robots_url)
+        if path is None:
+            return
+        record = {
+            "robots_url": robots_url,
+            "status_code": status_code,
+            "body": body,
+            "fetched_at": fetched_at.isoformat(),
+        }
+        try:
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=path.parent, prefix=".robots-", suffix=".tmp", delete=False
+            ) as handle:
+                json.dump(record, handle)
+                temp_name = handle.name
+            os.replace(temp_name, path)
+        except OSError as exc:  # pragma: no cover - disk failures are non-fatal
+            self._logger.debug("Failed to persist robots cache record", robots_url=robots_url, error=str(exc))
+
+    def _build_entry(self, robots_url: str, body: str, fetched_at: datetime) -> RobotsCacheEntry:
+        parser = RobotFileParser()
+        parser.set_url(robots_url)
+        parser.parse(body.splitlines())
+        entry = RobotsCacheEntry(
+            parser=parser,
+            info=RobotsInfo(
+                robots_url=robots_url,
+                crawl_delay=parser.crawl_delay(self.user_agent),
+                sitemaps=list(parser.site_maps() or []),
+                fetched_at=fetched_at,
+            ),
+            fetched_at=fetched_at,
+            prefix_length=_longest_rule_length(parser),
+        )
+        self._cache[robots_url] = entry
+        return entry
+
     def _get_parser(self, url: str) -> RobotsCacheEntry:
         robots_url = self._robots_url(url)
         cache_entry = self._cache.get(robots_url)
-        if cache_entry and (datetime.now(timezone.utc) - cache_entry.fetched_at).total_seconds() < self.cache_ttl_seconds:
+        if cache_entry and self._is_fresh(cache_entry.fetched_at):
             return cache_entry
 
+        disk_entry = self._load_from_disk(robots_url)
+        if disk_entry is not None:
+            self._logger.debug("Loaded robots.txt from disk cache", robots_url=robots_url)
+            return disk_entry
+
         try:
             status_code, body = self._fetcher(robots_url)
         except Exception as exc:  # pragma: no cover - defensive
@@ -71,42 +179,39 @@ class RobotsChecker:
                 robots_url=robots_url,
                 status_code=status_code,
             )
+            if status_code < 500:
+                self._store_on_disk(robots_url, status_code, "", datetime.now(timezone.utc))
             return self._allow_all_entry(robots_url)
 
-        parser = RobotFileParser()
-        parser.set_url(robots_url)
-        parser.parse(body.splitlines())
-        crawl_delay = parser.crawl_delay(self.user_agent)
-        entry = RobotsCacheEntry(
-            parser=parser,
-            info=RobotsInfo(
-                robots_url=robots_url,
-                crawl_delay=crawl_delay,
-                sitemaps=list(parser.site_maps() or []),
-                fetched_at=datetime.now(timezone.utc),
-            ),
-            fetched_at=datetime.now(timezone.utc),
-        )
-        self._cache[robots_url] = entry
+        fetched_at = datetime.now(timezone.utc)
+        entry = self._build_entry(robots_url, body, fetched_at)
+        self._store_on_disk(robots_url, status_code, body, fetched_at)
         self._logger.debug("Fetched robots.txt", robots_url=robots_url, status_code=status_code)
         return entry
 
     def _allow_all_entry(self, robots_url: str) -> RobotsCacheEntry:
-        parser = RobotFileParser()
-        parser.set_url(robots_url)
-        parser.parse([])
-        entry = RobotsCacheEntry(
-            parser=parser,
-            info=RobotsInfo(
-                robots_url=robots_url,
-                crawl_delay=None,
-                sitemaps=[],
-                fetched_at=datetime.now(timezone.utc),
-            ),
-            fetched_at=datetime.now(timezone.utc),
-        )
-        self._cache[robots_url] = entry
-        return entry
+        return self._build_entry(robots_url, "", datetime.now(timezone.utc))
+
+    def _can_fetch(self, entry: RobotsCacheEntry, url: str) -> bool:
+        key = _robots_path(url)[: entry.prefix_length] if entry.prefix_length else ""
+        cached = entry.decisions.get(key)
+        if cached is not None:
+            return cached
+        allowed = entry.parser.can_fetch(self.user_agent, url)
+        if len(entry.decisions) >= _MAX_MEMOIZED_PREFIXES:
+            entry.decisions.clear()
+        entry.decisions[key] = allowed
+        return allowed
+
+    def _log_decision(self, info: RobotsInfo, url: str, allowed: bool) -> None:
+        if allowed:
+            info.allowed_count += 1
+            log = info.allowed
+        else:
+            info.disallowed_count += 1
+            log = info.disallowed
+        if len(log) < self.max_logged_urls:
+            log.append(url)
 
     def is_allowed(self, url: str) -> bool:
         try:
@@ -114,11 +219,8 @@ class RobotsChecker:
         except Exception as exc:  # pragma: no cover - defensive
             self._logger.warning("Robots fetch failed; allowing by default", error=str(exc))
             return True
-        allowed = entry.parser.can_fetch(self.user_agent, url)
-        if not allowed:
-            entry.info.disallowed.append(url)
-        else:
-            entry.info.allowed.append(url)
+        allowed = self._can_fetch(entry, url)
+        self._log_decision(entry.info, url, allowed)
         return allowed
 
     def crawl_delay(self, url: str) -> float | None:
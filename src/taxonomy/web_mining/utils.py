@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -121,6 +122,7 @@ class RateLimiter:
 
     _tokens: float = field(default=0.0, init=False)
     _last_check: float = field(default_factory=_monotonic, init=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         # Seed the bucket to allow an initial burst up to the configured size.
@@ -139,6 +141,11 @@ class RateLimiter:
         self._tokens = max(0.0, self._tokens - 1)
 
     def acquire(self) -> None:
+        # Concurrent crawls share one limiter; serialize bucket updates and waits.
+        with self._lock:
+            self._acquire_locked()
+
+    def _acquire_locked(self) -> None:
         if self.rate_per_second <= 0:
             self._tokens = float(self.burst)
             self._consume_token()
@@ -3,6 +3,7 @@ import pytest
 from taxonomy.entities.core import Concept, Provenance, SourceMeta, SourceRecord, SupportStats
 from taxonomy.utils.context_features import (
     ContextWindow,
+    SourceTokenIndex,
     analyze_institution_distribution,
     compute_context_divergence,
     compute_token_cooccurrence,
@@ -48,6 +49,33 @@ def test_extract_context_windows_captures_mentions():
     assert all(ctx.institution == "inst" for ctx in contexts)
 
 
+def test_shared_source_index_reuses_tokenization_across_concepts():
+    records = [
+        make_record("Machine Learning for vision; machine learning for speech.", "a"),
+        make_record("Deep learning and robotics research.", "b"),
+        make_record("Robotics labs", "c"),
+    ]
+    concepts = [
+        make_concept(),
+        make_concept(id="c2", canonical_label="Robotics"),
+        make_concept(id="c3", canonical_label="Deep Learning"),
+    ]
+    index = SourceTokenIndex()
+
+    for concept in concepts:
+        expected = extract_context_windows(concept, records, window_size=4)
+        assert extract_context_windows(concept, records, window_size=4, index=index) == expected
+
+    robotics = extract_context_windows(concepts[1], records, window_size=4, index=index)
+    assert [ctx.text for ctx in robotics] == [
+        "Machine Learning for vision;",
+        "learning and robotics research.",
+        "Robotics labs",
+    ]
+    assert len(index) == len(records)
+    assert list(index.offsets(records[0], "machine")) == [0, 4]
+
+
 def test_compute_token_cooccurrence_applies_frequency_threshold():
     contexts = [
         ContextWindow(
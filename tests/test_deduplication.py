@@ -194,3 +194,21 @@ def test_merge_evidence_includes_suffix_hint() -> None:
     loser_id = merge_op.losers[0]
     loser_evidence = merge_op.evidence[loser_id]
     assert loser_evidence["features"]["suffix_prefix_hint"] == pytest.approx(1.0)
+
+
+def test_deduplication_focus_limits_comparisons_to_changed_concepts():
+    policy = base_policy(min_similarity_threshold=0.7)
+    concepts = [
+        make_concept("c1", "Computer Science", institutions=5, aliases=["CS"]),
+        make_concept("c2", "Comp Sci", institutions=2, aliases=["CompSci"]),
+        make_concept("c3", "Mechanical Engineering", parents=["engineering"]),
+        make_concept("c4", "Mechanical Engineering Dept", parents=["engineering"]),
+    ]
+
+    full = DeduplicationProcessor(policy).process(concepts)
+    focused = DeduplicationProcessor(policy).process(concepts, focus={"c2"})
+
+    assert len(full.merge_ops) == 2
+    assert [op.winners for op in focused.merge_ops] == [["c1"]]
+    assert focused.stats["focus_concepts"] == 1
+    assert focused.stats["total_pairs_compared"] < full.stats["total_pairs_compared"]
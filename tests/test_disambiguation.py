@@ -1,5 +1,7 @@
 import json
 
+import pytest
+
 from taxonomy.config.policies import DisambiguationPolicy
 from taxonomy.entities.core import (
     Concept,
@@ -288,3 +290,153 @@ def test_disambiguation_processor_defers_duplicate_parent_lineage():
         assert any(
             "multi-parent" in reason.lower() for reason in rationale.reasons
         )
+
+
+def test_disambiguation_processor_copies_only_touched_concepts():
+    policy = DisambiguationPolicy(min_context_overlap_threshold=0.6)
+    disambiguator = LLMDisambiguator(
+        policy,
+        runner=lambda *_: fake_duplicate_parent_response(),
+    )
+    processor = DisambiguationProcessor(policy, disambiguator=disambiguator)
+
+    concept_a = make_concept("a", ["p1"])
+    concept_b = make_concept("b", ["p2"])
+    untouched = make_concept("c", ["p3"]).model_copy(update={"canonical_label": "Robotics"})
+    before = [concept.model_dump() for concept in (concept_a, concept_b, untouched)]
+
+    context_index = {
+        "a": [make_record("Machine Learning research initiative", "inst1")],
+        "b": [make_record("Machine Learning teaching center", "inst2")],
+    }
+    outcome = processor.process([concept_a, untouched, concept_b], context_index)
+
+    assert [concept.id for concept in outcome.concepts] == ["a", "c", "b"]
+    assert outcome.concepts[1] is untouched
+    assert outcome.concepts[0] is not concept_a
+    assert outcome.concepts[0].rationale.passed_gates["disambiguation"] is False
+    assert [concept.model_dump() for concept in (concept_a, concept_b, untouched)] == before
+
+
+def test_disambiguation_processor_checks_candidates_concurrently_in_order():
+    import random
+    import threading
+    import time
+
+    labels = [f"Topic {index}" for index in range(6)]
+    lock = threading.Lock()
+    in_flight = {"now": 0, "peak": 0}
+
+    def slow_runner(prompt_key, variables):
+        with lock:
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        time.sleep(random.uniform(0.005, 0.03))
+        with lock:
+            in_flight["now"] -= 1
+        index = int(str(variables["label"]).split()[-1])
+        return fake_llm_response() if index % 2 == 0 else fake_duplicate_parent_response()
+
+    def run(max_concurrency):
+        policy = DisambiguationPolicy(
+            min_context_overlap_threshold=0.6, llm_max_concurrency=max_concurrency
+        )
+        processor = DisambiguationProcessor(
+            policy, disambiguator=LLMDisambiguator(policy, runner=slow_runner)
+        )
+        concepts = []
+        context_index = {}
+        for index, label in enumerate(labels):
+            for suffix, parent, text in (("a", "p1", "research initiative"), ("b", "p2", "teaching center")):
+                concept = make_concept(f"{index}{suffix}", [parent]).model_copy(
+                    update={"canonical_label": label}
+                )
+                concepts.append(concept)
+                context_index[concept.id] = [make_record(f"{label} {text}", f"inst-{suffix}")]
+        outcome = processor.process(concepts, context_index)
+        return (
+            [concept.id for concept in outcome.concepts],
+            [op.source_id for op in outcome.split_ops],
+            outcome.deferred,
+            outcome.stats,
+        )
+
+    sequential = run(1)
+    assert in_flight["peak"] == 1
+    concurrent = run(4)
+
+    assert concurrent == sequential
+    assert len(sequential[1]) == 3
+    assert len(sequential[2]) == 6
+    assert 1 < in_flight["peak"] <= 4
+
+
+
+def test_disambiguation_processor_focus_examines_only_focused_label_groups():
+    from taxonomy.pipeline.disambiguation.processor import ContextAnalyzer
+
+    policy = DisambiguationPolicy(min_context_overlap_threshold=0.6)
+    analyzer = ContextAnalyzer(policy)
+    examined: list[str] = []
+    original = analyzer.obtain_contexts
+    analyzer.obtain_contexts = lambda concept, sources: examined.append(concept.id) or original(concept, sources)
+    processor = DisambiguationProcessor(
+        policy,
+        context_analyzer=analyzer,
+        disambiguator=LLMDisambiguator(policy, runner=lambda *_: fake_llm_response()),
+    )
+
+    robotics = [
+        make_concept(concept_id, [parent]).model_copy(update={"canonical_label": "Robotics"})
+        for concept_id, parent in (("r1", "p1"), ("r2", "p2"))
+    ]
+    concepts = [make_concept("a", ["p1"]), robotics[0], make_concept("b", ["p2"]), robotics[1]]
+    context_index = {
+        "a": [make_record("Machine Learning research initiative", "inst1")],
+        "b": [make_record("Machine Learning teaching center", "inst2")],
+        "r1": [make_record("Robotics research initiative", "inst1")],
+        "r2": [make_record("Robotics teaching center", "inst2")],
+    }
+
+    outcome = processor.process(concepts, context_index, focus={"a"})
+
+    assert sorted(set(examined)) == ["a", "b"]
+    assert outcome.stats["collisions_scanned"] == 1
+    assert [op.source_id in {"a", "b"} for op in outcome.split_ops] == [True]
+    by_id = {concept.id: concept for concept in outcome.concepts}
+    assert by_id["r1"] is robotics[0] and by_id["r2"] is robotics[1]
+
+def test_ambiguity_detector_bitset_scores_match_pairwise_sets():
+    import random
+    from itertools import combinations
+
+    rng = random.Random(7)
+    policy = DisambiguationPolicy()
+    detector = AmbiguityDetector(policy)
+    concepts = []
+    contexts = {}
+    for index in range(12):
+        concept = make_concept(f"c{index}", rng.sample(["p1", "p2", "p3", "p4"], rng.randint(0, 2)))
+        concept.validation_metadata["institutions"] = rng.sample(["u1", "u2", "u3"], rng.randint(1, 2))
+        concepts.append(concept)
+        words = rng.sample(["lab", "policy", "vision", "market", "robot", "ethics"], 3)
+        contexts[concept.id] = [make_context(concept.id, " ".join(words), "p1", "inst")]
+
+    def mean_jaccard(sets, empty):
+        scores = [len(a & b) / len(a | b) if a | b else empty for a, b in combinations(sets, 2)]
+        return sum(scores) / len(scores)
+
+    parent_sets = [set(concept.parents) for concept in concepts]
+    token_sets = [set(ctx[0].text.split()) for ctx in contexts.values()]
+    institution_sets = [set(concept.validation_metadata["institutions"]) for concept in concepts]
+
+    assert detector.analyze_parent_divergence(concepts) == max(0.0, min(1.0, 1.0 - mean_jaccard(parent_sets, 1.0)))
+    assert detector.compute_context_overlap(concepts, contexts) == mean_jaccard(token_sets, 1.0)
+    assert detector.check_institution_patterns(concepts) == pytest.approx(1.0 - mean_jaccard(institution_sets, 1.0))
+
+    overlap = detector.compute_context_overlap(concepts, contexts)
+    bounded = detector.compute_context_overlap(concepts, contexts, stop_above=overlap / 4)
+    assert overlap / 4 < bounded <= overlap
+    divergence = detector.analyze_parent_divergence(concepts)
+    capped = detector.analyze_parent_divergence(concepts, stop_below=1.0)
+    assert divergence <= capped < 1.0
@@ -1,4 +1,8 @@
+import json
+
+import pyarrow.parquet as pq
 import pytest
+from pyarrow import ipc
 
 from taxonomy.config.policies import HierarchyAssemblyPolicy
 from taxonomy.entities.core import Concept
@@ -8,6 +12,12 @@ from taxonomy.pipeline.hierarchy_assembly import (
     HierarchyGraph,
     InvariantChecker,
 )
+from taxonomy.pipeline.hierarchy_assembly.io import (
+    export_graph_structure,
+    graph_export_paths,
+    load_ancestry_index,
+    write_hierarchy_manifest,
+)
 
 
 def make_concept(concept_id: str, level: int, parents=None) -> Concept:
@@ -69,16 +79,18 @@ def test_assembler_attach_placeholder_creates_chain():
 
 
 def test_validator_detects_multi_parent_violation():
-    policy = HierarchyAssemblyPolicy()
+    policy = HierarchyAssemblyPolicy(allow_multi_parent_exceptions=["child"])
     assembler = HierarchyAssembler(policy)
     assembler.process_concepts(
         [
             make_concept("root", 0),
-            make_concept("child", 1, ["root"]),
+            make_concept("parent_a", 1, ["root"]),
+            make_concept("parent_b", 1, ["root"]),
+            make_concept("child", 2, ["parent_a", "parent_b"]),
         ]
     )
     graph = assembler.graph
-    graph._parents["child"].add("ghost")  # type: ignore[attr-defined]
+    policy.allow_multi_parent_exceptions = []
 
     validator = GraphValidator(InvariantChecker(policy))
     report = validator.run(graph)
@@ -97,3 +109,165 @@ def test_run_generates_manifest_structure():
     assert "policy" in manifest
     assert "graph_stats" in manifest
     assert manifest["graph_stats"]["node_count"] == 1
+
+
+def test_graph_interned_adjacency_matches_insertions():
+    policy = HierarchyAssemblyPolicy(allow_multi_parent_exceptions=["shared"])
+    graph = HierarchyGraph(policy)
+    graph.add_concept(make_concept("root", 0))
+    graph.add_concept(make_concept("b", 1, ["root"]))
+    graph.add_concept(make_concept("a", 1, ["root"]))
+    graph.add_concept(make_concept("leaf", 2, ["a"]))
+    assert graph.children_of("root") == ["a", "b"]
+    graph.add_concept(make_concept("shared", 2, ["b", "a"]))
+    graph.add_concept(make_concept("other_root", 0))
+
+    assert graph.children_of("a") == ["leaf", "shared"]
+    assert graph.parents_of("shared") == ["a", "b"]
+    assert graph.children_of("missing") == []
+    assert graph.get("leaf").canonical_label == "Concept leaf"
+    assert graph.adjacency() == {
+        "root": ["a", "b"],
+        "b": ["shared"],
+        "a": ["leaf", "shared"],
+        "leaf": [],
+        "shared": [],
+        "other_root": [],
+    }
+
+    order = graph.check_acyclicity()
+    assert sorted(order) == sorted(graph.adjacency())
+    position = {concept_id: index for index, concept_id in enumerate(order)}
+    for parent, children in graph.adjacency().items():
+        assert all(position[parent] < position[child] for child in children)
+
+    assert graph.check_unique_paths() == []
+    assert graph.find_orphans() == []
+    stats = graph.statistics()
+    assert stats["edge_count"] == 5
+    assert stats["level_counts"] == {0: 2, 1: 2, 2: 2}
+    assert stats["max_out_degree"] == 2
+    assert stats["max_in_degree"] == 2
+
+
+def test_export_graph_structure_streams_all_formats(tmp_path):
+    graph = HierarchyGraph(HierarchyAssemblyPolicy())
+    graph.add_concept(make_concept("root", 0))
+    graph.add_concept(make_concept("b", 1, ["root"]))
+    graph.add_concept(make_concept("a", 1, ["root"]))
+    graph.add_concept(make_concept("leaf", 2, ["a"]))
+    expected_edges = [("root", "a"), ("root", "b"), ("a", "leaf")]
+
+    payload = json.loads(export_graph_structure(graph, tmp_path / "g.json").read_text())
+    assert payload["nodes"] == ["root", "b", "a", "leaf"]
+    assert [(edge["parent"], edge["child"]) for edge in payload["edges"]] == expected_edges
+
+    lines = export_graph_structure(graph, tmp_path / "g.jsonl", format="jsonl").read_text().splitlines()
+    assert [tuple(json.loads(line).values()) for line in lines] == expected_edges
+
+    graphml = export_graph_structure(graph, tmp_path / "g.graphml", format="graphml").read_text()
+    assert graphml.count("<node ") == 4 and graphml.count("<edge ") == 3
+
+    dot = export_graph_structure(graph, tmp_path / "g.dot", format="dot").read_text()
+    assert '"a" -> "leaf";' in dot
+
+    export_graph_structure(graph, tmp_path / "g.parquet", format="parquet", batch_size=2)
+    node_path, edge_path = graph_export_paths(tmp_path / "g.parquet", format="parquet")
+    nodes = pq.ParquetFile(node_path)
+    assert nodes.metadata.num_row_groups == 2
+    assert nodes.read().to_pydict()["parents"] == [[], ["root"], ["root"], ["a"]]
+    edges = pq.read_table(edge_path).to_pydict()
+    assert list(zip(edges["parent"], edges["child"])) == expected_edges
+
+    export_graph_structure(graph, tmp_path / "g.arrow", format="arrow")
+    _, arrow_edges = graph_export_paths(tmp_path / "g.arrow", format="arrow")
+    table = ipc.open_file(arrow_edges).read_all().to_pydict()
+    assert table["child"] == ["a", "b", "leaf"]
+
+
+def test_ancestry_index_matches_naive_traversal(tmp_path):
+    policy = HierarchyAssemblyPolicy(allow_multi_parent_exceptions=["shared"])
+    concepts = [
+        make_concept("eng", 0),
+        make_concept("sci", 0),
+        make_concept("cs", 1, ["eng"]),
+        make_concept("ee", 1, ["eng"]),
+        make_concept("bio", 1, ["sci"]),
+        make_concept("ml", 2, ["cs"]),
+        make_concept("shared", 2, ["ee", "bio"]),
+        make_concept("cv", 3, ["ml"]),
+        make_concept("bioinformatics", 3, ["shared"]),
+    ]
+    assembler = HierarchyAssembler(policy)
+    result = assembler.run(concepts)
+    graph = result.graph
+    index = result.ancestry
+    assert index is not None
+
+    def naive_ancestors(concept_id):
+        found = set()
+        stack = list(graph.parents_of(concept_id))
+        while stack:
+            parent = stack.pop()
+            if parent not in found:
+                found.add(parent)
+                stack.extend(graph.parents_of(parent))
+        return found
+
+    ids = [concept.id for concept in concepts]
+    for descendant in ids:
+        ancestors = naive_ancestors(descendant)
+        for ancestor in ids:
+            assert index.is_ancestor(ancestor, descendant) == (ancestor in ancestors)
+        subtree = index.subtree(descendant)
+        assert sorted(subtree) == sorted(
+            [descendant] + [other for other in ids if descendant in naive_ancestors(other)]
+        )
+        assert index.subtree_size(descendant) == len(subtree)
+
+    assert index.path_to_root("cv") == ["cv", "ml", "cs", "eng"]
+    assert index.path_to_root("bioinformatics") == ["bioinformatics", "shared", "bio", "sci"]
+    start, stop = index.subtree_range("cs")
+    assert stop - start == 3
+
+    manifest_path = tmp_path / "hierarchy.json"
+    write_hierarchy_manifest(result.manifest, manifest_path)
+    restored = load_ancestry_index(manifest_path)
+    assert restored.to_dict() == index.to_dict()
+    assert restored.is_ancestor("ee", "bioinformatics")
+    assert not restored.is_ancestor("cs", "bioinformatics")
+
+
+def test_level_batches_match_sequential_insertion():
+    concepts = [
+        make_concept("root", 0),
+        make_concept("a", 1, ["root"]),
+        make_concept("b", 1, ["root"]),
+        make_concept("a", 1, ["root"]),
+        make_concept("shortcut", 2, ["root"]),
+        make_concept("lost", 2, ["missing"]),
+        make_concept("multi", 2, ["a", "b"]),
+        make_concept("x", 2, ["a", "a"]),
+        make_concept("y", 3, ["x"]),
+        make_concept("z", 3, ["y"]),
+    ]
+    policy = HierarchyAssemblyPolicy()
+    assembler = HierarchyAssembler(policy)
+    assembler.process_concepts(concepts)
+
+    reference = HierarchyGraph(policy)
+    expected_orphans = []
+    for concept in sorted(concepts, key=lambda item: (item.level, item.id)):
+        missing = [parent for parent in concept.parents if parent not in reference]
+        if missing:
+            expected_orphans.append(("quarantine", concept.id))
+            continue
+        try:
+            reference.add_concept(concept)
+        except ValueError:
+            expected_orphans.append(("error", concept.id))
+
+    assert [(item["strategy"], item["concept_id"]) for item in assembler.orphans] == expected_orphans
+    assert assembler.graph.adjacency() == reference.adjacency()
+    assert assembler.graph.statistics() == reference.statistics()
+    assert assembler.graph.parents_of("x") == ["a"]
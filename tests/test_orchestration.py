@@ -3,11 +3,19 @@ from __future__ import annotations
 from pathlib import Path
 
 import os
+import threading
 import time
 import pytest
 
-from taxonomy.config.settings import Settings
-from taxonomy.orchestration import TaxonomyOrchestrator, run_taxonomy_pipeline
+from taxonomy.config.settings import PhaseResourceBudget, Settings
+from taxonomy.orchestration import (
+    ArtifactHandle,
+    ChangeSet,
+    PhaseSpec,
+    ResourceBudgetExceeded,
+    TaxonomyOrchestrator,
+    run_taxonomy_pipeline,
+)
 from taxonomy.orchestration.checkpoints import CheckpointManager
 
 def _build_settings(tmp_path: Path) -> Settings:
@@ -224,3 +232,607 @@ def test_cleanup_checkpoints_dry_run_reports_candidates(tmp_path: Path):
     assert failures == []
     assert old_file.exists()
     assert fresh_file.exists()
+
+
+def test_scheduler_runs_independent_phases_concurrently(tmp_path: Path):
+    settings = _build_settings(tmp_path)
+    settings.orchestration.max_workers = 2
+    level_started = threading.Event()
+    events: list[str] = []
+
+    def make_level_generator(level: int):
+        def generator(context, lvl: int):
+            level_started.set()
+            events.append(f"level{lvl}")
+            return {"candidates": [f"L{lvl}"], "stats": {"level": lvl}}
+
+        return generator
+
+    def evidence_index(context):
+        assert level_started.wait(timeout=5), "extra phase did not overlap level generation"
+        events.append("evidence")
+        return {"documents": 3}
+
+    def consolidator(context):
+        events.append("consolidation")
+        assert context.get("evidence_index") == {"documents": 3}
+        return {"concepts": [], "stats": {}}
+
+    orchestrator = TaxonomyOrchestrator.from_settings(
+        settings,
+        run_id="dag-test",
+        adapters={
+            "level_generators": {level: make_level_generator(level) for level in range(4)},
+            "consolidator": consolidator,
+            "post_processors": [lambda ctx: {"stage": "validation", "changed": False}],
+            "finalizer": lambda ctx: {"stats": {}, "validation": {}},
+            "extra_phases": [
+                PhaseSpec("evidence_index", func=evidence_index, required_by=("phase2_consolidation",)),
+            ],
+        },
+    )
+
+    result = orchestrator.run()
+
+    assert events.index("evidence") < events.index("consolidation")
+    assert [event for event in events if event.startswith("level")] == [f"level{lvl}" for lvl in range(4)]
+    assert orchestrator._checkpoint_manager.checkpoint_path("evidence_index").exists()
+    schedule = result.manifest["schedule"]
+    assert schedule["max_workers"] == 2
+    assert schedule["critical_path"][-1] == "phase5_finalization"
+    assert schedule["phases"]["phase1_level1"]["depends_on"] == ["phase1_level0"]
+    finalization = schedule["phases"]["phase5_finalization"]
+    assert finalization["critical_path_seconds"] == pytest.approx(schedule["critical_path_seconds"])
+    assert finalization["critical_path_seconds"] >= finalization["elapsed_seconds"]
+
+
+
+def test_resume_after_concurrent_failure_runs_every_unfinished_phase(tmp_path: Path):
+    settings = _build_settings(tmp_path)
+    settings.orchestration.max_workers = 2
+    crawled = threading.Event()
+    executed: list[str] = []
+    fail_level = {1}
+
+    def make_level_generator(level: int):
+        def generator(context, lvl: int):
+            if lvl in fail_level:
+                assert crawled.wait(timeout=5)
+                raise RuntimeError("level generation failed")
+            executed.append(f"level{lvl}")
+            return {"candidates": [f"L{lvl}"], "stats": {}}
+
+        return generator
+
+    def web_crawl(context):
+        executed.append("web_crawl")
+        crawled.set()
+        return {"pages": 2}
+
+    def finalizer(context):
+        executed.append("finalize")
+        assert context.get("web_crawl") == {"pages": 2}
+        return {"stats": {}, "validation": {}}
+
+    def build():
+        return TaxonomyOrchestrator.from_settings(
+            settings,
+            run_id="concurrent-resume",
+            adapters={
+                "level_generators": {level: make_level_generator(level) for level in range(4)},
+                "consolidator": lambda ctx: executed.append("consolidation") or {"concepts": [], "stats": {}},
+                "post_processors": [lambda ctx: {"stage": "validation", "changed": False}],
+                "finalizer": finalizer,
+                "extra_phases": [PhaseSpec("web_crawl", func=web_crawl, required_by=("phase5_finalization",))],
+            },
+        )
+
+    with pytest.raises(RuntimeError, match="level generation failed"):
+        build().run()
+    assert build()._checkpoint_manager.checkpoint_path("web_crawl").exists()
+
+    executed.clear()
+    fail_level.clear()
+    result = build().run()
+
+    assert executed == ["level1", "level2", "level3", "consolidation", "finalize"]
+    assert "phase1_level0" not in result.phase_results
+    assert {"phase3_post_processing", "phase4_resume", "phase5_finalization"} <= set(result.phase_results)
+
+
+def test_phase_declarations_reject_unknown_inputs(tmp_path: Path):
+    settings = _build_settings(tmp_path)
+    with pytest.raises(ValueError, match="unknown input"):
+        TaxonomyOrchestrator.from_settings(
+            settings,
+            run_id="dag-invalid",
+            adapters={"extra_phases": [PhaseSpec("orphan", inputs=("missing",), func=lambda ctx: {})]},
+        )
+
+
+def _level_pipeline_inputs():
+    from taxonomy.entities.core import Provenance, SourceMeta, SourceRecord
+
+    records = [
+        SourceRecord(
+            text=f"{subject} research",
+            provenance=Provenance(institution=institution, url=f"https://{institution.lower()}.edu/{index}"),
+            meta=SourceMeta(),
+        )
+        for index, (subject, institution) in enumerate(
+            [
+                ("Robotics", "MIT"),
+                ("Robotics", "Stanford"),
+                ("Chemistry", "MIT"),
+                ("Robotics", "Berkeley"),
+                ("Physics", "Stanford"),
+                ("Physics", "MIT"),
+            ]
+        )
+    ]
+
+    def extraction_runner(prompt_key, variables):
+        subject = variables["source_text"].split()[0]
+        return [{"label": subject, "normalized": subject.lower(), "aliases": [], "parents": []}]
+
+    return records, extraction_runner
+
+
+@pytest.mark.parametrize("queue_size", [1, 64])
+def test_level_pipeline_pipelined_matches_sequential(tmp_path: Path, queue_size: int):
+    from taxonomy.pipeline.level_pipeline import LevelPipeline
+
+    settings = _build_settings(tmp_path)
+    settings.policies.level_thresholds.level_0.min_institutions = 2
+    records, extraction_runner = _level_pipeline_inputs()
+    verified_labels: list[str] = []
+
+    def verification_runner(prompt_key, variables):
+        verified_labels.append(variables["label"])
+        return {"pass": variables["label"] != "physics", "reason": "stub"}
+
+    results = {}
+    for pipelined in (False, True):
+        verified_labels.clear()
+        pipeline = LevelPipeline(
+            settings=settings,
+            batch_size=2,
+            queue_size=queue_size,
+            extraction_runner=extraction_runner,
+            verification_runner=verification_runner,
+        )
+        results[pipelined] = (pipeline.run(records, level=0, pipelined=pipelined), sorted(verified_labels))
+
+    sequential, sequential_calls = results[False]
+    pipelined_result, pipelined_calls = results[True]
+    assert pipelined_result.to_payload()["candidates"] == sequential.to_payload()["candidates"]
+    assert [c["normalized"] for c in sequential.to_payload()["candidates"]] == ["robotics"]
+    assert [d.candidate.normalized for d in pipelined_result.verification.failed] == ["physics"]
+    assert pipelined_calls == sequential_calls == ["physics", "robotics"]
+    assert pipelined_result.stats["llm_prefetched"] == 2
+    manager = CheckpointManager("level-artifact", tmp_path)
+    streamed = sequential.to_payload(write_rows=lambda rows: manager.write_artifact("level0/candidates", rows))
+    assert isinstance(streamed["candidates"], ArtifactHandle)
+    assert list(streamed["candidates"]) == sequential.to_payload()["candidates"]
+    assert sequential.stats["llm_prefetched"] == 0
+    assert pipelined_result.stats["candidates_out"] == sequential.stats["candidates_out"] == 3
+
+
+def test_level_pipeline_propagates_stage_failures(tmp_path: Path):
+    from taxonomy.pipeline.level_pipeline import LevelPipeline
+
+    settings = _build_settings(tmp_path)
+    records, _ = _level_pipeline_inputs()
+
+    def failing_runner(prompt_key, variables):
+        raise RuntimeError("extraction backend unavailable")
+
+    pipeline = LevelPipeline(settings=settings, batch_size=1, queue_size=1, extraction_runner=failing_runner)
+    with pytest.raises(RuntimeError, match="backend unavailable"):
+        pipeline.run(records, level=0, pipelined=True)
+
+
+
+@pytest.mark.parametrize("pipelined", [False, True])
+def test_level_pipeline_on_batch_can_stop_the_run(tmp_path: Path, pipelined: bool):
+    from taxonomy.pipeline.level_pipeline import LevelPipeline
+
+    settings = _build_settings(tmp_path)
+    records, extraction_runner = _level_pipeline_inputs()
+    batches: list[int] = []
+
+    def on_batch():
+        batches.append(len(batches))
+        raise ResourceBudgetExceeded("phase1_level0", [{"metric": "peak_rss_mb", "limit": 1, "value": 2}])
+
+    pipeline = LevelPipeline(settings=settings, batch_size=1, queue_size=1, extraction_runner=extraction_runner)
+    with pytest.raises(ResourceBudgetExceeded):
+        pipeline.run(records, level=0, pipelined=pipelined, on_batch=on_batch)
+    assert batches == [0]
+
+def test_phase_manager_passes_pipelined_flag_to_level_generators(tmp_path: Path):
+    settings = _build_settings(tmp_path)
+    settings.orchestration.pipelined_levels = True
+    seen: list[bool] = []
+
+    def generator(context, lvl: int, *, pipelined: bool = False):
+        seen.append(pipelined)
+        return {"candidates": [], "stats": {}}
+
+    orchestrator = TaxonomyOrchestrator.from_settings(
+        settings,
+        run_id="pipelined-levels",
+        adapters={
+            "level_generators": {level: generator for level in range(4)},
+            "consolidator": lambda ctx: {"concepts": [], "stats": {}},
+            "post_processors": [lambda ctx: {"stage": "validation", "changed": False}],
+            "finalizer": lambda ctx: {"stats": {}, "validation": {}},
+        },
+    )
+    orchestrator.run()
+
+    assert seen == [True, True, True, True]
+
+
+def test_post_processing_iterates_over_change_sets(tmp_path: Path):
+    settings = _build_settings(tmp_path)
+    scopes: list[tuple[str, object]] = []
+    merges = iter([{"merged": ["b"], "modified": ["a"]}, {}])
+
+    def dedup(context, *, change_set=None):
+        scopes.append(("dedup", None if change_set is None else sorted(change_set.ids())))
+        return {"stage": "dedup", "change_set": next(merges, {})}
+
+    def disambiguation(context, *, change_set=None):
+        scopes.append(("disambiguation", None if change_set is None else sorted(change_set.ids())))
+        if change_set is None:
+            return {"stage": "disambiguation", "change_set": ChangeSet(split=["c"])}
+        return {"stage": "disambiguation", "changed": False}
+
+    def legacy(context):
+        scopes.append(("legacy", "full"))
+        return {"stage": "legacy", "changed": False}
+
+    orchestrator = TaxonomyOrchestrator.from_settings(
+        settings,
+        run_id="delta-post-processing",
+        adapters={
+            "level_generators": {level: (lambda ctx, lvl: {"candidates": [], "stats": {}}) for level in range(4)},
+            "consolidator": lambda ctx: {"concepts": [], "stats": {}},
+            "post_processors": [dedup, disambiguation, legacy],
+            "finalizer": lambda ctx: {"stats": {}, "validation": {}},
+        },
+    )
+    payload = orchestrator._phase_manager.run_post_processing()
+
+    assert scopes == [
+        ("dedup", None),
+        ("disambiguation", None),
+        ("legacy", "full"),
+        ("dedup", ["a", "b", "c"]),
+        ("disambiguation", ["c"]),
+    ]
+    assert payload["converged"] is True
+    assert [entry["delta_size"] for entry in payload["history"]] == [3, 0]
+    assert [entry["full_pass"] for entry in payload["history"]] == [True, False]
+
+
+def test_post_processing_without_change_set_forces_full_passes(tmp_path: Path):
+    settings = _build_settings(tmp_path)
+    scopes: list[object] = []
+    outcomes = iter([True, False])
+
+    def scoped(context, *, change_set=None):
+        scopes.append(change_set)
+        return {"stage": "scoped", "changed": next(outcomes)}
+
+    orchestrator = TaxonomyOrchestrator.from_settings(
+        settings,
+        run_id="delta-unknown",
+        adapters={"post_processors": [scoped]},
+    )
+    payload = orchestrator._phase_manager.run_post_processing()
+
+    assert scopes == [None, None]
+    assert [entry["delta_size"] for entry in payload["history"]] == [None, 0]
+    assert payload["iterations"] == 2
+
+
+def test_checkpoints_share_chunks_and_load_lazily(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    manager = CheckpointManager("chunked", tmp_path, chunk_items=4)
+    concepts = [{"id": f"c{index}", "label": f"Concept {index}" * 20} for index in range(10)]
+
+    manager.save_phase_checkpoint("phase2_consolidation", {"concepts": concepts, "stats": {"concepts": 10}})
+    chunk_count = len(list(manager.chunk_directory.glob("*.z")))
+    manager.save_phase_checkpoint(
+        "phase3_post_processing",
+        {"history": [{"iteration": 1, "results": [{"concepts": concepts}]}], "iterations": 1},
+    )
+
+    assert len(list(manager.chunk_directory.glob("*.z"))) == chunk_count
+    header = manager.checkpoint_path("phase2_consolidation").read_text(encoding="utf-8")
+    assert "Concept 1" not in header
+    assert manager.recover_progress("phase3_post_processing")["history"][0]["results"][0]["concepts"] == concepts
+
+    loads: list[str] = []
+    original = CheckpointManager._load_chunk
+    monkeypatch.setattr(CheckpointManager, "_load_chunk", lambda self, digest: loads.append(digest) or original(self, digest))
+    checkpoint = manager.load_phase_checkpoint("phase2_consolidation", lazy=True)
+    assert checkpoint["phase"] == "phase2_consolidation"
+    assert checkpoint["state"]["stats"] == {"concepts": 10}
+    assert loads == []
+    assert checkpoint["state"]["concepts"] == concepts
+    assert loads
+    assert manager.determine_resume_point(["phase2_consolidation", "phase3_post_processing"]) == "phase3_post_processing"
+
+
+
+def test_chunked_lists_restore_artifact_handles(tmp_path: Path):
+    manager = CheckpointManager("chunked-artifacts", tmp_path, chunk_items=2)
+    handle = manager.write_artifact("phase/rows", [{"id": 1}, {"id": 2}])
+    items = [handle, {"rows": handle, "label": "nested"}, "plain"]
+
+    manager.save_phase_checkpoint("phase", {"items": items})
+
+    assert manager.recover_progress("phase") == {"items": items}
+    lazy = manager.load_phase_checkpoint("phase", lazy=True)["state"]["items"]
+    assert isinstance(lazy[0], ArtifactHandle)
+    assert list(lazy[1]["rows"]) == [{"id": 1}, {"id": 2}]
+
+def test_cleanup_checkpoints_removes_unreferenced_chunks(tmp_path: Path):
+    manager = CheckpointManager("chunk-gc", tmp_path, chunk_items=2)
+    manager.save_phase_checkpoint("shared", {"items": list(range(6))})
+    manager.save_phase_checkpoint("stale", {"items": list(range(6)), "extra": list(range(100, 104))})
+    os.utime(manager.checkpoint_path("stale"), (time.time() - 60, time.time() - 60))
+    before = {path.name for path in manager.chunk_directory.glob("*.z")}
+
+    removed, failures = manager.cleanup_checkpoints(keep_latest_n=1)
+
+    assert removed == [manager.checkpoint_path("stale")]
+    assert failures == []
+    remaining = {path.name for path in manager.chunk_directory.glob("*.z")}
+    assert len(before - remaining) == 2
+    assert manager.recover_progress("shared") == {"items": list(range(6))}
+
+
+def test_bulk_phase_outputs_are_offloaded_to_artifacts(tmp_path: Path):
+    settings = _build_settings(tmp_path)
+    settings.orchestration.artifact_min_rows = 3
+    seen: list[object] = []
+
+    def consolidator(context):
+        rows = [row for level in range(4) for row in context.get(f"phase1_level{level}", {}).get("candidates", [])]
+        return {"concepts": rows, "stats": {"concepts": len(rows)}}
+
+    def post_processor(context):
+        concepts = context.get("phase2_consolidation")["concepts"]
+        seen.append(concepts)
+        return {"stage": "validation", "changed": False, "concepts": concepts}
+
+    orchestrator = TaxonomyOrchestrator.from_settings(
+        settings,
+        run_id="artifact-handles",
+        adapters={
+            "level_generators": {
+                level: (lambda ctx, lvl: {"candidates": [{"id": f"L{lvl}-{i}"} for i in range(lvl + 1)], "stats": {}})
+                for level in range(4)
+            },
+            "consolidator": consolidator,
+            "post_processors": [post_processor],
+            "finalizer": lambda ctx: {"stats": {}, "validation": {}},
+        },
+    )
+    result = orchestrator.run()
+
+    level0 = result.phase_results["phase1_level0"]["candidates"]
+    level3 = result.phase_results["phase1_level3"]["candidates"]
+    assert level0 == [{"id": "L0-0"}]
+    assert isinstance(level3, ArtifactHandle)
+    assert list(level3) == [{"id": f"L3-{i}"} for i in range(4)]
+
+    concepts = result.phase_results["phase2_consolidation"]["concepts"]
+    assert isinstance(concepts, ArtifactHandle)
+    assert (len(concepts), concepts.verify()) == (10, True)
+    assert seen == [concepts]
+    recorded = {entry["path"]: entry for entry in orchestrator._checkpoint_manager.iter_artifacts()}
+    assert recorded[concepts.path]["rows"] == 10
+    assert recorded[concepts.path]["checksum"] == concepts.checksum
+
+    restored = orchestrator._checkpoint_manager.recover_progress("phase3_post_processing")
+    assert restored["history"][0]["results"][0]["concepts"] == concepts
+
+
+def test_write_artifact_rejects_unserialisable_rows(tmp_path: Path):
+    manager = CheckpointManager("artifact-errors", tmp_path)
+
+    with pytest.raises(TypeError):
+        manager.write_artifact("phase/items", [{"ok": 1}, object()])
+
+    assert [path for path in (manager.base_directory / "artifacts").rglob("*") if path.is_file()] == []
+    assert list(manager.iter_artifacts()) == []
+
+
+def _budget_adapters(seen: list[str]):
+    def level(ctx, lvl):
+        seen.append(f"phase1_level{lvl}")
+        # Allocate enough to register in the traced Python heap.
+        ballast = [bytearray(1024) for _ in range(2048)]
+        return {"candidates": [], "stats": {"records_in": len(ballast)}}
+
+    return {
+        "level_generators": {lvl: level for lvl in range(4)},
+        "consolidator": lambda ctx: {"concepts": [], "stats": {}},
+        "post_processors": [],
+        "finalizer": lambda ctx: {"stats": {}, "validation": {}},
+    }
+
+
+def test_phase_resources_are_recorded_and_budgets_warn(tmp_path: Path):
+    settings = _build_settings(tmp_path)
+    settings.orchestration.trace_allocations = True
+    settings.orchestration.phase_budgets = {"*": PhaseResourceBudget(max_python_peak_mb=0.5)}
+    orchestrator = TaxonomyOrchestrator.from_settings(settings, run_id="budget-warn", adapters=_budget_adapters([]))
+
+    result = orchestrator.run()
+
+    performance = result.manifest["performance"]
+    level0 = performance["phase1_level0"]
+    for metric in ("cpu_user_seconds", "cpu_system_seconds", "gc_pause_seconds", "gc_collections", "peak_rss_mb"):
+        assert level0[metric] is not None
+    assert level0["python_peak_mb"] > 2
+    assert level0["budget_violations"][0]["metric"] == "python_peak_mb"
+    assert "budget_violations" not in performance["phase2_consolidation"]
+
+
+def test_phase_budget_abort_stops_before_checkpoint(tmp_path: Path):
+    settings = _build_settings(tmp_path)
+    settings.orchestration.trace_allocations = True
+    settings.orchestration.phase_budgets = {
+        "phase1_level0": PhaseResourceBudget(max_python_peak_mb=0.5, on_exceed="abort"),
+    }
+    seen: list[str] = []
+    orchestrator = TaxonomyOrchestrator.from_settings(settings, run_id="budget-abort", adapters=_budget_adapters(seen))
+
+    with pytest.raises(ResourceBudgetExceeded) as excinfo:
+        orchestrator.run()
+
+    assert excinfo.value.phase == "phase1_level0"
+    assert seen == ["phase1_level0"]
+    assert not orchestrator._checkpoint_manager.checkpoint_path("phase1_level0").exists()
+
+
+
+def test_peak_rss_budget_is_enforced_while_phase_runs(tmp_path: Path):
+    settings = _build_settings(tmp_path)
+    settings.orchestration.phase_budgets = {
+        "phase1_level0": PhaseResourceBudget(max_peak_rss_mb=1, on_exceed="abort"),
+    }
+    progress: list[int] = []
+
+    def level(ctx, lvl):
+        for step in range(200):
+            ctx.check_budget(f"phase1_level{lvl}")
+            progress.append(step)
+            time.sleep(0.01)
+        return {"candidates": [], "stats": {}}
+
+    adapters = {**_budget_adapters([]), "level_generators": {lvl: level for lvl in range(4)}}
+    orchestrator = TaxonomyOrchestrator.from_settings(settings, run_id="budget-live", adapters=adapters)
+
+    with pytest.raises(ResourceBudgetExceeded) as excinfo:
+        orchestrator.run()
+
+    assert excinfo.value.violations[0]["metric"] == "peak_rss_mb"
+    assert progress == []
+    assert not orchestrator._checkpoint_manager.checkpoint_path("phase1_level0").exists()
+
+
+def test_overlapping_monitors_share_allocation_tracing():
+    import tracemalloc
+
+    from taxonomy.orchestration.resources import ResourceMonitor
+
+    assert not tracemalloc.is_tracing()
+    outer = ResourceMonitor(sample_interval_s=0, trace_allocations=True)
+    inner = ResourceMonitor(sample_interval_s=0, trace_allocations=True)
+    with outer:
+        with inner:
+            pass
+        assert tracemalloc.is_tracing()
+        ballast = [bytearray(1024) for _ in range(2048)]
+    del ballast
+
+    assert not tracemalloc.is_tracing()
+    assert outer.usage["python_peak_mb"] > 2
+    assert inner.usage["python_peak_mb"] < outer.usage["python_peak_mb"]
+
+def test_artifact_handle_is_a_read_only_sequence(tmp_path: Path):
+    manager = CheckpointManager("artifact-sequence", tmp_path)
+    rows = [{"id": index, "label": "x" * index} for index in range(6)]
+    handle = manager.write_artifact("phase/rows", iter(rows))
+
+    assert handle[0] == rows[0]
+    assert handle[-1] == rows[-1]
+    assert handle[1:5:2] == rows[1:5:2]
+    assert handle + [{"id": 6}] == [*rows, {"id": 6}]
+    assert [{"id": -1}] + handle == [{"id": -1}, *rows]
+    assert rows[3] in handle
+    with pytest.raises(IndexError):
+        handle[6]
+
+
+def test_phase_outputs_stay_in_memory_by_default(tmp_path: Path):
+    settings = _build_settings(tmp_path)
+    candidates = [{"id": index} for index in range(2000)]
+    orchestrator = TaxonomyOrchestrator.from_settings(
+        settings,
+        run_id="artifacts-off",
+        adapters={
+            "level_generators": {level: (lambda ctx, lvl: {"candidates": list(candidates), "stats": {}}) for level in range(4)},
+            "consolidator": lambda ctx: {"concepts": [], "stats": {}},
+            "post_processors": [],
+            "finalizer": lambda ctx: {"stats": {}, "validation": {}},
+        },
+    )
+
+    result = orchestrator.run()
+
+    assert settings.orchestration.artifact_min_rows == 0
+    assert result.phase_results["phase1_level0"]["candidates"] == candidates
+    assert not (orchestrator._checkpoint_manager.base_directory / "artifacts").exists()
+
+
+def test_post_processor_adapters_drive_processors_from_change_sets(tmp_path: Path):
+    from taxonomy.config.policies import DeduplicationPolicy, DeduplicationThresholds, ValidationPolicy
+    from taxonomy.entities.core import Concept, SupportStats
+    from taxonomy.orchestration import build_post_processors
+    from taxonomy.pipeline.deduplication.processor import DeduplicationProcessor
+    from taxonomy.pipeline.validation.processor import ValidationProcessor
+
+    def concept(concept_id: str, label: str, level: int, parents: list[str], institutions: int = 2) -> Concept:
+        return Concept(
+            id=concept_id,
+            level=level,
+            canonical_label=label,
+            parents=parents,
+            support=SupportStats(records=1, institutions=institutions, count=5),
+        )
+
+    concepts = [
+        concept("root", "Engineering", 0, []),
+        concept("c1", "Computer Science", 1, ["root"], institutions=5),
+        concept("c2", "Comp Sci", 1, ["root"]),
+        concept("c3", "Mechanical Engineering", 1, ["root"]),
+    ]
+    validation = ValidationProcessor(ValidationPolicy(), enable_web=False, enable_llm=False)
+    deduplication = DeduplicationProcessor(
+        DeduplicationPolicy(
+            thresholds=DeduplicationThresholds(l0_l1=0.8, l2_l3=0.75),
+            merge_policy="deterministic",
+            min_similarity_threshold=0.7,
+        )
+    )
+    validated: list[list[str]] = []
+    original = validation.process
+    validation.process = lambda items, *, focus=None: validated.append(
+        sorted(item.id for item in items if focus is None or item.id in focus)
+    ) or original(items, focus=focus)
+
+    orchestrator = TaxonomyOrchestrator.from_settings(
+        _build_settings(tmp_path),
+        run_id="post-processor-adapters",
+        adapters={
+            "level_generators": {level: (lambda ctx, lvl: {"candidates": [], "stats": {}}) for level in range(4)},
+            "consolidator": lambda ctx: {"concepts": concepts, "stats": {}},
+            "post_processors": build_post_processors(validation=validation, deduplication=deduplication),
+        },
+    )
+    result = orchestrator.run()
+
+    history = result.phase_results["phase3_post_processing"]["history"]
+    assert history[0]["results"][1]["change_set"] == {"merged": ["c1", "c2"], "modified": [], "split": []}
+    # The second pass only revisits the merge survivor; the loser is gone.
+    assert validated == [["c1", "c2", "c3", "root"], ["c1"]]
+    assert [entry["full_pass"] for entry in history] == [True, False]
+    assert result.phase_results["phase3_post_processing"]["converged"] is True
+    assert result.phase_results["phase5_finalization"]["stats"]["node_count"] == 3
@@ -9,7 +9,11 @@ from taxonomy.entities.core import Candidate, Provenance, SourceMeta, SourceReco
 from taxonomy.pipeline.s1_extraction_normalization.extractor import ExtractionProcessor
 from taxonomy.pipeline.s1_extraction_normalization.normalizer import CandidateNormalizer
 from taxonomy.pipeline.s1_extraction_normalization.parent_index import ParentIndex
-from taxonomy.pipeline.s1_extraction_normalization.processor import S1Processor
+from taxonomy.pipeline.s1_extraction_normalization.processor import (
+    AggregatedCandidate,
+    S1Processor,
+    merge_aggregated_state,
+)
 
 
 @pytest.fixture()
@@ -100,6 +104,32 @@ def test_s1_processor_end_to_end(sample_records: List[SourceRecord], label_polic
     assert "CS" in candidate.aliases
 
 
+
+def test_s1_processor_batches_merge_to_process_level_result(
+    sample_records: List[SourceRecord], label_policy: LabelPolicy
+) -> None:
+    def runner(prompt_key, variables):
+        return [{"label": variables["source_text"], "normalized": "computer science", "aliases": ["CS"]}]
+
+    def build() -> S1Processor:
+        return S1Processor(
+            extractor=ExtractionProcessor(runner=runner),
+            normalizer=CandidateNormalizer(label_policy=label_policy),
+            parent_index=ParentIndex(label_policy=label_policy),
+        )
+
+    expected = build().process_level(sample_records, level=0)
+
+    processor = build()
+    state: dict = {}
+    for record in sample_records:
+        merge_aggregated_state(state, processor.process_batch([record], level=0))
+    invalid = AggregatedCandidate(level=0, normalized="", parents=(), primary_label="")
+    assert processor.build_candidate(invalid) is None
+
+    assert processor.materialize([*state.values(), invalid]) == expected
+    assert expected[0].support.records == 2
+
 def test_candidate_allows_empty_parents_above_level_zero() -> None:
     support = SupportStats(records=1, institutions=1, count=1)
     candidate = Candidate(
@@ -162,17 +192,17 @@ def test_extract_candidates_respects_audit_limit(monkeypatch) -> None:
         def __init__(self, extractor, normalizer, parent_index):
             pass
 
-        def _aggregate(self, normalized):
-            return normalized
+        def process_batch(self, batch, *, level: int, observability=None):
+            return []
 
-        def _materialize(self, values):
+        def materialize(self, values):
             return []
 
     monkeypatch.setattr(s1_main, "ExtractionProcessor", DummyExtractor)
     monkeypatch.setattr(s1_main, "CandidateNormalizer", DummyNormalizer)
     monkeypatch.setattr(s1_main, "ParentIndex", DummyParentIndex)
     monkeypatch.setattr(s1_main, "S1Processor", DummyProcessor)
-    monkeypatch.setattr(s1_main, "_merge_aggregated_state", lambda target, items: None)
+    monkeypatch.setattr(s1_main, "merge_aggregated_state", lambda target, items: None)
 
     result = s1_main.extract_candidates(
         "dummy",
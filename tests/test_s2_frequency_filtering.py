@@ -115,6 +115,33 @@ def test_aggregator_groups_by_label_and_parents() -> None:
     assert "institutions=" in kept.rationale.reasons[0]
 
 
+def test_aggregator_reports_buckets_once_threshold_is_met() -> None:
+    resolver = InstitutionResolver(policy=InstitutionPolicy(canonical_mappings={}, campus_vs_system="prefer-campus"))
+    aggregator = CandidateAggregator(thresholds=_thresholds(), resolver=resolver)
+    settled: list[tuple[int, str]] = []
+    seen: list[int] = []
+
+    def stream():
+        for index, institution in enumerate(["MIT", "Stanford", "Berkeley"]):
+            seen.append(index)
+            candidate = _candidate(2, "Computer Vision", "computer vision", ["ai"])
+            yield CandidateEvidence(candidate=candidate, institutions={institution}, record_fingerprints={f"rec-{index}"})
+        yield CandidateEvidence(
+            candidate=_candidate(2, "Robotics", "robotics", ["ai"]),
+            institutions={"MIT"},
+            record_fingerprints={"rec-9"},
+        )
+
+    def on_settled(candidate: Candidate) -> None:
+        settled.append((len(seen), candidate.normalized))
+
+    result = aggregator.aggregate(stream(), on_settled=on_settled)
+
+    assert settled == [(2, "computer vision")]
+    assert [decision.candidate.normalized for decision in result.kept] == ["computer vision"]
+    assert result.kept[0].candidate.support.institutions == 3
+
+
 def test_aggregator_drops_when_thresholds_not_met() -> None:
     resolver = InstitutionResolver(policy=InstitutionPolicy(canonical_mappings={}, campus_vs_system="prefer-campus"))
     aggregator = CandidateAggregator(thresholds=_thresholds(), resolver=resolver)
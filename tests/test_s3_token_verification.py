@@ -134,6 +134,34 @@ def test_processor_skips_llm_when_rules_pass() -> None:
     assert result.stats["llm_called"] == 0
 
 
+def test_processor_reuses_prefetched_llm_verdict() -> None:
+    policy = _policy(prefer_rule_over_llm=False)
+    engine = TokenRuleEngine(policy=policy, minimal_form=_label_policy().minimal_canonical_form)
+    calls: list[str] = []
+
+    def _runner(prompt: str, vars: dict) -> dict:
+        calls.append(vars["label"])
+        return {"pass": True, "reason": "domain term"}
+
+    processor = S3Processor(rule_engine=engine, llm_verifier=LLMTokenVerifier(runner=_runner), policy=policy)
+
+    assert processor.prefetch("robotics", 1) is True
+    assert processor.prefetch("robotics", 1) is False
+    assert processor.prefetch("machine learning", 1) is False
+
+    evidence = VerificationInput(
+        candidate=_candidate("Robotics", "robotics", level=1),
+        rationale=Rationale(),
+        institutions=["MIT"],
+        record_fingerprints=["rec-42"],
+    )
+    result = processor.process([evidence])
+
+    assert calls == ["robotics"]
+    assert result.stats["llm_called"] == 1
+    assert result.verified[0].rationale.passed_gates["token_llm"] is True
+
+
 def test_rule_engine_flags_known_venue_alias() -> None:
     policy = _policy()
     engine = TokenRuleEngine(policy=policy, minimal_form=_label_policy().minimal_canonical_form)
@@ -204,7 +204,8 @@ def test_processor_stats_include_observability_counters() -> None:
     assert stats["web_passed"] == 1
     assert stats["web_failed"] >= 1
     assert stats["llm_passed"] == 1
-    assert stats["llm_failed"] == 2
+    # NeurIPS fails a hard rule, so it never reaches the LLM.
+    assert stats["llm_failed"] == 1
     assert stats["validation_passed"] == 1
     assert stats["passed_all"] == 1
 
@@ -297,3 +298,141 @@ def test_validate_concepts_mode_flags_web_only(tmp_path) -> None:
     assert instances
     assert instances[0].enable_web is True
     assert instances[0].enable_llm is False
+
+
+def test_processor_batch_scan_matches_sequential_lookup() -> None:
+    base_policy = ValidationPolicy()
+    snapshots = [
+        _snapshot("Applied Data Science and computer vision labs."),
+        _snapshot("Computer vision meets robotics; data science electives."),
+    ]
+    labels = ["Applied Data Science", "Computer Vision", "Robotics", "Quantum Computing"]
+
+    def _run(min_concepts: int) -> list[tuple[bool, int]]:
+        policy = base_policy.model_copy(update={
+            "web": base_policy.web.model_copy(update={"batch_scan_min_concepts": min_concepts}),
+        })
+        processor = ValidationProcessor(policy, enable_llm=False)
+        processor.prepare_evidence(snapshots)
+        outcomes = processor.process(_concept(label) for label in labels)
+        return [(outcome.decision.passed, len(outcome.evidence)) for outcome in outcomes]
+
+    assert _run(1) == _run(100)
+    assert _run(1)[:3] == [(True, 1), (True, 2), (True, 1)]
+
+
+def test_processor_runs_llm_entailment_concurrently_in_order() -> None:
+    import random
+    import threading
+    import time
+
+    from taxonomy.pipeline.validation.llm import LLMValidator
+
+    base_policy = ValidationPolicy()
+    labels = [f"Topic {index}" for index in range(12)]
+    snapshots = [_snapshot(" ".join(f"{label} research group." for label in labels))]
+    lock = threading.Lock()
+    in_flight = {"now": 0, "peak": 0}
+
+    def _slow_runner(prompt_key: str, variables: dict) -> SimpleNamespace:
+        label = variables["concept"]["label"]
+        with lock:
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        time.sleep(random.uniform(0.005, 0.03))
+        with lock:
+            in_flight["now"] -= 1
+        index = int(label.split()[-1])
+        return SimpleNamespace(
+            ok=True,
+            content={"pass": index % 3 != 0, "reason": f"checked {label}", "confidence": 0.9},
+        )
+
+    def _run(max_concurrency: int) -> tuple[list[tuple[str, bool, str]], dict]:
+        policy = base_policy.model_copy(update={
+            "llm": base_policy.llm.model_copy(update={"max_concurrency": max_concurrency}),
+        })
+        processor = ValidationProcessor(
+            policy,
+            enable_llm=True,
+            llm_validator=LLMValidator(policy, runner=_slow_runner),
+        )
+        processor.prepare_evidence(snapshots)
+        outcomes = processor.process(_concept(label) for label in labels)
+        summary = [
+            (
+                outcome.concept.canonical_label,
+                outcome.decision.passed,
+                next(f.detail for f in outcome.findings if f.mode == FindingMode.LLM),
+            )
+            for outcome in outcomes
+        ]
+        return summary, processor.stats
+
+    sequential = _run(1)
+    assert in_flight["peak"] == 1
+    concurrent = _run(4)
+
+    assert concurrent == sequential
+    assert [label for label, _, _ in concurrent[0]] == labels
+    assert concurrent[1]["llm_failed"] == 4
+    assert 1 < in_flight["peak"] <= 4
+
+
+def test_processor_focus_limits_batch_and_flags_flipped_gates() -> None:
+    base_policy = ValidationPolicy()
+    policy = base_policy.model_copy(update={
+        "llm": base_policy.llm.model_copy(update={"entailment_enabled": False}),
+    })
+    stricter = policy.model_copy(update={
+        "rules": policy.rules.model_copy(update={"forbidden_patterns": ["neurips"]}),
+    })
+    concepts = [_concept("NeurIPS"), _concept("Quantum Computing")]
+
+    first = ValidationProcessor(policy, enable_llm=False, enable_web=False).process(concepts)
+    assert [outcome.changed for outcome in first] == [False, False]
+    assert first[0].decision.passed is True
+
+    rerun = ValidationProcessor(stricter, enable_llm=False, enable_web=False).process(
+        concepts, focus={concepts[0].id}
+    )
+
+    assert [outcome.concept.id for outcome in rerun] == [concepts[0].id]
+    assert rerun[0].decision.passed is False
+    assert rerun[0].changed is True
+
+
+def test_processor_skips_llm_for_blocking_hard_rule_failures() -> None:
+    base_policy = ValidationPolicy()
+    rules = base_policy.rules.model_copy(update={"forbidden_patterns": ["neurips"]})
+    sent: list[str] = []
+
+    def _llm_stub(concept: Concept, evidence: list[object]) -> LLMResult:
+        sent.append(concept.canonical_label)
+        finding = ValidationFinding(concept_id=concept.id, mode=FindingMode.LLM, passed=True, detail="LLM ok")
+        return LLMResult(passed=True, confidence=0.9, findings=[finding], summary="LLM ok")
+
+    def _run(blocks: bool) -> tuple[list[bool], dict]:
+        policy = base_policy.model_copy(update={
+            "rules": rules,
+            "aggregation": base_policy.aggregation.model_copy(update={"hard_rule_failure_blocks": blocks}),
+        })
+        processor = ValidationProcessor(
+            policy,
+            enable_web=False,
+            enable_llm=True,
+            llm_validator=SimpleNamespace(validate_concept=_llm_stub),  # type: ignore[arg-type]
+        )
+        outcomes = processor.process([_concept("NeurIPS"), _concept("Quantum Computing")])
+        return [outcome.decision.passed for outcome in outcomes], processor.stats
+
+    sent.clear()
+    passed, stats = _run(blocks=True)
+    assert sent == ["Quantum Computing"]
+    assert passed == [False, True]
+    assert (stats["llm_passed"], stats["llm_failed"]) == (1, 0)
+
+    sent.clear()
+    _, stats = _run(blocks=False)
+    assert sent == ["NeurIPS", "Quantum Computing"]
+    assert stats["llm_passed"] == 2
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
+import pytest
+
 from taxonomy.config.policies import ValidationPolicy
 from taxonomy.entities.core import Concept, PageSnapshot
 from taxonomy.pipeline.validation.evidence import EvidenceIndexer
@@ -100,3 +102,118 @@ def test_snippet_respects_length_limit() -> None:
     snippets = indexer.extract_snippets(snap, "applied robotics", max_length=100)
     assert snippets
     assert all(len(snippet.text) <= 120 for snippet in snippets)
+
+
+def test_search_evidence_matches_phrases_on_token_boundaries() -> None:
+    policy = ValidationPolicy()
+    indexer = EvidenceIndexer(policy)
+    phrase = _snapshot("Courses in machine learning and robotics.", url="https://a.edu/1")
+    split = _snapshot("Machine shop safety; learning outcomes.", url="https://a.edu/2")
+    partial = _snapshot("Our roboticsmachine learning lab.", url="https://a.edu/3")
+    other = _snapshot("Machine learning seminar series.", url="https://b.edu/1").model_copy(
+        update={"institution": "Other College"}
+    )
+    indexer.build_index([other, phrase, split, partial])
+
+    results = indexer.search_evidence("Machine Learning")
+    assert [snap.url for snap in results] == [other.url, phrase.url]
+
+    filtered = indexer.search_evidence("machine learning", institution_filter="Example University")
+    assert [snap.url for snap in filtered] == [phrase.url]
+    assert indexer.search_evidence("machine learning", institution_filter="Unknown") == []
+    assert indexer.search_evidence("quantum") == []
+
+
+def test_scan_labels_matches_per_label_search() -> None:
+    policy = ValidationPolicy()
+    indexer = EvidenceIndexer(policy)
+    texts = [
+        "Data science and data science again; applied data science.",
+        "C++ programming and .NET services for robotics.",
+        "Robotics, robot ethics, and computer vision research.",
+        "Nothing relevant here beyond bigdata science.",
+    ]
+    indexer.build_index([_snapshot(text, url=f"https://example.edu/{i}") for i, text in enumerate(texts)])
+    labels = ["Data Science", "data science", "C++", ".NET", "robot", "Computer Vision", "quantum", "ai ai"]
+
+    scanned = indexer.scan_labels(labels)
+
+    assert set(scanned) == {label.lower() for label in labels}
+    for label in labels:
+        hits = scanned[label.lower()]
+        assert [snap.url for snap, _ in hits] == [snap.url for snap in indexer.search_evidence(label)]
+        for snap, positions in hits:
+            expected = [s.text for s in indexer.extract_snippets(snap, label)]
+            assert [s.text for s in indexer.extract_snippets(snap, label, positions=positions)] == expected
+    assert [len(positions) for _, positions in scanned["data science"]] == [3]
+
+
+def test_aggregate_evidence_top_k_matches_full_sort() -> None:
+    base_policy = ValidationPolicy()
+    policy = base_policy.model_copy(update={
+        "web": base_policy.web.model_copy(update={
+            "authoritative_domains": ["wikipedia.org"],
+            "snippet_max_length": 60,
+        }),
+        "evidence": base_policy.evidence.model_copy(update={"max_snippets_per_concept": 4}),
+    })
+    indexer = EvidenceIndexer(policy)
+    filler = "lorem ipsum " * 10
+    snapshots = [
+        _snapshot(f"robotics {filler} robotics {filler} robotics", url="https://shop.example.com/a"),
+        _snapshot(f"Example University robotics {filler} robotics", url="https://example.edu/b"),
+        _snapshot(f"{filler} robotics at wiki {filler}", url="https://en.wikipedia.org/c"),
+    ]
+    indexer.build_index(snapshots)
+
+    matches = indexer.search_evidence("Robotics")
+    expected = sorted(
+        (snippet for snap in matches for snippet in indexer.extract_snippets(snap, "Robotics")),
+        key=lambda snippet: snippet.score,
+        reverse=True,
+    )[:4]
+
+    assert indexer.aggregate_evidence("Robotics", matches) == expected
+    assert [snippet.score for snippet in expected] == pytest.approx([1.44, 1.3, 1.24, 1.09])
+
+
+def test_evidence_index_round_trips_through_disk_cache(tmp_path) -> None:
+    policy = ValidationPolicy()
+    snapshots = [
+        _snapshot("Machine learning and data science at Example University.", url="https://a.edu/1"),
+        _snapshot("Robotics labs; machine learning electives.", url="https://a.edu/2"),
+        _snapshot("Nothing to see.", url="https://b.org/3").model_copy(update={"institution": "Other"}),
+    ]
+    built = EvidenceIndexer(policy)
+    assert built.build_or_load(snapshots, tmp_path) is False
+
+    loaded = EvidenceIndexer(policy)
+    assert loaded.build_or_load(snapshots, tmp_path) is True
+
+    for label in ["machine learning", "Robotics", "example university", "quantum"]:
+        assert loaded.search_evidence(label) == built.search_evidence(label)
+        assert loaded.aggregate_evidence(label, loaded.search_evidence(label)) == built.aggregate_evidence(
+            label, built.search_evidence(label)
+        )
+    assert loaded.scan_labels(["machine learning"]) == built.scan_labels(["machine learning"])
+    assert loaded.search_evidence("robotics", institution_filter="Other") == []
+
+    changed = snapshots[:2]
+    assert EvidenceIndexer(policy).build_or_load(changed, tmp_path) is False
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_evidence_index_cache_key_tracks_raw_text(tmp_path) -> None:
+    policy = ValidationPolicy()
+    compact = [_snapshot("Robotics labs; machine learning electives.")]
+    spaced = [_snapshot("Robotics   labs;\n\nmachine learning electives.")]
+    assert compact[0].checksum == spaced[0].checksum
+
+    indexer = EvidenceIndexer(policy)
+    assert indexer.corpus_checksum(compact) != indexer.corpus_checksum(spaced)
+    assert EvidenceIndexer(policy).build_or_load(compact, tmp_path) is False
+
+    loaded = EvidenceIndexer(policy)
+    assert loaded.build_or_load(spaced, tmp_path) is False
+    [snippet] = loaded.aggregate_evidence("machine learning", loaded.search_evidence("machine learning"))
+    assert "machine learning" in snippet.text
@@ -14,7 +14,12 @@ from taxonomy.entities.core import PageSnapshot, PageSnapshotMeta
 from taxonomy.web_mining import build_web_miner
 from taxonomy.web_mining.cache import CacheManager
 from taxonomy.web_mining.client import FetchError, FetchResponse, WebMiner
-from taxonomy.web_mining.content import ContentPolicyError, ContentProcessor, LanguageDetectionResult
+from taxonomy.web_mining.content import (
+    ContentPolicyError,
+    ContentProcessor,
+    LanguageDetectionResult,
+    extract_links,
+)
 from taxonomy.web_mining.observability import MetricsCollector
 from taxonomy.web_mining.models import CrawlConfig, RobotsInfo
 from taxonomy.web_mining.robots import RobotsChecker
@@ -225,6 +230,27 @@ def test_discover_links_handles_varied_formats(
     assert not any(link.startswith("mailto:") for link in links)
 
 
+def test_content_processor_collects_outlinks_in_single_pass(content_processor: ContentProcessor) -> None:
+    html = (
+        "<html><body><p>Engineering departments and research programs.</p>"
+        "<a href='/about'>About</a>"
+        "<a href=\"/about\">About again</a>"
+        "<a href=https://example.edu/faq>FAQ</a>"
+        "<a href=\"mailto:info@example.edu\">Mail</a>"
+        "</body></html>"
+    )
+    _, content_meta = content_processor.process(
+        institution="demo",
+        url="https://example.edu/start",
+        http_status=200,
+        content_type="text/html",
+        body=html.encode("utf-8"),
+    )
+
+    assert content_meta.outlinks == ["https://example.edu/about", "https://example.edu/faq"]
+    assert content_meta.outlinks == extract_links(html, "https://example.edu/start")
+
+
 def test_crawl_institution_prioritizes_include_patterns(
     cache: CacheManager,
     content_processor: ContentProcessor,
@@ -435,6 +461,159 @@ def test_crawl_institution_seeds_from_sitemap_respecting_budget(
     miner.crawl_institution(config)
 
     assert fetched_order == [seed_url, first_url]
+def test_collect_sitemap_urls_streams_children_in_order(
+    cache: CacheManager,
+    content_processor: ContentProcessor,
+    robots_checker: RobotsChecker,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import time as time_module
+
+    miner = WebMiner(
+        cache=cache,
+        content_processor=content_processor,
+        robots_checker=robots_checker,
+        user_agent="TestBot/1.0",
+        max_concurrency=3,
+        rate_limit_per_sec=10,
+    )
+
+    def urlset(*locs: str) -> str:
+        entries = "".join(f"<url><loc>{loc}</loc></url>" for loc in locs)
+        return f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{entries}</urlset>'
+
+    index = (
+        '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        "<sitemap><loc>https://example.edu/s1.xml</loc></sitemap>"
+        "<sitemap><loc>https://example.edu/s2.xml</loc></sitemap>"
+        "<sitemap><loc>https://example.edu/s3.xml</loc></sitemap>"
+        "</sitemapindex>"
+    )
+    chunked = urlset("https://example.edu/b", "https://example.edu/c").encode("utf-8")
+    payloads = {
+        "https://example.edu/index.xml": index,
+        "https://example.edu/s1.xml": urlset(
+            "https://example.edu/a", "https://other.org/x", "https://example.edu/b"
+        ),
+        "https://example.edu/s2.xml": [chunked[:40], chunked[40:]],
+        "https://example.edu/s3.xml": urlset("https://example.edu/d", "https://example.edu/e"),
+    }
+    fetched: list[str] = []
+
+    def fake_fetch_sitemap(url: str, timeout: float):
+        fetched.append(url)
+        if url.endswith("s1.xml"):
+            time_module.sleep(0.05)
+        return payloads[url]
+
+    monkeypatch.setattr(miner, "_fetch_sitemap", fake_fetch_sitemap)
+
+    urls = miner._collect_sitemap_urls(
+        "https://example.edu/index.xml",
+        timeout=5,
+        seen=set(),
+        max_urls=4,
+        accept=lambda url: url.startswith("https://example.edu/"),
+    )
+
+    assert urls == [
+        "https://example.edu/a",
+        "https://example.edu/b",
+        "https://example.edu/c",
+        "https://example.edu/d",
+    ]
+    assert sorted(fetched) == sorted(payloads)
+
+
+def test_fetch_sitemap_streams_gzip_payload(
+    cache: CacheManager,
+    content_processor: ContentProcessor,
+    robots_checker: RobotsChecker,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import gzip
+
+    miner = WebMiner(
+        cache=cache,
+        content_processor=content_processor,
+        robots_checker=robots_checker,
+        user_agent="TestBot/1.0",
+        max_concurrency=1,
+        rate_limit_per_sec=10,
+    )
+    body = gzip.compress(
+        b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        b"<url><loc>https://example.edu/a</loc></url></urlset>"
+    )
+
+    class FakeResponse:
+        headers = {"content-type": "application/x-gzip"}
+        closed = False
+
+        def raise_for_status(self) -> None:
+            return None
+
+        def iter_content(self, chunk_size: int):
+            for offset in range(0, len(body), 7):
+                yield body[offset : offset + 7]
+
+        def close(self) -> None:
+            FakeResponse.closed = True
+
+    monkeypatch.setattr("requests.get", lambda url, **kwargs: FakeResponse())
+
+    payload = miner._fetch_sitemap("https://example.edu/sitemap.xml.gz", 5)
+    assert payload is not None
+    is_index, locations = miner._parse_sitemap(payload, "https://example.edu/sitemap.xml.gz")
+
+    assert is_index is False
+    assert locations == ["https://example.edu/a"]
+    assert FakeResponse.closed is True
+
+
+
+def test_sitemap_stream_error_keeps_urls_parsed_so_far(
+    cache: CacheManager,
+    content_processor: ContentProcessor,
+    robots_checker: RobotsChecker,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from requests.exceptions import ChunkedEncodingError
+
+    miner = WebMiner(
+        cache=cache,
+        content_processor=content_processor,
+        robots_checker=robots_checker,
+        user_agent="TestBot/1.0",
+        max_concurrency=1,
+        rate_limit_per_sec=10,
+    )
+    body = (
+        b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        b"<url><loc>https://example.edu/a</loc></url><url><loc>https://exa"
+    )
+
+    class ResettingResponse:
+        headers = {"content-type": "application/xml"}
+        closed = False
+
+        def raise_for_status(self) -> None:
+            return None
+
+        def iter_content(self, chunk_size: int):
+            yield body
+            raise ChunkedEncodingError("conn reset")
+
+        def close(self) -> None:
+            ResettingResponse.closed = True
+
+    monkeypatch.setattr("requests.get", lambda url, **kwargs: ResettingResponse())
+
+    urls = miner._collect_sitemap_urls("https://example.edu/sitemap.xml", timeout=5, seen=set())
+
+    assert urls == ["https://example.edu/a"]
+    assert ResettingResponse.closed is True
+
 def test_cache_manager_roundtrip(cache: CacheManager) -> None:
     snapshot = _snapshot("https://example.edu/page", "Hello world")
     cache.store(snapshot)
@@ -657,6 +836,47 @@ def test_robots_default_fetcher_sets_user_agent(monkeypatch: pytest.MonkeyPatch)
     assert captured.get("User-Agent") == "PolicyBot/2.0"
 
 
+def test_robots_checker_persists_rules_across_instances(tmp_path: Path) -> None:
+    fetches: list[str] = []
+
+    def fetcher(url: str) -> tuple[int, str]:
+        fetches.append(url)
+        return 200, "User-agent: *\nDisallow: /private\nCrawl-delay: 2"
+
+    first = RobotsChecker(fetcher=fetcher, cache_ttl_seconds=3600, cache_dir=tmp_path / "robots")
+    assert first.is_allowed("https://example.edu/private/a") is False
+
+    second = RobotsChecker(fetcher=fetcher, cache_ttl_seconds=3600, cache_dir=tmp_path / "robots")
+    assert second.is_allowed("https://example.edu/private/b") is False
+    assert second.is_allowed("https://example.edu/public") is True
+    assert second.crawl_delay("https://example.edu/") == pytest.approx(2.0)
+    assert fetches == ["https://example.edu/robots.txt"]
+
+    expired = RobotsChecker(fetcher=fetcher, cache_ttl_seconds=0, cache_dir=tmp_path / "robots")
+    expired.is_allowed("https://example.edu/public")
+    assert len(fetches) == 2
+
+
+def test_robots_checker_bounds_decision_log_and_memoizes_prefixes() -> None:
+    checker = RobotsChecker(
+        fetcher=lambda url: (200, "User-agent: *\nDisallow: /private"),
+        cache_ttl_seconds=3600,
+        max_logged_urls=2,
+    )
+    for index in range(5):
+        assert checker.is_allowed(f"https://example.edu/pages/item-{index}") is True
+    assert checker.is_allowed("https://example.edu/private/data") is False
+    assert checker.is_allowed("https://example.edu/privateer") is False
+
+    info = checker.info("https://example.edu/")
+    assert info.allowed_count == 5
+    assert info.disallowed_count == 2
+    assert len(info.allowed) == 2
+
+    entry = checker._get_parser("https://example.edu/")
+    assert set(entry.decisions) == {"/pages/i", "/private"}
+
+
 @pytest.mark.parametrize("status_code", [404, 500])
 def test_robots_checker_allows_on_error(status_code: int) -> None:
     checker = RobotsChecker(
@@ -890,3 +1110,244 @@ def test_crawl_delay_flag_controls_sleep(
 
     miner_two.crawl_institution(config_false)
     assert sleeps == []
+
+
+def test_web_miner_crawl_flow_with_extraction_pool(
+    cache: CacheManager,
+    content_processor: ContentProcessor,
+    robots_checker: RobotsChecker,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    miner = WebMiner(
+        cache=cache,
+        content_processor=content_processor,
+        robots_checker=robots_checker,
+        user_agent="TestBot/1.0",
+        max_concurrency=1,
+        rate_limit_per_sec=10,
+        extraction_workers=2,
+        extraction_queue_size=1,
+    )
+
+    pages = {
+        "https://example.edu/start": (
+            "<html><body><p>Welcome to the engineering school homepage.</p>"
+            '<a href="https://example.edu/a">Departments</a>'
+            '<a href="https://example.edu/b">Research centers</a></body></html>'
+        ),
+        "https://example.edu/a": "<html><body><p>The departments of the school of engineering.</p></body></html>",
+        "https://example.edu/b": "<html><body><p>Research centers and laboratories in engineering.</p></body></html>",
+    }
+
+    def fake_fetch(self, url: str, config: CrawlConfig) -> FetchResponse:  # type: ignore[override]
+        body = pages[url].encode("utf-8")
+        return FetchResponse(
+            url=url,
+            status_code=200,
+            content_type="text/html",
+            body=body,
+            rendered=False,
+            redirects=[],
+            fetched_at=datetime.now(timezone.utc),
+            bytes_downloaded=len(body),
+        )
+
+    monkeypatch.setattr(WebMiner, "_fetch_url", fake_fetch)
+
+    config = CrawlConfig(
+        institution_id="demo",
+        seed_urls=["https://example.edu/start"],
+        allowed_domains=["example.edu"],
+        disallowed_paths=[],
+        max_pages=5,
+        max_depth=2,
+        respect_robots=True,
+        respect_crawl_delay=False,
+    )
+
+    result = miner.crawl_institution(config)
+
+    assert [snapshot.url for snapshot in result.snapshots] == [
+        "https://example.edu/start",
+        "https://example.edu/a",
+        "https://example.edu/b",
+    ]
+    assert result.budget_status.pages_fetched == 3
+    assert "extract_seconds_avg" in result.metrics
+    assert "fetch_seconds_max" in result.metrics
+
+
+def test_batch_crawler_shares_budget_and_resumes_frontier(
+    tmp_path: Path,
+    content_processor: ContentProcessor,
+    robots_checker: RobotsChecker,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from taxonomy.web_mining import BatchCrawler, load_crawl_manifest
+
+    def page(body: str, *links: str) -> str:
+        anchors = "".join(f'<a href="{link}">{link}</a>' for link in links)
+        return f"<html><body><p>{body}</p>{anchors}</body></html>"
+
+    pages = {
+        "https://alpha.edu/": page("Alpha university engineering school overview.", "https://alpha.edu/a1", "https://alpha.edu/a2"),
+        "https://alpha.edu/a1": page("Alpha department of computer science and research."),
+        "https://alpha.edu/a2": page("Alpha department of electrical engineering programs."),
+        "https://beta.edu/": page("Beta college of arts and sciences overview page.", "https://beta.edu/b1"),
+        "https://beta.edu/b1": page("Beta department of history and the humanities."),
+    }
+    fetched: list[str] = []
+
+    def fake_fetch(self, url: str, config: CrawlConfig) -> FetchResponse:  # type: ignore[override]
+        fetched.append(url)
+        body = pages[url].encode("utf-8")
+        return FetchResponse(
+            url=url,
+            status_code=200,
+            content_type="text/html",
+            body=body,
+            rendered=False,
+            redirects=[],
+            fetched_at=datetime.now(timezone.utc),
+            bytes_downloaded=len(body),
+        )
+
+    monkeypatch.setattr(WebMiner, "_fetch_url", fake_fetch)
+
+    manifest = tmp_path / "manifest.yaml"
+    manifest.write_text(
+        yaml.safe_dump(
+            {
+                "defaults": {"max_pages": 10, "max_depth": 2, "respect_crawl_delay": False},
+                "institutions": [
+                    {"institution_id": "alpha", "seed_urls": ["https://alpha.edu/"], "allowed_domains": ["alpha.edu"]},
+                    {"institution_id": "beta", "seed_urls": ["https://beta.edu/"], "allowed_domains": ["beta.edu"]},
+                ],
+            }
+        )
+    )
+    configs = load_crawl_manifest(manifest)
+
+    def make_miner(cache_dir: Path) -> WebMiner:
+        return WebMiner(
+            cache=CacheManager(cache_dir, ttl_days=1),
+            content_processor=content_processor,
+            robots_checker=robots_checker,
+            user_agent="TestBot/1.0",
+            max_concurrency=1,
+            rate_limit_per_sec=0,
+        )
+
+    output_dir = tmp_path / "batch"
+    first = BatchCrawler(
+        make_miner(tmp_path / "cache_one"),
+        output_dir,
+        max_workers=1,
+        max_total_pages=2,
+        checkpoint_interval=1,
+    ).run(configs)
+
+    alpha_first, beta_first = first["institutions"]
+    assert alpha_first["status"] == "interrupted"
+    assert alpha_first["snapshots"] == 2
+    assert beta_first["status"] == "interrupted"
+    assert (output_dir / "frontier" / "alpha.json").exists()
+
+    fetched.clear()
+    second = BatchCrawler(make_miner(tmp_path / "cache_two"), output_dir, max_workers=2).run(configs)
+
+    assert [item["status"] for item in second["institutions"]] == ["completed", "completed"]
+    assert "https://alpha.edu/" not in fetched
+    assert "https://alpha.edu/a1" not in fetched
+    assert not (output_dir / "frontier" / "alpha.json").exists()
+    alpha_lines = (output_dir / "snapshots" / "alpha.jsonl").read_text().splitlines()
+    assert len(alpha_lines) == 3
+    assert second["institutions"][1]["snapshots"] == 2
+
+    third = BatchCrawler(make_miner(tmp_path / "cache_three"), output_dir).run(configs)
+    assert all(item.get("skipped") for item in third["institutions"])
+
+
+def test_frontier_checkpoint_keeps_links_of_accepted_page(
+    tmp_path: Path,
+    content_processor: ContentProcessor,
+    robots_checker: RobotsChecker,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from taxonomy.web_mining.batch import CrawlFrontier
+
+    class Crash(BaseException):
+        pass
+
+    class CrashingFrontier(CrawlFrontier):
+        """Persists the first checkpoint, then dies as if the process were killed."""
+
+        saved = False
+
+        def save(self, state) -> None:  # type: ignore[override]
+            if not self.saved:
+                super().save(state)
+                self.saved = True
+            raise Crash
+
+    pages = {
+        "https://example.edu/start": (
+            "<html><body><p>Welcome to the engineering school homepage.</p>"
+            '<a href="https://example.edu/a">Departments</a>'
+            '<a href="https://example.edu/b">Research centers</a></body></html>'
+        ),
+        "https://example.edu/a": "<html><body><p>The departments of the school of engineering.</p></body></html>",
+        "https://example.edu/b": "<html><body><p>Research centers and laboratories in engineering.</p></body></html>",
+    }
+    fetched: list[str] = []
+
+    def fake_fetch(self, url: str, config: CrawlConfig) -> FetchResponse:  # type: ignore[override]
+        fetched.append(url)
+        body = pages[url].encode("utf-8")
+        return FetchResponse(
+            url=url,
+            status_code=200,
+            content_type="text/html",
+            body=body,
+            rendered=False,
+            redirects=[],
+            fetched_at=datetime.now(timezone.utc),
+            bytes_downloaded=len(body),
+        )
+
+    monkeypatch.setattr(WebMiner, "_fetch_url", fake_fetch)
+    config = CrawlConfig(
+        institution_id="demo",
+        seed_urls=["https://example.edu/start"],
+        allowed_domains=["example.edu"],
+        disallowed_paths=[],
+        max_pages=5,
+        max_depth=2,
+        respect_robots=True,
+        respect_crawl_delay=False,
+    )
+
+    def make_miner(cache_dir: Path) -> WebMiner:
+        return WebMiner(
+            cache=CacheManager(cache_dir, ttl_days=1),
+            content_processor=content_processor,
+            robots_checker=robots_checker,
+            user_agent="TestBot/1.0",
+            max_concurrency=1,
+            rate_limit_per_sec=0,
+        )
+
+    frontier_path = tmp_path / "frontier.json"
+    with pytest.raises(Crash):
+        make_miner(tmp_path / "cache_one").crawl_institution(
+            config, frontier=CrashingFrontier(frontier_path, checkpoint_interval=1)
+        )
+    assert fetched == ["https://example.edu/start"]
+
+    fetched.clear()
+    resumed = make_miner(tmp_path / "cache_two").crawl_institution(
+        config, frontier=CrawlFrontier(frontier_path, checkpoint_interval=1)
+    )
+
+    assert fetched == ["https://example.edu/a", "https://example.edu/b"]
+    assert [snapshot.url for snapshot in resumed.snapshots] == fetched